@@ -1,8 +1,11 @@
 """API dependencies and shared state."""
 
+import asyncio
 import logging
 from typing import Optional
 
+import httpx
+
 from storage.redis_client import RedisClient
 from storage.postgres_client import PostgresClient
 
@@ -11,11 +14,21 @@ logger = logging.getLogger(__name__)
 # Shared clients (initialized on startup)
 _redis_client: Optional[RedisClient] = None
 _postgres_client: Optional[PostgresClient] = None
+_http_client: Optional[httpx.AsyncClient] = None
+_http_warmup_task: Optional[asyncio.Task] = None
+
+# Redis connections opened at startup for concurrent first requests
+REDIS_WARMUP_CONNECTIONS = 4
+
+# Host hit by the backtest SOL price lookup; warmed in the background so
+# the first request doesn't pay the TLS handshake.
+HTTP_WARMUP_URL = "https://api.coingecko.com"
+HTTP_WARMUP_TIMEOUT = 2.0
 
 
 async def init_clients():
     """Initialize shared clients."""
-    global _redis_client, _postgres_client
+    global _redis_client, _postgres_client, _http_client
 
     logger.info("Initializing API clients...")
 
@@ -25,12 +38,55 @@ async def init_clients():
     _postgres_client = PostgresClient()
     await _postgres_client.connect()
 
+    _http_client = httpx.AsyncClient(
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+    )
+
+    await _warm_pools()
+
     logger.info("API clients initialized")
 
 
+async def _warm_pools():
+    """
+    Open pooled connections up front so first requests skip the handshake.
+
+    The Postgres pool already opens its min_size connections on connect.
+    The HTTP warmup runs in the background so hosts without outbound
+    access don't hold up startup.
+    """
+    global _http_warmup_task
+
+    await asyncio.gather(
+        *(_redis_client.redis.ping() for _ in range(REDIS_WARMUP_CONNECTIONS))
+    )
+    _http_warmup_task = asyncio.create_task(_warm_http())
+
+
+async def _warm_http():
+    """Open a connection to HTTP_WARMUP_URL, ignoring failures."""
+    try:
+        await _http_client.head(HTTP_WARMUP_URL, timeout=HTTP_WARMUP_TIMEOUT)
+    except httpx.HTTPError as e:
+        logger.debug(f"HTTP warmup failed: {e}")
+
+
 async def close_clients():
     """Close shared clients."""
-    global _redis_client, _postgres_client
+    global _redis_client, _postgres_client, _http_client, _http_warmup_task
+
+    if _http_warmup_task:
+        _http_warmup_task.cancel()
+        try:
+            await _http_warmup_task
+        except asyncio.CancelledError:
+            pass
+        _http_warmup_task = None
+
+    if _http_client:
+        await _http_client.aclose()
+        _http_client = None
 
     if _redis_client:
         await _redis_client.close()
@@ -55,3 +111,10 @@ async def get_postgres() -> PostgresClient:
     if _postgres_client is None:
         raise RuntimeError("PostgreSQL client not initialized")
     return _postgres_client
+
+
+async def get_http() -> httpx.AsyncClient:
+    """Get shared HTTP client."""
+    if _http_client is None:
+        raise RuntimeError("HTTP client not initialized")
+    return _http_client
@@ -15,7 +15,7 @@ from api.models import (
     BacktestSummary,
     TriggerPerformance,
 )
-from api.deps import get_redis, get_postgres
+from api.deps import get_redis, get_postgres, get_http
 from scripts.gmgn_client import DexScreenerClient, TokenData
 
 logger = logging.getLogger(__name__)
@@ -116,14 +116,13 @@ async def compute_backtest(hours: int) -> BacktestResponse:
     # Get SOL price for USD conversion
     sol_price_usd = 200.0  # Default fallback
     try:
-        import httpx
-        async with httpx.AsyncClient(timeout=10.0) as http:
-            resp = await http.get(
-                "https://api.coingecko.com/api/v3/simple/price?ids=solana&vs_currencies=usd"
-            )
-            if resp.status_code == 200:
-                data = resp.json()
-                sol_price_usd = data.get("solana", {}).get("usd", 200.0)
+        http = await get_http()
+        resp = await http.get(
+            "https://api.coingecko.com/api/v3/simple/price?ids=solana&vs_currencies=usd"
+        )
+        if resp.status_code == 200:
+            data = resp.json()
+            sol_price_usd = data.get("solana", {}).get("usd", 200.0)
     except Exception as e:
         logger.warning(f"Failed to fetch SOL price: {e}")
 
@@ -20,23 +20,16 @@ def generate_prometheus_output() -> str:
     """
     lines = []
 
-    # Get all metrics
-    all_metrics = metrics.get_all_metrics()
+    # Read metric objects directly rather than materializing get_all_metrics()
 
     # Uptime
     lines.append("# HELP pocketwatcher_uptime_seconds Time since service start")
     lines.append("# TYPE pocketwatcher_uptime_seconds gauge")
-    lines.append(f'pocketwatcher_uptime_seconds {all_metrics["uptime_seconds"]:.3f}')
+    lines.append(f"pocketwatcher_uptime_seconds {metrics.uptime_seconds():.3f}")
     lines.append("")
 
-    # Counters
-    counters_by_name = {}
-    for counter in metrics._counters.values():
-        if counter.name not in counters_by_name:
-            counters_by_name[counter.name] = []
-        counters_by_name[counter.name].append(counter)
-
-    for name, counter_list in counters_by_name.items():
+    # Counters (already grouped by base name in the collector)
+    for name, counter_list in metrics._counters_by_name.items():
         prom_name = f"pocketwatcher_{name}"
         lines.append(f"# HELP {prom_name} Counter metric")
         lines.append(f"# TYPE {prom_name} counter")
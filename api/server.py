@@ -2,18 +2,18 @@
 
 import asyncio
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Optional
 
 import uvicorn
-from fastapi import FastAPI, Request
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi import FastAPI
+from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
-from starlette.middleware.base import BaseHTTPMiddleware
 
 from api.deps import init_clients, close_clients
 from api.routes import triggers_router, settings_router, stats_router, backtest_router, metrics_router
@@ -23,33 +23,150 @@ from config.settings import settings
 # Frontend dist directory (relative to project root)
 FRONTEND_DIST = Path(__file__).parent.parent / "web" / "dist"
 
+# Pre-serialized 401 body so the reject path does no JSON work
+_UNAUTHORIZED_BODY = b'{"detail":"Invalid or missing API token"}'
 
-class APITokenMiddleware(BaseHTTPMiddleware):
-    """Middleware to verify API token on mutating requests."""
+# Dashboard frontend origins allowed for CORS
+ALLOWED_ORIGINS = frozenset(
+    f"http://{host}:{port}".encode()
+    for host in ("localhost", "127.0.0.1")
+    for port in (3000, 3001, 3002, 3003)
+)
 
-    async def dispatch(self, request: Request, call_next):
-        # Skip authentication if no token configured
-        if not settings.api_token:
-            return await call_next(request)
+_MUTATING_METHODS = frozenset(("PUT", "POST", "DELETE"))
+
+# Precomputed response headers; only the allow-origin value varies per request
+_ALLOW_ORIGIN = b"access-control-allow-origin"
+_PREFLIGHT_HEADERS = [
+    (_ALLOW_ORIGIN, b""),
+    (b"access-control-allow-credentials", b"true"),
+    (b"access-control-allow-methods", b"GET,POST,PUT,DELETE,OPTIONS"),
+    (b"access-control-allow-headers", b"x-api-token,content-type"),
+    (b"access-control-max-age", b"600"),
+    (b"vary", b"origin"),
+]
+_DISALLOWED_ORIGIN_BODY = b"Disallowed CORS origin"
+_DISALLOWED_ORIGIN_HEADERS = [
+    (b"content-type", b"text/plain; charset=utf-8"),
+    (b"content-length", str(len(_DISALLOWED_ORIGIN_BODY)).encode()),
+    (b"vary", b"origin"),
+]
+_UNAUTHORIZED_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_UNAUTHORIZED_BODY)).encode()),
+    (b"www-authenticate", b"API-Key"),
+]
+
+
+class EdgeMiddleware:
+    """
+    Pure ASGI middleware handling CORS and API token checks in one layer.
+
+    Handling both concerns in one layer keeps the per-request cost to a
+    single extra frame.
+    """
+
+    __slots__ = ("app", "_token_bytes", "_path_prefix")
+
+    def __init__(self, app):
+        self.app = app
+        # Read once; settings field access is slower than a slot load
+        self._token_bytes = settings.api_token.encode() if settings.api_token else None
+        self._path_prefix = "/api"
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        origin = None
+        request_method = None
+        token = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"x-api-token":
+                token = value
+            elif name == b"access-control-request-method":
+                request_method = value
+
+        if origin is not None:
+            # CORS preflight
+            if method == "OPTIONS" and request_method is not None:
+                await self._preflight(send, origin)
+                return
+            if origin in ALLOWED_ORIGINS:
+                send = self._with_cors_headers(send, origin)
 
         # Only check token for mutating methods on /api routes
-        if request.method in ("PUT", "POST", "DELETE") and request.url.path.startswith("/api"):
-            token = request.headers.get("X-API-Token")
-            if token != settings.api_token:
-                return JSONResponse(
-                    status_code=401,
-                    content={"detail": "Invalid or missing API token"},
-                    headers={"WWW-Authenticate": "API-Key"},
-                )
-
-        return await call_next(request)
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    handlers=[logging.StreamHandler(sys.stdout)],
+        expected = self._token_bytes
+        if (
+            expected is not None
+            and method in _MUTATING_METHODS
+            and token != expected
+            and scope["path"].startswith(self._path_prefix)
+        ):
+            await send({
+                "type": "http.response.start",
+                "status": 401,
+                "headers": _UNAUTHORIZED_HEADERS,
+            })
+            await send({"type": "http.response.body", "body": _UNAUTHORIZED_BODY})
+            return
+
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    async def _preflight(send, origin: bytes):
+        """Answer a CORS preflight without reaching the app."""
+        if origin not in ALLOWED_ORIGINS:
+            await send({
+                "type": "http.response.start",
+                "status": 400,
+                "headers": _DISALLOWED_ORIGIN_HEADERS,
+            })
+            await send({"type": "http.response.body", "body": _DISALLOWED_ORIGIN_BODY})
+            return
+
+        await send({
+            "type": "http.response.start",
+            "status": 204,
+            "headers": [
+                (k, origin if k is _ALLOW_ORIGIN else v) for k, v in _PREFLIGHT_HEADERS
+            ],
+        })
+        await send({"type": "http.response.body", "body": b""})
+
+    @staticmethod
+    def _with_cors_headers(send, origin: bytes):
+        """Wrap send to add CORS headers to the response start message."""
+        async def cors_send(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", ()))
+                headers.append((_ALLOW_ORIGIN, origin))
+                headers.append((b"access-control-allow-credentials", b"true"))
+                headers.append((b"vary", b"origin"))
+                message["headers"] = headers
+            await send(message)
+
+        return cors_send
+
+# Configure logging - records are enqueued on the event loop and written to
+# stdout by a QueueListener thread, so a log call never blocks on write().
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler(sys.stdout)
+_log_handler.setFormatter(
+    logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
 )
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+
+_root_logger = logging.getLogger()
+_root_logger.setLevel(logging.INFO)
+_root_logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+
+# Per-request access lines are noise on the dashboard API
+logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
 
 logger = logging.getLogger("api")
 
@@ -63,11 +180,19 @@ async def lifespan(app: FastAPI):
     """Application lifespan handler."""
     global _background_task
 
+    _log_listener.start()
     logger.info("Starting Pocketwatcher Config API...")
     await init_clients()
 
-    # Start background refresh for backtest cache
-    _background_task = asyncio.create_task(start_background_refresh())
+    # Start background refresh for backtest cache. On 3.12+ the task starts
+    # eagerly so its setup runs before the first request is accepted.
+    loop = asyncio.get_running_loop()
+    if sys.version_info >= (3, 12):
+        _background_task = asyncio.Task(
+            start_background_refresh(), loop=loop, name="backtest-refresh", eager_start=True
+        )
+    else:
+        _background_task = loop.create_task(start_background_refresh(), name="backtest-refresh")
     logger.info("Background backtest refresh started")
 
     logger.info("API server ready")
@@ -75,15 +200,27 @@ async def lifespan(app: FastAPI):
 
     logger.info("Shutting down API server...")
 
+    # Each shutdown step is bounded so a stuck connection can't hang the worker
+    step_timeout = settings.api_shutdown_step_timeout
+
     # Cancel background task
     if _background_task:
         _background_task.cancel()
         try:
-            await _background_task
-        except asyncio.CancelledError:
-            pass
+            await asyncio.wait_for(
+                asyncio.gather(_background_task, return_exceptions=True),
+                timeout=step_timeout,
+            )
+        except asyncio.TimeoutError:
+            logger.error("Background refresh task did not stop in time")
+
+    try:
+        await asyncio.wait_for(close_clients(), timeout=step_timeout)
+    except asyncio.TimeoutError:
+        logger.error("close_clients timed out")
 
-    await close_clients()
+    # Flushes any queued records before returning
+    _log_listener.stop()
 
 
 app = FastAPI(
@@ -91,28 +228,11 @@ app = FastAPI(
     description="Live configuration dashboard API for Pocketwatcher",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-# API Token authentication middleware (must be added before CORS)
-app.add_middleware(APITokenMiddleware)
-
-# CORS middleware - allow dashboard frontend
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000",
-        "http://localhost:3001",
-        "http://localhost:3002",
-        "http://localhost:3003",
-        "http://127.0.0.1:3000",
-        "http://127.0.0.1:3001",
-        "http://127.0.0.1:3002",
-        "http://127.0.0.1:3003",
-    ],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# CORS + API token handling (dashboard frontend origins in ALLOWED_ORIGINS)
+app.add_middleware(EdgeMiddleware)
 
 # Include routers
 app.include_router(triggers_router, prefix="/api")
@@ -179,6 +299,8 @@ async def run_server(host: Optional[str] = None, port: Optional[int] = None):
         host=bind_host,
         port=bind_port,
         log_level="info",
+        access_log=False,
+        timeout_graceful_shutdown=settings.api_timeout_graceful_shutdown,
     )
     server = uvicorn.Server(config)
     await server.serve()
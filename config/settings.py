@@ -1,9 +1,18 @@
 """Pydantic settings for Pocketwatcher configuration."""
 
-from typing import Optional
+import logging
+import os
+from pathlib import Path
+from typing import Optional, Union
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
+logger = logging.getLogger(__name__)
+
+# Env var pointing at a pre-validated settings snapshot (see write_snapshot)
+SETTINGS_SNAPSHOT_ENV = "POCKETWATCHER_SETTINGS_SNAPSHOT"
+DEFAULT_SNAPSHOT_PATH = Path("/run/pocketwatcher/settings.json")
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -39,6 +48,18 @@ class Settings(BaseSettings):
         default=1000,
         description="Blocking read timeout in milliseconds"
     )
+    batch_workers: int = Field(
+        default=0,
+        description="Worker threads for per-tx CPU work in BatchProcessor (0 = inline)"
+    )
+    log_flush_batch_size: int = Field(
+        default=2000,
+        description="Max event/delta log records written per flush in legacy mode"
+    )
+    log_flush_interval_ms: int = Field(
+        default=50,
+        description="Max wait before flushing a partial event/delta log batch"
+    )
 
     # PostgreSQL
     postgres_url: str = Field(
@@ -59,6 +80,10 @@ class Settings(BaseSettings):
         default=300000,
         description="Daily Helius credit budget (~10M/month / 30 days)"
     )
+    helius_concurrency: int = Field(
+        default=8,
+        description="Max concurrent Helius funding traces during enrichment"
+    )
 
     # Alerting
     discord_webhook_url: Optional[str] = Field(
@@ -101,8 +126,20 @@ class Settings(BaseSettings):
         default=None,
         description="Optional API token for authentication"
     )
+    api_timeout_graceful_shutdown: int = Field(
+        default=15,
+        description="Seconds uvicorn waits for in-flight requests on shutdown"
+    )
+    api_shutdown_step_timeout: float = Field(
+        default=10.0,
+        description="Max seconds for each API shutdown step before giving up"
+    )
 
     # Backpressure thresholds
+    soft_lag_seconds: float = Field(
+        default=2.0,
+        description="Processing lag above which optional work is shed probabilistically"
+    )
     degraded_lag_seconds: int = Field(
         default=5,
         description="Processing lag threshold for DEGRADED mode"
@@ -130,9 +167,38 @@ class Settings(BaseSettings):
     model_config = {
         "env_file": ".env",
         "env_file_encoding": "utf-8",
-        "extra": "ignore"
+        "extra": "ignore",
     }
 
+    def write_snapshot(self, path: Union[str, Path] = DEFAULT_SNAPSHOT_PATH) -> Path:
+        """
+        Dump validated settings to JSON for worker processes.
+
+        Workers started with POCKETWATCHER_SETTINGS_SNAPSHOT=<path> load this
+        file instead of re-reading .env and the environment. The file holds
+        credentials, so it is written owner-readable only.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        # The open mode only applies on creation; tighten an existing file too
+        if hasattr(os, "fchmod"):
+            os.fchmod(fd, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(self.model_dump_json())
+        return path
+
+
+def _load_settings() -> Settings:
+    """Load settings from a snapshot if one is configured, else from env."""
+    snapshot = os.environ.get(SETTINGS_SNAPSHOT_ENV)
+    if snapshot:
+        try:
+            return Settings.model_validate_json(Path(snapshot).read_bytes())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring settings snapshot {snapshot}: {e}")
+    return Settings()
+
 
 # Global settings instance
-settings = Settings()
+settings = _load_settings()
@@ -1,12 +1,13 @@
 """Core application modules."""
 
-from .backpressure import BackpressureManager, DegradationMode
+from .backpressure import BackpressureManager, DegradationMode, LoadLevel
 from .monitoring import MetricsCollector
 from .processor import TransactionProcessor
 
 __all__ = [
     "BackpressureManager",
     "DegradationMode",
+    "LoadLevel",
     "MetricsCollector",
     "TransactionProcessor",
 ]
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import random
 import time
 from enum import Enum
 from typing import Optional
@@ -19,6 +20,14 @@ class DegradationMode(str, Enum):
     CRITICAL = "critical"  # Signature + mints only, pause enrichment
 
 
+class LoadLevel(str, Enum):
+    """Graded admission level; SOFT sheds optional work before DEGRADED."""
+    OK = "ok"        # Below soft lag, do everything
+    SOFT = "soft"    # Shed optional bookkeeping with rising probability
+    HARD = "hard"    # DEGRADED mode, skip swap inference
+    SHED = "shed"    # CRITICAL mode, skip inference and enrichment
+
+
 class BackpressureManager:
     """
     Manages system backpressure and degradation.
@@ -31,6 +40,24 @@ class BackpressureManager:
     Triggers degradation when thresholds exceeded.
     """
 
+    __slots__ = (
+        "redis",
+        "soft_lag",
+        "degraded_lag",
+        "critical_lag",
+        "degraded_stream_len",
+        "critical_stream_len",
+        "_current_mode",
+        "_check_interval_ns",
+        "_next_check_ns",
+        "_pending_block_time",
+        "_mode_changes",
+        "_checks",
+        "_last_block_time",
+        "_processing_lag",
+        "_stream_length",
+    )
+
     def __init__(
         self,
         redis_client: RedisClient,
@@ -38,17 +65,21 @@ class BackpressureManager:
         critical_lag_seconds: Optional[int] = None,
         degraded_stream_len: Optional[int] = None,
         critical_stream_len: Optional[int] = None,
+        soft_lag_seconds: Optional[float] = None,
     ):
         self.redis = redis_client
+        self.soft_lag = soft_lag_seconds or settings.soft_lag_seconds
         self.degraded_lag = degraded_lag_seconds or settings.degraded_lag_seconds
         self.critical_lag = critical_lag_seconds or settings.critical_lag_seconds
         self.degraded_stream_len = degraded_stream_len or settings.degraded_stream_len
         self.critical_stream_len = critical_stream_len or settings.critical_stream_len
 
         self._current_mode = DegradationMode.NORMAL
-        self._last_check = 0
-        self._check_interval = 1.0  # Check every second
+        self._check_interval_ns = 1_000_000_000  # Check every second
+        self._next_check_ns = 0  # monotonic_ns deadline for the next check
+        self._pending_block_time: Optional[int] = None  # newest block_time since last check
         self._mode_changes = 0
+        self._checks = 0  # completed (unthrottled) checks
 
         # Tracking
         self._last_block_time = 0
@@ -60,6 +91,21 @@ class BackpressureManager:
         """Get current degradation mode."""
         return self._current_mode
 
+    @property
+    def checks(self) -> int:
+        """Number of completed checks; changes only when lag/stream are refreshed."""
+        return self._checks
+
+    @property
+    def processing_lag(self) -> float:
+        """Processing lag in seconds as of the last check."""
+        return self._processing_lag
+
+    @property
+    def stream_length(self) -> int:
+        """Stream length as of the last check."""
+        return self._stream_length
+
     def is_normal(self) -> bool:
         """Check if in normal mode."""
         return self._current_mode == DegradationMode.NORMAL
@@ -84,18 +130,24 @@ class BackpressureManager:
         Returns:
             Current degradation mode
         """
-        now = time.time()
-
-        # Don't check too frequently
-        if now - self._last_check < self._check_interval:
+        # Don't check too frequently; between checks just remember the
+        # newest block_time so the next check measures lag from it
+        now_ns = time.monotonic_ns()
+        if now_ns < self._next_check_ns:
+            if block_time:
+                self._pending_block_time = block_time
             return self._current_mode
 
-        self._last_check = now
+        self._next_check_ns = now_ns + self._check_interval_ns
+
+        if not block_time:
+            block_time = self._pending_block_time
+        self._pending_block_time = None
 
-        # Calculate processing lag
+        # Calculate processing lag (block_time is wall-clock)
         if block_time:
             self._last_block_time = block_time
-            self._processing_lag = now - block_time
+            self._processing_lag = time.time() - block_time
 
         # Get stream length
         try:
@@ -103,6 +155,8 @@ class BackpressureManager:
         except Exception as e:
             logger.error(f"Failed to get stream length: {e}")
 
+        self._checks += 1
+
         # Determine mode
         new_mode = self._calculate_mode()
 
@@ -132,6 +186,34 @@ class BackpressureManager:
 
         return DegradationMode.NORMAL
 
+    def level(self) -> LoadLevel:
+        """Get the graded load level (SOFT comes from lag below DEGRADED)."""
+        mode = self._current_mode
+        if mode == DegradationMode.CRITICAL:
+            return LoadLevel.SHED
+        if mode == DegradationMode.DEGRADED:
+            return LoadLevel.HARD
+        if self._processing_lag > self.soft_lag:
+            return LoadLevel.SOFT
+        return LoadLevel.OK
+
+    def should_shed_optional(self) -> bool:
+        """
+        Decide whether to skip optional per-tx work.
+
+        Always in DEGRADED/CRITICAL; in SOFT, with probability rising
+        linearly from 0 at soft_lag to 1 at degraded_lag.
+        """
+        if self._current_mode != DegradationMode.NORMAL:
+            return True
+        lag = self._processing_lag
+        if lag <= self.soft_lag:
+            return False
+        span = self.degraded_lag - self.soft_lag
+        if span <= 0:
+            return True
+        return random.random() < (lag - self.soft_lag) / span
+
     def should_store_swap_event(self) -> bool:
         """Check if we should store full swap events."""
         return self._current_mode == DegradationMode.NORMAL
@@ -148,10 +230,12 @@ class BackpressureManager:
         """Get backpressure statistics."""
         return {
             "mode": self._current_mode.value,
+            "level": self.level().value,
             "processing_lag_seconds": self._processing_lag,
             "stream_length": self._stream_length,
             "mode_changes": self._mode_changes,
             "thresholds": {
+                "soft_lag": self.soft_lag,
                 "degraded_lag": self.degraded_lag,
                 "critical_lag": self.critical_lag,
                 "degraded_stream_len": self.degraded_stream_len,
@@ -168,6 +252,14 @@ class CircuitBreaker:
     to failing services.
     """
 
+    __slots__ = (
+        "failure_threshold",
+        "recovery_timeout",
+        "_failures",
+        "_reopen_at",
+        "_is_open",
+    )
+
     def __init__(
         self,
         failure_threshold: int = 5,
@@ -177,7 +269,7 @@ class CircuitBreaker:
         self.recovery_timeout = recovery_timeout
 
         self._failures = 0
-        self._last_failure = 0.0
+        self._reopen_at = 0.0  # monotonic time the open circuit may close
         self._is_open = False
 
     def is_open(self) -> bool:
@@ -186,7 +278,7 @@ class CircuitBreaker:
             return False
 
         # Check if recovery timeout has passed
-        if time.time() - self._last_failure > self.recovery_timeout:
+        if time.monotonic() >= self._reopen_at:
             self._is_open = False
             self._failures = 0
             logger.info("Circuit breaker reset")
@@ -201,7 +293,7 @@ class CircuitBreaker:
     def record_failure(self):
         """Record a failed call."""
         self._failures += 1
-        self._last_failure = time.time()
+        self._reopen_at = time.monotonic() + self.recovery_timeout
 
         if self._failures >= self.failure_threshold:
             self._is_open = True
@@ -4,19 +4,26 @@ Batch transaction processor for high-throughput processing.
 Works with BatchConsumer to process transactions with minimal Redis RTTs.
 """
 
+import asyncio
 import logging
 import time
-from typing import Any, Dict, List, Optional, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from models.events import MintTouchedEvent, SwapEventFull, TxDeltaRecord
-from models.profiles import TokenState
-from parser.deltas import DeltaBuilder, WSOL_MINT
+from parser.deltas import DeltaBuilder, QUOTE_SOL_SCALE
 from parser.inference import SwapInference
 from storage.swap_queue import SwapEventQueue
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+_now = time.time
+
+# (mint_event, delta_record, (swap, signature, slot, block_time, venue) | None)
+ProcessResult = Tuple[Optional[MintTouchedEvent], Optional[TxDeltaRecord], Optional[tuple]]
+TxProcessor = Callable[[Dict[str, Any], int], ProcessResult]
+
 
 class BatchProcessor:
     """
@@ -34,18 +41,24 @@ class BatchProcessor:
         metrics=None,
         known_programs: Optional[Set[str]] = None,
         counter_manager=None,
+        workers: Optional[int] = None,
     ):
         # Storage (local writes only)
         self.delta_log = delta_log
         self.event_log = event_log
         self.swap_queue = swap_queue
 
-        # Metrics
+        # Metrics (hot counters resolved once, incremented directly)
         self.metrics = metrics
+        self._ctr_tx = metrics.bind_counter("tx_processed_total") if metrics else None
 
         # Counter manager for tracking active mints (for detection loop)
         self.counter_manager = counter_manager
 
+        # Hot-loop constants resolved once
+        self._min_conf = settings.min_swap_confidence
+        self._quote_scale = QUOTE_SOL_SCALE
+
         # Known programs for unknown program discovery
         self.known_programs = known_programs or set()
 
@@ -58,13 +71,26 @@ class BatchProcessor:
         self._swap_count = 0
         self._hot_swap_count = 0
 
-        # Local state cache (token -> state)
-        self._state_cache: Dict[str, TokenState] = {}
+        # Mints seen swapping locally (only ever marked WARM, so a set suffices)
+        self._warm_mints: Set[str] = set()
 
         # Last batch sizes (for stats only)
         self._last_pending_delta_count = 0
         self._last_pending_event_count = 0
 
+        # Optional worker pool for per-tx CPU work (0 = run inline)
+        self._workers = settings.batch_workers if workers is None else workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        if self._workers > 0:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._workers,
+                thread_name_prefix="batch-worker",
+            )
+
+        # Per-tx processors specialized once per logging mode
+        self._process_logged = self._make_process_single(record_logs=True)
+        self._process_unlogged = self._make_process_single(record_logs=False)
+
     async def process_batch(
         self,
         transactions: List[Dict[str, Any]],
@@ -73,129 +99,257 @@ class BatchProcessor:
         """
         Process a batch of transactions.
 
-        All heavy work is pure Python (no I/O).
+        All heavy work is pure Python (no I/O) and may run on the worker
+        pool; results are applied in order on the event loop.
         Counter updates are queued to ctx for batched Redis execution.
         """
-        start_time = time.time()
-
-        pending_delta_records: List[TxDeltaRecord] = []
-        pending_mint_events: List[MintTouchedEvent] = []
+        start_time = time.perf_counter()
+        default_block_time = int(_now())  # For txs missing block_time
 
         stream_len = getattr(ctx, "stream_length", 0) or 0
         record_logs = stream_len < settings.critical_stream_len
 
-        for tx_data in transactions:
-            await self._process_single(
-                tx_data,
-                ctx,
-                pending_delta_records,
-                pending_mint_events,
-                record_logs,
-            )
+        # Every tx yields one record of each kind when logging, so size the
+        # lists up front and fill by index
+        n = len(transactions)
+        pending_delta_records: List[TxDeltaRecord] = [None] * n if record_logs else []
+        pending_mint_events: List[MintTouchedEvent] = [None] * n if record_logs else []
 
-        # Batch write delta records and mint events (local I/O, not Redis)
-        if self.delta_log and pending_delta_records:
-            await self.delta_log.append_batch(pending_delta_records)
+        # Metric deltas accumulated per batch, applied once after the loop
+        tx_count = 0
+        swap_counts: Dict[Tuple[str, str], int] = {}
+        batch_mints: Set[str] = set()
+        hot_events: List[SwapEventFull] = []
+
+        if self._executor is not None and len(transactions) > 1:
+            results = await self._process_parallel(record_logs, transactions, default_block_time)
+        else:
+            process = self._process_logged if record_logs else self._process_unlogged
+            results = [process(tx_data, default_block_time) for tx_data in transactions]
+
+        for i, (mint_event, delta_record, detected) in enumerate(results):
+            tx_count += 1
+            if mint_event is not None:
+                pending_mint_events[i] = mint_event
+                pending_delta_records[i] = delta_record
+
+            if detected is not None:
+                swap, signature, slot, block_time, venue = detected
+                self._swap_count += 1
+                side_str = swap.side.value
+                key = (side_str, venue)
+                swap_counts[key] = swap_counts.get(key, 0) + 1
+
+                # Process the detected swap (ctx writes stay on the loop thread)
+                self._process_swap(
+                    mint=swap.base_mint,
+                    swap=swap,
+                    signature=signature,
+                    slot=slot,
+                    block_time=block_time,
+                    venue=venue,
+                    side_str=side_str,
+                    ctx=ctx,
+                    batch_mints=batch_mints,
+                    hot_events=hot_events,
+                )
+
+        self._processed_count += tx_count
+
+        # Queue HOT swap events once per batch (non-blocking DB write)
+        if hot_events and self.swap_queue:
+            await self.swap_queue.put_many(hot_events)
+
+        # Register swapped mints once per batch (the ctx flush marks them
+        # active in Redis alongside the counter writes)
+        if batch_mints:
+            self._warm_mints |= batch_mints
 
+        if self.metrics:
+            self._ctr_tx.inc(tx_count)
+            for (side, venue), count in swap_counts.items():
+                self.metrics.record_swap_detected(side, venue, count)
+
+        # Batch write delta records and mint events concurrently (local I/O, not Redis)
+        writes = []
+        if self.delta_log and pending_delta_records:
+            writes.append(self.delta_log.append_batch(pending_delta_records))
         if self.event_log and pending_mint_events:
-            await self.event_log.append_batch(pending_mint_events)
+            writes.append(self.event_log.append_batch(pending_mint_events))
+        if writes:
+            await asyncio.gather(*writes)
 
         self._last_pending_delta_count = len(pending_delta_records)
         self._last_pending_event_count = len(pending_mint_events)
 
         # Record batch processing time
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         if self.metrics:
             self.metrics.record_batch_time(elapsed, len(transactions))
 
-    async def _process_single(
+    async def _process_parallel(
         self,
-        tx_data: Dict[str, Any],
-        ctx,  # BatchContext
-        pending_delta_records: List[TxDeltaRecord],
-        pending_mint_events: List[MintTouchedEvent],
         record_logs: bool,
-    ):
-        """Process a single transaction within a batch."""
-        self._processed_count += 1
-
-        # Extract basic info
-        signature = tx_data.get("signature", "")
-        slot = tx_data.get("slot", 0)
-        block_time = tx_data.get("block_time", int(time.time()))
-        fee_payer = tx_data.get("fee_payer", "")
-
-        if not fee_payer:
-            account_keys = tx_data.get("account_keys", [])
-            fee_payer = account_keys[0] if account_keys else ""
+        transactions: List[Dict[str, Any]],
+        default_block_time: int,
+    ) -> List[ProcessResult]:
+        """
+        Process contiguous chunks on the worker pool.
 
-        # Build deltas (pure Python)
-        token_deltas, sol_deltas = self.delta_builder.build_deltas(tx_data)
+        Parser stats counted by each chunk are merged into the shared
+        parsers here, on the loop thread.
+        """
+        loop = asyncio.get_running_loop()
+        size = -(-len(transactions) // self._workers)  # ceil division
+        futures = [
+            loop.run_in_executor(
+                self._executor,
+                self._process_chunk,
+                record_logs,
+                transactions[i:i + size],
+                default_block_time,
+            )
+            for i in range(0, len(transactions), size)
+        ]
+        results: List[ProcessResult] = []
+        for chunk_results, delta_builder, inference in await asyncio.gather(*futures):
+            results.extend(chunk_results)
+            self.delta_builder.merge_stats(delta_builder)
+            self.inference.merge_stats(inference)
+        return results
+
+    def _process_chunk(
+        self,
+        record_logs: bool,
+        transactions: List[Dict[str, Any]],
+        default_block_time: int,
+    ) -> Tuple[List[ProcessResult], DeltaBuilder, SwapInference]:
+        """
+        Process a chunk of transactions (runs on a worker thread).
 
-        programs_invoked = None
+        Uses chunk-local parsers so no two threads update the same stats
+        counters; they are returned for merging.
+        """
+        delta_builder = DeltaBuilder()
+        inference = SwapInference(delta_builder)
+        process = self._make_process_single(record_logs, delta_builder, inference)
+        results = [process(tx_data, default_block_time) for tx_data in transactions]
+        return results, delta_builder, inference
 
-        if record_logs:
-            # Extract metadata (pure Python)
-            programs_invoked = self.delta_builder.extract_program_ids(tx_data)
-            mints_touched = self.delta_builder.extract_mints_touched(token_deltas)
+    def _process_single(
+        self,
+        tx_data: Dict[str, Any],
+        record_logs: bool,
+        default_block_time: int,
+    ) -> ProcessResult:
+        """
+        Process a single transaction within a batch (pure CPU, no I/O).
 
-            # Create MintTouchedEvent (accumulate for batch write)
-            mint_event = MintTouchedEvent(
-                signature=signature,
-                slot=slot,
-                block_time=block_time,
-                fee_payer=fee_payer,
-                mints_touched=mints_touched,
-                programs_invoked=programs_invoked,
-            )
-            pending_mint_events.append(mint_event)
+        Returns:
+            Tuple of (mint_event, delta_record, detected) where the records
+            are None when logging is skipped and detected is
+            (swap, signature, slot, block_time, venue) for a confident swap.
+        """
+        process = self._process_logged if record_logs else self._process_unlogged
+        return process(tx_data, default_block_time)
 
-            # Create TxDeltaRecord (accumulate for batch write)
-            delta_record = TxDeltaRecord(
-                signature=signature,
-                slot=slot,
-                block_time=block_time,
-                fee_payer=fee_payer,
-                programs_invoked=programs_invoked,
-                token_deltas=[(o, m, amt) for (o, m), amt in token_deltas.items()],
-                sol_deltas=sol_deltas,
-                mints_touched=mints_touched,
-                tx_fee=tx_data.get("fee", 0),
-            )
-            pending_delta_records.append(delta_record)
+    def _make_process_single(
+        self,
+        record_logs: bool,
+        delta_builder: Optional[DeltaBuilder] = None,
+        inference: Optional[SwapInference] = None,
+    ) -> TxProcessor:
+        """
+        Build a _process_single variant specialized for one logging mode.
 
-        # Update metrics
-        if self.metrics:
-            self.metrics.inc("tx_processed_total")
-
-        # Fast path: no token deltas means no swap
-        if not token_deltas:
-            return
-
-        # Swap inference (pure Python)
-        if programs_invoked is None:
-            programs_invoked = self.delta_builder.extract_program_ids(tx_data)
-        candidates = self.delta_builder.get_candidate_users(token_deltas, fee_payer)
-        swap = self.inference.infer_swap(token_deltas, sol_deltas, candidates)
-        venue = self.inference.identify_venue(programs_invoked)
-
-        if swap and swap.confidence >= settings.min_swap_confidence:
-            self._swap_count += 1
-            if self.metrics:
-                self.metrics.record_swap_detected(swap.side.value, venue)
-
-            # Process the detected swap
-            await self._process_swap(
-                mint=swap.base_mint,
-                swap=swap,
-                signature=signature,
-                slot=slot,
-                block_time=block_time,
-                venue=venue,
-                ctx=ctx,
-            )
+        Collaborator methods and thresholds are bound as closure locals, and
+        the record_logs branch is resolved here instead of per transaction.
+        The parsers default to this processor's own.
+        """
+        delta_builder = delta_builder or self.delta_builder
+        inference = inference or self.inference
+        build_deltas = delta_builder.build_deltas
+        extract_all = delta_builder.extract_all
+        extract_program_ids = delta_builder.extract_program_ids
+        infer_swap = inference.infer_swap
+        identify_venue = inference.identify_venue
+        min_conf = self._min_conf
 
-    async def _process_swap(
+        if record_logs:
+            def process(tx_data: Dict[str, Any], default_block_time: int) -> ProcessResult:
+                get = tx_data.get
+                signature = get("signature", "")
+                slot = get("slot", 0)
+                block_time = get("block_time", default_block_time)
+                fee_payer = get("fee_payer", "")
+                if not fee_payer:
+                    account_keys = get("account_keys", [])
+                    fee_payer = account_keys[0] if account_keys else ""
+
+                token_deltas, sol_deltas = build_deltas(tx_data)
+                delta_triples, mints_touched, candidates = extract_all(token_deltas, fee_payer)
+                programs_invoked = extract_program_ids(tx_data)
+
+                mint_event = MintTouchedEvent(
+                    signature=signature,
+                    slot=slot,
+                    block_time=block_time,
+                    fee_payer=fee_payer,
+                    mints_touched=mints_touched,
+                    programs_invoked=programs_invoked,
+                )
+                delta_record = TxDeltaRecord(
+                    signature=signature,
+                    slot=slot,
+                    block_time=block_time,
+                    fee_payer=fee_payer,
+                    programs_invoked=programs_invoked,
+                    token_deltas=delta_triples,
+                    sol_deltas=sol_deltas,
+                    mints_touched=mints_touched,
+                    tx_fee=get("fee", 0),
+                )
+
+                # Fast path: no token deltas means no swap
+                if not token_deltas:
+                    return mint_event, delta_record, None
+
+                swap = infer_swap(token_deltas, sol_deltas, candidates)
+                if swap and swap.confidence >= min_conf:
+                    venue = identify_venue(programs_invoked)
+                    return mint_event, delta_record, (swap, signature, slot, block_time, venue)
+                return mint_event, delta_record, None
+        else:
+            def process(tx_data: Dict[str, Any], default_block_time: int) -> ProcessResult:
+                token_deltas, sol_deltas = build_deltas(tx_data)
+
+                # Fast path: no token deltas means no swap
+                if not token_deltas:
+                    return None, None, None
+
+                get = tx_data.get
+                fee_payer = get("fee_payer", "")
+                if not fee_payer:
+                    account_keys = get("account_keys", [])
+                    fee_payer = account_keys[0] if account_keys else ""
+
+                _, _, candidates = extract_all(token_deltas, fee_payer)
+                swap = infer_swap(token_deltas, sol_deltas, candidates)
+                if swap and swap.confidence >= min_conf:
+                    venue = identify_venue(extract_program_ids(tx_data))
+                    detected = (
+                        swap,
+                        get("signature", ""),
+                        get("slot", 0),
+                        get("block_time", default_block_time),
+                        venue,
+                    )
+                    return None, None, detected
+                return None, None, None
+
+        return process
+
+    def _process_swap(
         self,
         mint: str,
         swap,
@@ -203,30 +357,26 @@ class BatchProcessor:
         slot: int,
         block_time: int,
         venue: str,
+        side_str: str,
         ctx,  # BatchContext
+        batch_mints: Set[str],
+        hot_events: List[SwapEventFull],
     ):
         """Process a detected swap, queuing updates to BatchContext."""
         # Calculate quote in SOL
-        if swap.quote_mint == WSOL_MINT:
-            quote_sol = swap.quote_amount / 1e9
-        else:
-            quote_sol = 0
+        quote_sol = swap.quote_amount * self._quote_scale.get(swap.quote_mint, 0.0)
 
         # Queue counter update (batched to Redis)
         ctx.queue_counter_update(
             mint=mint,
             user_wallet=swap.user_wallet,
             quote_amount_sol=quote_sol,
-            side=swap.side.value,
+            side=side_str,
         )
 
-        # Register mint with counter_manager for detection loop to see
-        if self.counter_manager:
-            self.counter_manager._active_mints.add(mint)
-
-        # Mark token as at least WARM in local cache
-        if mint not in self._state_cache:
-            self._state_cache[mint] = TokenState.WARM
+        # Collected for the local WARM cache, updated once at the end of
+        # the batch
+        batch_mints.add(mint)
 
         # Store full swap event if token is HOT
         if ctx.is_hot(mint):
@@ -247,9 +397,7 @@ class BatchProcessor:
                 mcap_at_swap=None,  # Will be calculated by trigger evaluator
             )
 
-            # Queue to swap queue (non-blocking DB write)
-            if self.swap_queue:
-                await self.swap_queue.put(swap_event)
+            hot_events.append(swap_event)
 
     def get_stats(self) -> dict:
         """Get processor statistics."""
@@ -266,9 +414,15 @@ class BatchProcessor:
             "inference": self.inference.get_stats(),
             "pending_deltas": self._last_pending_delta_count,
             "pending_events": self._last_pending_event_count,
-            "state_cache_size": len(self._state_cache),
+            "state_cache_size": len(self._warm_mints),
         }
 
+    def close(self):
+        """Shut down the worker pool, if any."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
     def reset_pending(self):
         """Reset pending batches (called on error)."""
         self._last_pending_delta_count = 0
@@ -1,17 +1,41 @@
 """Metrics collection and monitoring."""
 
 import asyncio
+import bisect
+from array import array
 import logging
+import math
+import sys
 import time
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from itertools import repeat
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from storage.redis_client import RedisClient
 
 logger = logging.getLogger(__name__)
 
+MetricKey = Tuple[str, frozenset]
 
-@dataclass
+_NO_LABELS: frozenset = frozenset()
+
+
+def _metric_key(name: str, labels: Optional[Dict[str, str]]) -> MetricKey:
+    """Build a hashable registry key without string formatting."""
+    return (name, frozenset(labels.items()) if labels else _NO_LABELS)
+
+
+def _new_key(name: str, labels: Optional[Dict[str, str]]) -> MetricKey:
+    """
+    Registry key for a metric being created.
+
+    The name is interned so later lookups with literal names (already
+    interned by the compiler) hit the identity fast path in key compares.
+    """
+    return _metric_key(sys.intern(name), labels)
+
+
+@dataclass(slots=True)
 class Counter:
     """Simple counter metric."""
     name: str
@@ -22,7 +46,7 @@ class Counter:
         self.value += amount
 
 
-@dataclass
+@dataclass(slots=True)
 class Gauge:
     """Simple gauge metric."""
     name: str
@@ -33,28 +57,41 @@ class Gauge:
         self.value = value
 
 
-@dataclass
+@dataclass(slots=True)
 class Histogram:
     """Simple histogram metric with buckets."""
     name: str
     buckets: List[float] = field(default_factory=lambda: [0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0])
-    counts: List[int] = None
+    counts: Optional[array] = None  # uint64 per bucket, last is +Inf
     sum: float = 0.0
     count: int = 0
     labels: Dict[str, str] = field(default_factory=dict)
+    _buckets_tuple: Tuple[float, ...] = field(init=False, repr=False, default=())
+    _bucket_labels: Tuple[float, ...] = field(init=False, repr=False, default=())
 
     def __post_init__(self):
         if self.counts is None:
-            self.counts = [0] * (len(self.buckets) + 1)
+            self.counts = array("Q", [0]) * (len(self.buckets) + 1)
+        elif not isinstance(self.counts, array):
+            self.counts = array("Q", self.counts)
+        self._buckets_tuple = tuple(self.buckets)
+        self._bucket_labels = self._buckets_tuple + (float("inf"),)
 
     def observe(self, value: float):
+        # First bucket with value <= bound; len(buckets) is the +Inf bucket
+        self.counts[bisect.bisect_left(self._buckets_tuple, value)] += 1
         self.sum += value
         self.count += 1
-        for i, bucket in enumerate(self.buckets):
-            if value <= bucket:
-                self.counts[i] += 1
-                return
-        self.counts[-1] += 1  # +Inf bucket
+
+    def observe_many(self, values: Sequence[float]):
+        """Record several observations with one sum/count update."""
+        if not values:
+            return
+        counts = self.counts
+        for i in map(bisect.bisect_left, repeat(self._buckets_tuple), values):
+            counts[i] += 1
+        self.sum += math.fsum(values)
+        self.count += len(values)
 
 
 class MetricsCollector:
@@ -63,22 +100,39 @@ class MetricsCollector:
 
     Provides counters, gauges, and histograms for monitoring
     application health and performance.
+
+    Metric values are plain attributes mutated from the event loop thread,
+    so increments take no locks; formatting only happens when exported.
     """
 
     def __init__(self):
-        self._counters: Dict[str, Counter] = {}
-        self._gauges: Dict[str, Gauge] = {}
-        self._histograms: Dict[str, Histogram] = {}
+        self._counters: Dict[MetricKey, Counter] = {}
+        self._counters_by_name: Dict[str, List[Counter]] = {}  # base name -> all label sets
+        self._gauges: Dict[MetricKey, Gauge] = {}
+        self._histograms: Dict[MetricKey, Histogram] = {}
         self._start_time = time.time()
 
     # === Counters ===
 
     def counter(self, name: str, labels: Optional[Dict[str, str]] = None) -> Counter:
         """Get or create a counter."""
-        key = f"{name}:{labels}" if labels else name
-        if key not in self._counters:
-            self._counters[key] = Counter(name=name, labels=labels or {})
-        return self._counters[key]
+        key = _metric_key(name, labels)
+        counter = self._counters.get(key)
+        if counter is None:
+            key = _new_key(name, labels)
+            name = key[0]
+            counter = self._counters[key] = Counter(name=name, labels=labels or {})
+            self._counters_by_name.setdefault(name, []).append(counter)
+        return counter
+
+    def bind_counter(self, name: str, labels: Optional[Dict[str, str]] = None) -> Counter:
+        """
+        Resolve a counter once so a hot call site can increment it directly.
+
+        The returned Counter stays registered; later inc() calls by name
+        update the same object.
+        """
+        return self.counter(name, labels)
 
     def inc(self, name: str, amount: int = 1, labels: Optional[Dict[str, str]] = None):
         """Increment a counter."""
@@ -88,10 +142,12 @@ class MetricsCollector:
 
     def gauge(self, name: str, labels: Optional[Dict[str, str]] = None) -> Gauge:
         """Get or create a gauge."""
-        key = f"{name}:{labels}" if labels else name
-        if key not in self._gauges:
-            self._gauges[key] = Gauge(name=name, labels=labels or {})
-        return self._gauges[key]
+        key = _metric_key(name, labels)
+        gauge = self._gauges.get(key)
+        if gauge is None:
+            key = _new_key(name, labels)
+            gauge = self._gauges[key] = Gauge(name=key[0], labels=labels or {})
+        return gauge
 
     def set_gauge(self, name: str, value: float, labels: Optional[Dict[str, str]] = None):
         """Set a gauge value."""
@@ -106,14 +162,16 @@ class MetricsCollector:
         labels: Optional[Dict[str, str]] = None
     ) -> Histogram:
         """Get or create a histogram."""
-        key = f"{name}:{labels}" if labels else name
-        if key not in self._histograms:
-            self._histograms[key] = Histogram(
-                name=name,
+        key = _metric_key(name, labels)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            key = _new_key(name, labels)
+            histogram = self._histograms[key] = Histogram(
+                name=key[0],
                 buckets=buckets or [0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0],
                 labels=labels or {},
             )
-        return self._histograms[key]
+        return histogram
 
     def observe(
         self,
@@ -124,15 +182,24 @@ class MetricsCollector:
         """Record an observation in a histogram."""
         self.histogram(name, labels=labels).observe(value)
 
+    def observe_many(
+        self,
+        name: str,
+        values: Sequence[float],
+        labels: Optional[Dict[str, str]] = None
+    ):
+        """Record a batch of observations in a histogram."""
+        self.histogram(name, labels=labels).observe_many(values)
+
     # === Convenience methods ===
 
     def record_tx_processed(self, venue: str = "unknown"):
         """Record a transaction was processed."""
         self.inc("tx_processed_total", labels={"venue": venue})
 
-    def record_swap_detected(self, side: str, venue: str = "unknown"):
-        """Record a swap was detected."""
-        self.inc("swaps_detected_total", labels={"side": side, "venue": venue})
+    def record_swap_detected(self, side: str, venue: str = "unknown", count: int = 1):
+        """Record swaps detected (count > 1 for batch-accumulated totals)."""
+        self.inc("swaps_detected_total", count, labels={"side": side, "venue": venue})
 
     def record_hot_token(self, trigger: str):
         """Record a HOT token trigger."""
@@ -168,10 +235,14 @@ class MetricsCollector:
 
     # === Export ===
 
+    def uptime_seconds(self) -> float:
+        """Seconds since the collector was created."""
+        return time.time() - self._start_time
+
     def get_all_metrics(self) -> Dict[str, Any]:
         """Get all metrics as a dictionary."""
         return {
-            "uptime_seconds": time.time() - self._start_time,
+            "uptime_seconds": self.uptime_seconds(),
             "counters": {
                 c.name: {"value": c.value, "labels": c.labels}
                 for c in self._counters.values()
@@ -184,7 +255,7 @@ class MetricsCollector:
                 h.name: {
                     "sum": h.sum,
                     "count": h.count,
-                    "buckets": dict(zip(h.buckets + [float('inf')], h.counts)),
+                    "buckets": dict(zip(h._bucket_labels, h.counts)),
                     "labels": h.labels,
                 }
                 for h in self._histograms.values()
@@ -193,7 +264,7 @@ class MetricsCollector:
 
     def _sum_counters(self, name: str) -> int:
         """Sum counters with the same base name across all label sets."""
-        return sum(counter.value for counter in self._counters.values() if counter.name == name)
+        return sum(counter.value for counter in self._counters_by_name.get(name, ()))
 
     def get_summary(self) -> Dict[str, Any]:
         """Get a summary of key metrics."""
@@ -202,11 +273,17 @@ class MetricsCollector:
         hot_total = self._sum_counters("hot_tokens_total")
         alert_total = self._sum_counters("alerts_sent_total")
 
-        stream_gauge = self._gauges.get("stream_length", Gauge("stream_length"))
-        lag_gauge = self._gauges.get("processing_lag_seconds", Gauge("processing_lag_seconds"))
-        hot_gauge = self._gauges.get("hot_tokens_current", Gauge("hot_tokens_current"))
-
-        uptime = time.time() - self._start_time
+        stream_gauge = self._gauges.get(
+            ("stream_length", _NO_LABELS), Gauge("stream_length")
+        )
+        lag_gauge = self._gauges.get(
+            ("processing_lag_seconds", _NO_LABELS), Gauge("processing_lag_seconds")
+        )
+        hot_gauge = self._gauges.get(
+            ("hot_tokens_current", _NO_LABELS), Gauge("hot_tokens_current")
+        )
+
+        uptime = self.uptime_seconds()
 
         return {
             "uptime_seconds": uptime,
@@ -2,13 +2,15 @@
 
 import asyncio
 import logging
+import random
 import time
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Set
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
 
 from models.events import MintTouchedEvent, SwapEventFull, TxDeltaRecord
-from models.profiles import Alert, TokenProfile, TokenState
-from parser.deltas import DeltaBuilder, WSOL_MINT
+from models.profiles import Alert, TokenProfile, TokenState, WalletProfile
+from parser.deltas import DeltaBuilder, QUOTE_SOL_SCALE, WSOL_MINT
 from parser.inference import SwapInference
 from detection.counters import CounterManager
 from detection.state import StateManager
@@ -26,9 +28,76 @@ from storage.swap_queue import SwapEventQueue
 from config.settings import settings
 from .backpressure import BackpressureManager
 from .monitoring import MetricsCollector
+from .ttl_cache import TTLCache, ttl_snapshot
 
 logger = logging.getLogger(__name__)
 
+# Pending event/delta log records held in memory; producers wait for the
+# flusher once a queue is full
+LOG_QUEUE_MAX = 20000
+
+# Failed flushes tolerated in close() before the remaining records are dropped
+LOG_CLOSE_ATTEMPTS = 3
+
+# Supply lookups arriving within this window share one getMultipleAccounts call
+SUPPLY_BATCH_WINDOW = 0.01
+SUPPLY_BATCH_MAX = 100  # getMultipleAccounts account limit
+
+# Max random delay before each funding trace, so simultaneous HOT transitions
+# don't hit Helius in one burst
+ENRICH_JITTER_SECONDS = 0.05
+
+# 10**decimals for every SPL decimals value (u8), as floats
+_DEC_POW = tuple(float(10 ** i) for i in range(256))
+
+# Unknown programs whose latest count is kept locally (least recently seen evicted)
+UNKNOWN_PROGRAMS_MAX = 10000
+
+# Warn when an unknown program's shared count reaches one of these, then
+# every UNKNOWN_PROGRAM_ALERT_EVERY occurrences
+UNKNOWN_PROGRAM_ALERT_AT = frozenset({100})
+UNKNOWN_PROGRAM_ALERT_EVERY = 1000
+
+
+def _drain(queue: asyncio.Queue, limit: int) -> list:
+    """Take up to limit items from a queue without waiting."""
+    get = queue.get_nowait
+    return [get() for _ in range(min(limit, queue.qsize()))]
+
+
+def _mcap_kernel(quote_amount: int, base_amount: int, raw_supply: int) -> float:
+    """
+    Market cap in SOL from a WSOL swap and raw token supply.
+
+    price_sol * whole_supply with the 10**decimals factors cancelled:
+    (quote / 1e9 / base * 10**d) * (supply / 10**d) = quote * supply / (base * 1e9)
+    """
+    return quote_amount * raw_supply / (base_amount * 1e9)
+
+
+def _validated_supply(supply_info: Optional[Dict[str, Any]]) -> Optional[Dict[str, int]]:
+    """
+    Coerce a supply entry before it is cached, or None if malformed.
+
+    Cached entries always hold int supply and decimals in 0..255, so the
+    per-swap kernels can index them without guards.
+    """
+    if not supply_info:
+        return None
+    try:
+        supply = int(supply_info["supply"])
+        decimals = int(supply_info["decimals"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    if supply < 0 or not 0 <= decimals < len(_DEC_POW):
+        return None
+    return {"supply": supply, "decimals": decimals}
+
+
+def _price_kernel(quote_amount: int, base_amount: int, decimals: int) -> float:
+    """Price in SOL per whole token from a WSOL swap."""
+    return quote_amount * _DEC_POW[decimals] / (base_amount * 1e9)
+
 
 class TransactionProcessor:
     """
@@ -92,16 +161,172 @@ class TransactionProcessor:
         self._processed_count = 0
         self._swap_count = 0
         self._alert_count = 0
-        self._unknown_programs: Dict[str, int] = {}
-
-        # Cache for token supply (mint -> {supply, decimals})
-        self._token_supply_cache: Dict[str, Dict[str, Any]] = {}
+        # prog_id -> last count from Redis, which holds the authoritative counter
+        self._unknown_programs: "OrderedDict[str, int]" = OrderedDict()
+
+        # Cache for token supply (mint -> {supply, decimals}); supply rarely changes
+        self._token_supply_cache: TTLCache = TTLCache(ttl=3600, max_size=100000)
+
+        # Concurrent misses for a mint share one future; misses are batched
+        # into getMultipleAccounts calls by _supply_batcher
+        self._supply_inflight: Dict[str, asyncio.Future] = {}
+        self._supply_batch_queue: asyncio.Queue = asyncio.Queue()
+        self._supply_task: Optional[asyncio.Task] = None
+
+        # Per-swap (wallet, volume_sol, buy_count) for the clusterer, applied
+        # in bulk by _flush_loop and before anything reads cluster state
+        self._cluster_buf: Deque[Tuple[str, float, int]] = deque()
+
+        # Hot-loop constants resolved once
+        self._min_conf = settings.min_swap_confidence
+
+        # Last backpressure check whose lag/stream gauges were published
+        self._bp_checks_seen = -1
+
+        # Caps concurrent funding traces across all enrichment runs
+        self._helius_sem = asyncio.Semaphore(settings.helius_concurrency)
+
+        # Event/delta log records are queued per tx and written in batches
+        # by _flush_loop instead of awaiting two appends per transaction
+        self._event_q: asyncio.Queue = asyncio.Queue(maxsize=LOG_QUEUE_MAX)
+        self._delta_q: asyncio.Queue = asyncio.Queue(maxsize=LOG_QUEUE_MAX)
+        self._logs_pending = asyncio.Event()
+        # Batches taken off the queues but not yet written; retried first
+        self._unwritten_events: list = []
+        self._unwritten_deltas: list = []
+        self._log_full_waits = 0
+        self._flush_task: Optional[asyncio.Task] = None
 
     async def initialize(self):
         """Initialize all components."""
         await self.trigger_evaluator.load_config()
+        self._flush_task = asyncio.create_task(self._flush_loop())
+        self._supply_task = asyncio.create_task(self._supply_batcher())
         logger.info("TransactionProcessor initialized")
 
+    async def close(self):
+        """Stop background tasks and write out any queued log records."""
+        if self._supply_task:
+            self._supply_task.cancel()
+            try:
+                await self._supply_task
+            except asyncio.CancelledError:
+                pass
+            self._supply_task = None
+        # Release anyone still waiting on a lookup the batcher never made
+        for future in self._supply_inflight.values():
+            if not future.done():
+                future.set_result(None)
+        self._supply_inflight.clear()
+
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+
+        failures = 0
+        while self._logs_outstanding():
+            try:
+                await self._flush_logs(settings.log_flush_batch_size)
+            except Exception as e:
+                failures += 1
+                if failures >= LOG_CLOSE_ATTEMPTS:
+                    logger.error(
+                        f"Giving up on log flush at close after {failures} attempts, "
+                        f"dropping {self._pending_log_count()} records: {e}"
+                    )
+                    break
+                logger.error(f"Log flush error at close: {e}")
+
+    async def _enqueue_log(self, queue: asyncio.Queue, record):
+        """Queue a log record, waiting for the flusher only if the queue is full."""
+        try:
+            queue.put_nowait(record)
+        except asyncio.QueueFull:
+            # Backpressure rather than drop: backfill needs every delta record
+            self._log_full_waits += 1
+            if self._log_full_waits % 1000 == 1:
+                logger.warning(f"Log queue full, waited on flush {self._log_full_waits} times total")
+            self._logs_pending.set()
+            await queue.put(record)
+        self._logs_pending.set()
+
+    def _flush_cluster_buf(self):
+        """Apply buffered wallet activity to the clusterer."""
+        if self._cluster_buf:
+            entries = list(self._cluster_buf)
+            self._cluster_buf.clear()
+            self.clusterer.add_wallets_bulk(entries)
+
+    def _logs_outstanding(self) -> bool:
+        """Whether any log records are queued or awaiting a retried write."""
+        return bool(
+            self._unwritten_events or self._unwritten_deltas
+            or self._event_q.qsize() or self._delta_q.qsize()
+        )
+
+    def _pending_log_count(self) -> int:
+        """Number of log records not yet written."""
+        return (
+            len(self._unwritten_events) + len(self._unwritten_deltas)
+            + self._event_q.qsize() + self._delta_q.qsize()
+        )
+
+    async def _flush_logs(self, limit: int):
+        """
+        Write up to limit queued records from each log queue.
+
+        A batch whose write fails is kept and retried by the next call
+        before anything more is taken from its queue.
+        """
+        if not self._unwritten_events:
+            self._unwritten_events = _drain(self._event_q, limit)
+        if not self._unwritten_deltas:
+            self._unwritten_deltas = _drain(self._delta_q, limit)
+        if not (self._unwritten_events or self._unwritten_deltas):
+            return
+
+        event_result, delta_result = await asyncio.gather(
+            self.event_log.append_batch(self._unwritten_events),
+            self.delta_log.append_batch(self._unwritten_deltas),
+            return_exceptions=True,
+        )
+        if not isinstance(event_result, BaseException):
+            self._unwritten_events = []
+        if not isinstance(delta_result, BaseException):
+            self._unwritten_deltas = []
+        for result in (event_result, delta_result):
+            if isinstance(result, BaseException):
+                raise result
+
+    async def _flush_loop(self):
+        """Coalesce queued log records into batches of up to log_flush_batch_size."""
+        batch_size = settings.log_flush_batch_size
+        interval = settings.log_flush_interval_ms / 1000
+
+        while True:
+            try:
+                await self._logs_pending.wait()
+                # Give a partial batch a moment to fill before writing
+                if self._delta_q.qsize() < batch_size:
+                    await asyncio.sleep(interval)
+                self._logs_pending.clear()
+                self._flush_cluster_buf()
+                await self._flush_logs(batch_size)
+                if self._logs_outstanding():
+                    self._logs_pending.set()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Log flush error: {e}")
+                # Retry leftovers after a pause; producers may be waiting on them
+                await asyncio.sleep(interval)
+                if self._logs_outstanding():
+                    self._logs_pending.set()
+
     async def process_transaction(self, tx_data: Dict[str, Any]):
         """
         Process a single transaction.
@@ -112,31 +337,39 @@ class TransactionProcessor:
         self._processed_count += 1
 
         # Extract basic info
-        signature = tx_data.get("signature", "")
-        slot = tx_data.get("slot", 0)
-        block_time = tx_data.get("block_time", int(time.time()))
-        fee_payer = tx_data.get("fee_payer", "")
+        get = tx_data.get
+        signature = get("signature", "")
+        slot = get("slot", 0)
+        block_time = get("block_time")
+        if block_time is None:
+            block_time = int(start_time)
+        fee_payer = get("fee_payer", "")
 
         if not fee_payer:
-            account_keys = tx_data.get("account_keys", [])
+            account_keys = get("account_keys", ())
             fee_payer = account_keys[0] if account_keys else ""
 
-        # Update backpressure
-        await self.backpressure.update(block_time)
-        bp_stats = self.backpressure.get_stats()
-        self.metrics.set_processing_lag(bp_stats["processing_lag_seconds"])
-        self.metrics.set_stream_length(bp_stats["stream_length"])
+        # Update backpressure (throttled internally); gauges only change
+        # when a check actually ran, so skip republishing them otherwise
+        backpressure = self.backpressure
+        await backpressure.update(block_time)
+        if backpressure.checks != self._bp_checks_seen:
+            self._bp_checks_seen = backpressure.checks
+            self.metrics.set_processing_lag(backpressure.processing_lag)
+            self.metrics.set_stream_length(backpressure.stream_length)
+
+        # Decided once per tx; degraded modes shed inference and discovery work
+        parse_full = self.backpressure.should_parse_full()
 
         # Build deltas
         token_deltas, sol_deltas = self.delta_builder.build_deltas(tx_data)
 
-        # Extract metadata
-        mints_touched = self.delta_builder.extract_mints_touched(token_deltas)
+        # Extract metadata (record triples, mints and candidates in one pass)
+        delta_triples, mints_touched, candidates = self.delta_builder.extract_all(
+            token_deltas, fee_payer
+        )
         programs_invoked = self.delta_builder.extract_program_ids(tx_data)
 
-        # Track unknown programs
-        await self._track_unknown_programs(programs_invoked, slot)
-
         # === ALWAYS: Emit MintTouchedEvent ===
         mint_event = MintTouchedEvent(
             signature=signature,
@@ -146,44 +379,68 @@ class TransactionProcessor:
             mints_touched=mints_touched,
             programs_invoked=programs_invoked,
         )
-        await self.event_log.append(mint_event)
+        await self._enqueue_log(self._event_q, mint_event)
 
         # === ALWAYS: Store TxDeltaRecord ===
+        # Kept complete in every mode: backfill reinfers swaps from these
+        # records once a token turns HOT
         delta_record = TxDeltaRecord(
             signature=signature,
             slot=slot,
             block_time=block_time,
             fee_payer=fee_payer,
             programs_invoked=programs_invoked,
-            token_deltas=[(o, m, amt) for (o, m), amt in token_deltas.items()],
+            token_deltas=delta_triples,
             sol_deltas=sol_deltas,
             mints_touched=mints_touched,
-            tx_fee=tx_data.get("fee", 0),
+            tx_fee=get("fee", 0),
         )
-        await self.delta_log.append(delta_record)
+        await self._enqueue_log(self._delta_q, delta_record)
 
         # Update metrics
         self.metrics.inc("tx_processed_total")
 
         # === NORMAL mode: Full swap inference ===
-        if self.backpressure.should_parse_full():
-            candidates = self.delta_builder.get_candidate_users(token_deltas, fee_payer)
+        if parse_full:
             swap = self.inference.infer_swap(token_deltas, sol_deltas, candidates)
             venue = self.inference.identify_venue(programs_invoked)
 
-            if swap and swap.confidence >= settings.min_swap_confidence:
+            # Optional bookkeeping is shed with rising probability as lag
+            # approaches DEGRADED, before inference itself has to stop
+            shed = self.backpressure.should_shed_optional()
+            pending = []
+
+            # Track unknown programs (Redis round-trips; discovery only).
+            # Independent of swap state, so it runs alongside the swap writes
+            # rather than ahead of them.
+            if shed:
+                self.metrics.inc("bp_shed_total", labels={"path": "unknown_programs"})
+            else:
+                pending.append(self._track_unknown_programs(programs_invoked, slot))
+
+            if swap and swap.confidence >= self._min_conf:
                 self._swap_count += 1
-                self.metrics.record_swap_detected(swap.side.value, venue)
+                side_value = swap.side.value
+                self.metrics.record_swap_detected(side_value, venue)
+                if shed:
+                    self.metrics.inc("bp_shed_total", labels={"path": "clusterer"})
 
                 # Update state and counters
-                await self._process_detected_swap(
+                pending.append(self._process_detected_swap(
                     mint=swap.base_mint,
                     swap=swap,
                     signature=signature,
                     slot=slot,
                     block_time=block_time,
                     venue=venue,
-                )
+                    side_value=side_value,
+                    track_wallet=not shed,
+                ))
+
+            if len(pending) == 1:
+                await pending[0]
+            elif pending:
+                await asyncio.gather(*pending)
 
         # Record processing time
         elapsed = time.time() - start_time
@@ -197,31 +454,36 @@ class TransactionProcessor:
         slot: int,
         block_time: int,
         venue: str,
+        side_value: Optional[str] = None,
+        track_wallet: bool = True,
     ):
         """Process a detected swap event."""
+        if side_value is None:
+            side_value = swap.side.value
+
         # Ensure token is at least WARM
         await self.state_manager.transition_to_warm(mint)
 
-        # Calculate quote in SOL
-        if swap.quote_mint == WSOL_MINT:
-            quote_sol = swap.quote_amount / 1e9
-        else:
-            quote_sol = 0  # For USDC/USDT, would need price conversion
+        # Calculate quote in SOL (USDC/USDT would need price conversion)
+        quote_sol = swap.quote_amount * QUOTE_SOL_SCALE.get(swap.quote_mint, 0.0)
+
+        # Counter and mcap writes share one pipelined round-trip
+        pipe = self.redis.pipeline()
 
         # Update counters
         await self.counter_manager.record_swap(
             mint=mint,
             user_wallet=swap.user_wallet,
             quote_amount_sol=quote_sol,
-            side=swap.side.value,
+            side=side_value,
+            pipe=pipe,
         )
 
-        # Track wallet in clusterer
-        self.clusterer.add_wallet(
-            swap.user_wallet,
-            volume_sol=quote_sol,
-            buy_count=1 if swap.side.value == "buy" else 0,
-        )
+        # Track wallet in clusterer (buffered, applied in bulk)
+        if track_wallet:
+            self._cluster_buf.append(
+                (swap.user_wallet, quote_sol, 1 if side_value == "buy" else 0)
+            )
 
         # Calculate mcap at swap time for ALL swaps (not just HOT)
         # This is critical for having mcap data when alerts are created
@@ -236,13 +498,16 @@ class TransactionProcessor:
             )
             # Store latest mcap in Redis for quick alert lookups
             if mcap_at_swap is not None:
-                price_per_unit = (swap.quote_amount / 1e9) / swap.base_amount
-                decimals = supply_info.get("decimals", 9) if supply_info else 9
-                price_sol = price_per_unit * (10 ** decimals)
-                await self.redis.set_token_mcap(mint, mcap_at_swap, price_sol)
+                decimals = supply_info["decimals"] if supply_info else 9
+                price_sol = _price_kernel(swap.quote_amount, swap.base_amount, decimals)
+                await self.redis.set_token_mcap(mint, mcap_at_swap, price_sol, pipe=pipe)
+
+        # Flush writes before the trigger evaluation below reads the counters
+        await pipe.execute()
 
         # Store full swap event if token is HOT
-        if await self.state_manager.is_hot(mint):
+        is_hot = await self.state_manager.is_hot(mint)
+        if is_hot:
             swap_event = SwapEventFull(
                 signature=signature,
                 slot=slot,
@@ -263,13 +528,15 @@ class TransactionProcessor:
             else:
                 await self.postgres.insert_swap_event(swap_event)
 
-        # Evaluate triggers
-        await self._evaluate_triggers(mint)
+        # Evaluate triggers (HOT state already known from above)
+        await self._evaluate_triggers(mint, is_hot=is_hot)
 
-    async def _evaluate_triggers(self, mint: str):
+    async def _evaluate_triggers(self, mint: str, is_hot: Optional[bool] = None):
         """Evaluate triggers for a mint and handle HOT transitions."""
         # Skip if already HOT
-        if await self.state_manager.is_hot(mint):
+        if is_hot is None:
+            is_hot = await self.state_manager.is_hot(mint)
+        if is_hot:
             return
 
         result = await self.trigger_evaluator.evaluate(mint)
@@ -290,7 +557,9 @@ class TransactionProcessor:
         if redis_mcap and redis_mcap.get("mcap_sol"):
             mcap = redis_mcap["mcap_sol"]
             if mcap < MIN_MCAP_SOL:
-                logger.info(f"Skipping {mint[:8]} - mcap {mcap:.0f} SOL below minimum {MIN_MCAP_SOL}")
+                logger.info(
+                    "Skipping %s - mcap %.0f SOL below minimum %d", mint[:8], mcap, MIN_MCAP_SOL
+                )
                 return
 
         # Transition to HOT
@@ -306,18 +575,93 @@ class TransactionProcessor:
 
     async def _get_token_supply(self, mint: str) -> Optional[Dict[str, Any]]:
         """Get cached or fetch token supply info."""
-        if mint in self._token_supply_cache:
-            return self._token_supply_cache[mint]
+        supply_info = self._token_supply_cache.get(mint)
+        if supply_info is not None:
+            return supply_info
+
+        if self._supply_task is None:
+            # Batcher not running (processor not initialized); fetch directly
+            return (await self._fetch_supplies([mint])).get(mint)
+
+        future = self._supply_inflight.get(mint)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._supply_inflight[mint] = future
+            self._supply_batch_queue.put_nowait(mint)
+
+        # Shielded so one cancelled waiter doesn't fail the shared lookup
+        return await asyncio.shield(future)
 
+    async def _fetch_supplies(self, mints: List[str]) -> Dict[str, Dict[str, int]]:
+        """
+        Resolve supply for mints via the shared Redis cache, then Helius.
+
+        Fetched entries are written back to Redis and to the local cache.
+        Mints that could not be resolved are omitted.
+        """
         try:
-            supply_info = await self.helius.get_token_supply(mint)
-            if supply_info:
-                self._token_supply_cache[mint] = supply_info
-                return supply_info
+            cached = await self.redis.get_token_supplies(mints)
         except Exception as e:
-            logger.debug(f"Failed to get token supply for {mint[:8]}: {e}")
+            logger.debug("Redis supply cache read failed: %s", e)
+            cached = {}
 
-        return None
+        supplies: Dict[str, Dict[str, int]] = {}
+        for mint, supply_info in cached.items():
+            supply_info = _validated_supply(supply_info)
+            if supply_info:
+                supplies[mint] = supply_info
+
+        missing = [mint for mint in mints if mint not in supplies]
+        if missing:
+            try:
+                fetched = await self.helius.get_multiple_token_supplies(missing)
+            except Exception as e:
+                logger.debug("Failed to get token supplies for %d mints: %s", len(missing), e)
+                fetched = {}
+
+            new_supplies = {}
+            for mint, supply_info in fetched.items():
+                supply_info = _validated_supply(supply_info)
+                if supply_info:
+                    new_supplies[mint] = supply_info
+            if new_supplies:
+                supplies.update(new_supplies)
+                try:
+                    await self.redis.set_token_supplies(new_supplies)
+                except Exception as e:
+                    logger.debug("Redis supply cache write failed: %s", e)
+
+        for mint, supply_info in supplies.items():
+            self._token_supply_cache.set(mint, supply_info)
+        return supplies
+
+    async def _supply_batcher(self):
+        """Resolve queued supply lookups with one cache read / Helius call per batch."""
+        while True:
+            mints: List[str] = []
+            try:
+                mints.append(await self._supply_batch_queue.get())
+                await asyncio.sleep(SUPPLY_BATCH_WINDOW)
+                mints += _drain(self._supply_batch_queue, SUPPLY_BATCH_MAX - 1)
+
+                supplies = await self._fetch_supplies(mints)
+
+                for mint in mints:
+                    supply_info = supplies.get(mint)
+                    future = self._supply_inflight.pop(mint, None)
+                    if future is not None and not future.done():
+                        future.set_result(supply_info)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Supply batcher error: {e}")
+            finally:
+                # Never leave waiters on a dequeued mint hanging; a later
+                # lookup starts a fresh fetch
+                for mint in mints:
+                    future = self._supply_inflight.pop(mint, None)
+                    if future is not None and not future.done():
+                        future.set_result(None)
 
     def _calculate_mcap_at_swap(
         self,
@@ -331,32 +675,9 @@ class TransactionProcessor:
 
         Returns mcap in SOL, or None if calculation not possible.
         """
-        if not supply_info or quote_mint != WSOL_MINT:
-            return None
-
-        if base_amount <= 0:
-            return None
-
-        try:
-            raw_supply = supply_info["supply"]
-            decimals = supply_info["decimals"]
-
-            # Price per base unit in SOL
-            price_per_unit = (quote_amount / 1e9) / base_amount
-
-            # Price per whole token in SOL
-            price_sol = price_per_unit * (10 ** decimals)
-
-            # Supply in whole tokens
-            supply_whole_tokens = raw_supply / (10 ** decimals)
-
-            # Market cap in SOL
-            mcap_sol = price_sol * supply_whole_tokens
-
-            return mcap_sol
-        except Exception as e:
-            logger.debug(f"Failed to calculate mcap at swap: {e}")
+        if not supply_info or quote_mint != WSOL_MINT or base_amount <= 0:
             return None
+        return _mcap_kernel(quote_amount, base_amount, supply_info["supply"])
 
     async def _calculate_price_and_mcap(self, mint: str) -> Dict[str, Any]:
         """
@@ -368,6 +689,7 @@ class TransactionProcessor:
         Returns dict with price_sol, mcap_sol, token_supply (or None values if unavailable).
         """
         result = {"price_sol": None, "mcap_sol": None, "token_supply": None}
+        mint_short = mint[:8]
 
         try:
             # FIRST: Try Redis for cached mcap (set by _process_detected_swap)
@@ -376,12 +698,10 @@ class TransactionProcessor:
             if redis_mcap:
                 result["mcap_sol"] = redis_mcap["mcap_sol"]
                 result["price_sol"] = redis_mcap.get("price_sol")
-                logger.info(
-                    f"Got mcap from Redis for {mint[:8]}: {result['mcap_sol']:.2f} SOL"
-                )
+                logger.info("Got mcap from Redis for %s: %.2f SOL", mint_short, result["mcap_sol"])
 
-            # Get token supply for completeness
-            supply_info = await self.helius.get_token_supply(mint)
+            # Token supply (normally already cached by _process_detected_swap)
+            supply_info = await self._get_token_supply(mint)
             if supply_info:
                 result["token_supply"] = supply_info["supply"]
 
@@ -401,41 +721,48 @@ class TransactionProcessor:
                         raw_supply = supply_info["supply"]
 
                         if total_base > 0:
-                            price_per_unit = (total_quote / 1e9) / total_base
-                            price_sol = price_per_unit * (10 ** decimals)
-                            supply_whole_tokens = raw_supply / (10 ** decimals)
-                            mcap_sol = price_sol * supply_whole_tokens
+                            price_sol = _price_kernel(total_quote, total_base, decimals)
+                            mcap_sol = _mcap_kernel(total_quote, total_base, raw_supply)
 
                             result["price_sol"] = price_sol
                             result["mcap_sol"] = mcap_sol
 
                             logger.info(
-                                f"Calculated mcap from postgres for {mint[:8]}: {mcap_sol:.2f} SOL"
+                                "Calculated mcap from postgres for %s: %.2f SOL", mint_short, mcap_sol
                             )
                 except asyncio.TimeoutError:
-                    logger.debug(f"Postgres swap query timed out for {mint[:8]}")
+                    logger.debug("Postgres swap query timed out for %s", mint_short)
                 except Exception as e:
-                    logger.debug(f"Failed to get swaps from postgres for {mint[:8]}: {e}")
+                    logger.debug("Failed to get swaps from postgres for %s: %s", mint_short, e)
 
         except Exception as e:
-            logger.warning(f"Failed to calculate price/mcap for {mint[:8]}: {e}")
+            logger.warning(f"Failed to calculate price/mcap for {mint_short}: {e}")
 
         return result
 
     async def _create_alert(self, mint: str, trigger_result: TriggerResult):
         """Create and send an alert for a HOT token."""
-        logger.info(f"Creating alert for {mint[:8]} (trigger: {trigger_result.trigger_name})")
+        mint_short = mint[:8]
+        logger.info("Creating alert for %s (trigger: %s)", mint_short, trigger_result.trigger_name)
         self._alert_count += 1
 
         try:
-            # Get token metadata from profile first
-            token_profile = await self.postgres.get_token_profile(mint)
+            # Independent reads run concurrently; only the DAS fallback below
+            # depends on their results
+            token_profile, dex_meta, venue, top_buyers, price_mcap = await asyncio.gather(
+                self.postgres.get_token_profile(mint),
+                self.helius.get_token_metadata_dexscreener(mint),
+                self.postgres.get_dominant_venue(mint),
+                self.postgres.get_top_buyers(mint, limit=5),
+                self._calculate_price_and_mcap(mint),
+            )
+
+            # Token metadata from profile first
             token_name = token_profile.name if token_profile else None
             token_symbol = token_profile.symbol if token_profile else None
             token_image = None
 
-            # Try DexScreener first for metadata (free, no credits)
-            dex_meta = await self.helius.get_token_metadata_dexscreener(mint)
+            # Then DexScreener (free, no credits)
             if dex_meta:
                 token_name = token_name or dex_meta.get("name")
                 token_symbol = token_symbol or dex_meta.get("symbol")
@@ -449,15 +776,10 @@ class TransactionProcessor:
                     token_symbol = token_symbol or das_meta.get("symbol")
                     token_image = token_image or das_meta.get("image")
 
-            # Get dominant venue
-            venue = await self.postgres.get_dominant_venue(mint)
-            # Detect pump.fun from mint address as fallback
+            # Detect pump.fun from mint address if no dominant venue
             if not venue and mint.endswith("pump"):
                 venue = "pump"
 
-            # Get top buyers
-            top_buyers = await self.postgres.get_top_buyers(mint, limit=5)
-
             # Calculate CTO score
             cto_score = self.scorer.score_token(
                 trigger_result.stats,
@@ -465,15 +787,13 @@ class TransactionProcessor:
             )
 
             # Generate cluster summary
+            self._flush_cluster_buf()
             buyer_wallets = [b["user_wallet"] for b in top_buyers]
             cluster_summary = self.clusterer.generate_summary(buyer_wallets)
 
             # Check enrichment status
             enrichment_degraded = self.helius.is_degraded()
 
-            # Calculate price and market cap at alert time
-            price_mcap = await self._calculate_price_and_mcap(mint)
-
             # Create alert
             alert = Alert(
                 mint=mint,
@@ -488,7 +808,7 @@ class TransactionProcessor:
                 top_buyers=top_buyers,
                 cluster_summary=cluster_summary,
                 enrichment_degraded=enrichment_degraded,
-                created_at=datetime.utcnow(),
+                created_at=datetime.now(timezone.utc),
                 price_sol=price_mcap["price_sol"],
                 mcap_sol=price_mcap["mcap_sol"],
                 token_supply=price_mcap["token_supply"],
@@ -499,55 +819,69 @@ class TransactionProcessor:
             # Store alert
             alert_id = await self.postgres.insert_alert(alert)
             alert.id = alert_id
-            logger.info(f"Alert {alert_id} stored for {mint[:8]}")
+            logger.info("Alert %s stored for %s", alert_id, mint_short)
 
             # Send to channels
             await self._send_alert(alert, cto_score)
 
-        except Exception as e:
-            import traceback
-            logger.error(f"Failed to create alert for {mint[:8]}: {e}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+        except Exception:
+            logger.exception("Failed to create alert for %s", mint_short)
 
     async def _send_alert(self, alert: Alert, cto_score):
         """Send alert to configured channels."""
-        # Discord
+        channels = []
         if self.discord.is_configured():
-            success = await self.discord.send_alert(alert, cto_score)
-            if success:
-                await self.postgres.update_alert_delivery(alert.id, discord=True)
-                self.metrics.record_alert_sent("discord")
-
-        # Telegram
+            channels.append(("discord", self.discord))
         if self.telegram.is_configured():
-            success = await self.telegram.send_alert(alert, cto_score)
-            if success:
-                await self.postgres.update_alert_delivery(alert.id, telegram=True)
-                self.metrics.record_alert_sent("telegram")
+            channels.append(("telegram", self.telegram))
+
+        # Channels are independent, so dispatch them concurrently; one
+        # failing channel doesn't block the other
+        results = await asyncio.gather(
+            *(alerter.send_alert(alert, cto_score) for _, alerter in channels),
+            return_exceptions=True,
+        )
+
+        delivered = {}
+        for (name, _), result in zip(channels, results):
+            if isinstance(result, Exception):
+                logger.warning(f"{name} alert failed for {alert.mint[:8]}: {result}")
+            elif result:
+                delivered[name] = True
+                self.metrics.record_alert_sent(name)
+
+        # Record both channels' delivery in a single update
+        if delivered:
+            await self.postgres.update_alert_delivery(alert.id, **delivered)
 
         logger.info(
-            f"Alert sent for {alert.mint[:8]}: {alert.trigger_name} "
-            f"(CTO: {cto_score.total_score:.0%})"
+            "Alert sent for %s: %s (CTO: %.0f%%)",
+            alert.mint[:8], alert.trigger_name, cto_score.total_score * 100,
         )
 
     async def _track_unknown_programs(self, programs: Set[str], slot: int):
         """Track unknown program occurrences."""
-        unknown = programs - self.known_programs
-
-        if not unknown:
+        # Fast path: subset test allocates nothing (str hashes are cached)
+        if programs <= self.known_programs:
             return
 
+        unknown = programs - self.known_programs
         known_in_tx = programs & self.known_programs
 
-        for prog_id in unknown:
-            self._unknown_programs[prog_id] = self._unknown_programs.get(prog_id, 0) + 1
+        # Track in Redis (atomic counts shared across processes and restarts),
+        # one round-trip for all unknown programs in the tx
+        unknown = list(unknown)
+        counts = await self.redis.track_programs(unknown, slot, known_in_tx)
 
-            # Track in Redis
-            await self.redis.track_program(prog_id, slot, known_in_tx)
+        lru = self._unknown_programs
+        for prog_id, count in zip(unknown, counts):
+            # Re-insert so the entry moves to the most-recent end
+            lru.pop(prog_id, None)
+            lru[prog_id] = count
+            if len(lru) > UNKNOWN_PROGRAMS_MAX:
+                lru.popitem(last=False)
 
-            # Alert if threshold reached
-            count = self._unknown_programs[prog_id]
-            if count == 100:  # Alert at 100 occurrences
+            if count in UNKNOWN_PROGRAM_ALERT_AT or count % UNKNOWN_PROGRAM_ALERT_EVERY == 0:
                 logger.warning(
                     f"Unknown program {prog_id} seen {count} times, "
                     f"co-occurs with {known_in_tx}"
@@ -559,31 +893,61 @@ class TransactionProcessor:
 
         Called when a token becomes HOT to backfill swap events.
         """
-        # Reconstruct deltas
-        token_deltas = {(o, m): amt for o, m, amt in record.token_deltas}
-        sol_deltas = record.sol_deltas
-
-        # Infer swap
-        candidates = self.delta_builder.get_candidate_users(token_deltas, record.fee_payer)
-        swap = self.inference.infer_swap(token_deltas, sol_deltas, candidates)
+        await self.reprocess_delta_records([record])
 
-        if swap and swap.confidence >= settings.min_swap_confidence:
-            venue = self.inference.identify_venue(record.programs_invoked)
+    async def reprocess_delta_records(self, records: List[TxDeltaRecord]) -> int:
+        """
+        Reprocess a batch of TxDeltaRecords for backfill.
 
-            # Calculate mcap at swap time (supply should be cached from alert creation)
-            supply_info = await self._get_token_supply(swap.base_mint)
-            mcap_at_swap = self._calculate_mcap_at_swap(
-                swap.quote_amount,
-                swap.base_amount,
-                swap.quote_mint,
-                supply_info,
+        Infers swaps for every record first, resolves supply once per base
+        mint, then writes all swap events in one bulk call. Returns the
+        number of swap events produced.
+        """
+        min_conf = self._min_conf
+        inferred = []
+        failed = 0
+        first_error = None
+        for record in records:
+            try:
+                # Infer straight from the stored triples (no dict rebuild)
+                triples = record.token_deltas
+                candidates = self.delta_builder.get_candidate_users_from_triples(
+                    triples, record.fee_payer
+                )
+                swap = self.inference.infer_swap_from_triples(
+                    triples, record.sol_deltas, candidates
+                )
+            except Exception as e:
+                # Logged once per batch below
+                failed += 1
+                if first_error is None:
+                    first_error = e
+                continue
+            if swap and swap.confidence >= min_conf:
+                inferred.append((record, swap))
+
+        if failed:
+            logger.error(
+                f"Backfill failed for {failed}/{len(records)} records "
+                f"(first error: {first_error})"
             )
 
-            swap_event = SwapEventFull(
+        if not inferred:
+            return 0
+
+        # Supply should be cached from alert creation; one lookup per mint
+        base_mints = list({swap.base_mint for _, swap in inferred})
+        supplies = dict(zip(
+            base_mints,
+            await asyncio.gather(*(self._get_token_supply(m) for m in base_mints)),
+        ))
+
+        swap_events = [
+            SwapEventFull(
                 signature=record.signature,
                 slot=record.slot,
                 block_time=record.block_time,
-                venue=venue,
+                venue=self.inference.identify_venue(record.programs_invoked),
                 user_wallet=swap.user_wallet,
                 side=swap.side,
                 base_mint=swap.base_mint,
@@ -591,13 +955,25 @@ class TransactionProcessor:
                 quote_mint=swap.quote_mint,
                 quote_amount=swap.quote_amount,
                 confidence=swap.confidence,
-                mcap_at_swap=mcap_at_swap,
+                mcap_at_swap=self._calculate_mcap_at_swap(
+                    swap.quote_amount,
+                    swap.base_amount,
+                    swap.quote_mint,
+                    supplies[swap.base_mint],
+                ),
             )
-            # Use queue for non-blocking writes if available
-            if self.swap_queue:
-                await self.swap_queue.put(swap_event)
-            else:
-                await self.postgres.insert_swap_event(swap_event)
+            for record, swap in inferred
+        ]
+
+        # Use queue for non-blocking writes if available; a backfill burst
+        # that overflows it is bulk-inserted directly instead of dropped
+        overflow = swap_events
+        if self.swap_queue:
+            accepted = await self.swap_queue.put_many(swap_events, drop_overflow=False)
+            overflow = swap_events[accepted:]
+        if overflow:
+            await self.postgres.bulk_insert_swap_events(overflow)
+        return len(swap_events)
 
     async def run_enrichment(self, mint: str):
         """
@@ -606,35 +982,49 @@ class TransactionProcessor:
         Traces funding for top buyers and updates clusters.
         """
         if not self.backpressure.should_enrich():
-            logger.info(f"Skipping enrichment for {mint[:8]} (backpressure)")
+            logger.info("Skipping enrichment for %s (backpressure)", mint[:8])
             return
 
         # Get top buyers
         top_buyers = await self.postgres.get_top_buyers(mint, limit=10)
 
-        for buyer in top_buyers:
+        async def _enrich_one(buyer: Dict[str, Any]) -> Optional[WalletProfile]:
             wallet = buyer["user_wallet"]
-
-            # Trace funding
-            funding = await self.helius.trace_funding(wallet, max_hops=2)
-
-            if funding:
-                # Link to funder in clusterer
-                ultimate_funder = funding["ultimate_funder"]
-                self.clusterer.link_funding(wallet, ultimate_funder)
-
-                # Update wallet profile
-                profile = await self.postgres.get_wallet_profile(wallet)
-                if profile:
-                    profile.funded_by = ultimate_funder
-                    profile.funding_hop = funding["hops"]
-                    await self.postgres.upsert_wallet_profile(profile)
+            await asyncio.sleep(random.uniform(0, ENRICH_JITTER_SECONDS))
+            async with self._helius_sem:
+                funding = await self.helius.trace_funding(wallet, max_hops=2)
+            if not funding:
+                return None
+
+            # Link to funder in clusterer
+            ultimate_funder = funding["ultimate_funder"]
+            self.clusterer.link_funding(wallet, ultimate_funder)
+
+            profile = await self.postgres.get_wallet_profile(wallet)
+            if profile:
+                profile.funded_by = ultimate_funder
+                profile.funding_hop = funding["hops"]
+            return profile
+
+        # Trace funding for all buyers concurrently, then write profiles in one batch
+        results = await asyncio.gather(
+            *(_enrich_one(buyer) for buyer in top_buyers), return_exceptions=True
+        )
+        profiles = []
+        for buyer, result in zip(top_buyers, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Enrichment failed for {buyer['user_wallet'][:8]}: {result}")
+            elif result is not None:
+                profiles.append(result)
+        await self.postgres.upsert_wallet_profiles_many(profiles)
 
         # Persist clusters
+        self._flush_cluster_buf()
         await self.clusterer.persist_all_clusters()
 
+    @ttl_snapshot(1.0)
     def get_stats(self) -> dict:
-        """Get processor statistics."""
+        """Get processor statistics (snapshot, refreshed at most once a second)."""
         return {
             "processed_count": self._processed_count,
             "swap_count": self._swap_count,
@@ -645,6 +1035,10 @@ class TransactionProcessor:
                 else 0
             ),
             "unknown_programs_tracked": len(self._unknown_programs),
+            "log_queue_pending": self._pending_log_count(),
+            "log_full_waits": self._log_full_waits,
+            "supply_cache": self._token_supply_cache.stats(),
+            "supply_inflight": len(self._supply_inflight),
             "delta_builder": self.delta_builder.get_stats(),
             "inference": self.inference.get_stats(),
             "counters": self.counter_manager.get_manager_stats(),
@@ -5,6 +5,8 @@ import logging
 import time
 from typing import TYPE_CHECKING
 
+from .ttl_cache import ttl_snapshot
+
 if TYPE_CHECKING:
     from storage.swap_queue import SwapEventQueue
     from storage.postgres_client import PostgresClient
@@ -74,7 +76,9 @@ class SwapFlusher:
             self.metrics.inc("swap_flush_total", count)
 
         if count > 0:
-            logger.debug(f"Flushed {count} swaps in {elapsed*1000:.1f}ms (pending: {self.queue.pending})")
+            logger.debug(
+                "Flushed %d swaps in %.1fms (pending: %d)", count, elapsed * 1000, self.queue.pending
+            )
 
     async def _flush_all(self):
         """Flush all remaining events (called on shutdown)."""
@@ -94,8 +98,9 @@ class SwapFlusher:
         """Stop the flusher gracefully."""
         self._running = False
 
+    @ttl_snapshot(1.0)
     def stats(self) -> dict:
-        """Get flusher statistics."""
+        """Get flusher statistics (snapshot, refreshed at most once a second)."""
         return {
             "running": self._running,
             "total_flushed": self._total_flushed,
@@ -1,11 +1,40 @@
 """Simple TTL cache for reducing Redis round-trips."""
 
+import functools
+import heapq
 import time
-from typing import Any, Dict, Optional, TypeVar, Generic
+from typing import Any, Callable, Dict, Optional, TypeVar, Generic
 
 T = TypeVar('T')
 
 
+def ttl_snapshot(ttl: float) -> Callable:
+    """
+    Cache a no-argument stats method's result on the instance for ttl seconds.
+
+    Repeated scrapes within the window share one snapshot instead of
+    rebuilding nested stats dicts; treat the returned dict as read-only.
+    """
+    ttl_ns = int(ttl * 1e9)
+
+    def decorator(method: Callable[[Any], T]) -> Callable[[Any], T]:
+        attr = f"_snapshot_{method.__name__}"
+
+        @functools.wraps(method)
+        def wrapper(self) -> T:
+            now = time.monotonic_ns()
+            cached = self.__dict__.get(attr)
+            if cached is not None and now < cached[0]:
+                return cached[1]
+            value = method(self)
+            self.__dict__[attr] = (now + ttl_ns, value)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
 class TTLCache(Generic[T]):
     """
     In-memory TTL cache for reducing Redis round-trips.
@@ -15,39 +44,44 @@ class TTLCache(Generic[T]):
 
     def __init__(self, ttl: float = 3.0, max_size: int = 10000):
         self.ttl = ttl
+        self._ttl_ns = int(ttl * 1e9)
         self.max_size = max_size
-        self._data: Dict[str, tuple[T, float]] = {}  # key -> (value, expires_at)
+        # Values and expiries kept in parallel dicts (no per-entry tuple)
+        self._values: Dict[str, T] = {}
+        self._expiry: Dict[str, int] = {}  # key -> expires_at (monotonic ns)
         self._hits = 0
         self._misses = 0
 
     def get(self, key: str) -> Optional[T]:
         """Get value if exists and not expired."""
-        item = self._data.get(key)
-        if item is None:
+        expires_at = self._expiry.get(key)
+        if expires_at is None:
             self._misses += 1
             return None
 
-        value, expires_at = item
-        if expires_at < time.time():
-            del self._data[key]
+        if expires_at < time.monotonic_ns():
+            del self._expiry[key]
+            del self._values[key]
             self._misses += 1
             return None
 
         self._hits += 1
-        return value
+        return self._values[key]
 
     def set(self, key: str, value: T, ttl: Optional[float] = None):
         """Set value with optional custom TTL."""
         # Evict if at max size
-        if len(self._data) >= self.max_size:
+        if len(self._expiry) >= self.max_size:
             self._evict_expired()
 
-        actual_ttl = ttl if ttl is not None else self.ttl
-        self._data[key] = (value, time.time() + actual_ttl)
+        ttl_ns = int(ttl * 1e9) if ttl is not None else self._ttl_ns
+        self._values[key] = value
+        self._expiry[key] = time.monotonic_ns() + ttl_ns
 
     def delete(self, key: str):
         """Delete a key."""
-        self._data.pop(key, None)
+        self._values.pop(key, None)
+        self._expiry.pop(key, None)
 
     def contains(self, key: str) -> bool:
         """Check if key exists and is not expired."""
@@ -55,51 +89,56 @@ class TTLCache(Generic[T]):
 
     def set_many(self, items: Dict[str, T], ttl: Optional[float] = None):
         """Set multiple values at once."""
-        actual_ttl = ttl if ttl is not None else self.ttl
-        expires_at = time.time() + actual_ttl
-        for key, value in items.items():
-            self._data[key] = (value, expires_at)
+        ttl_ns = int(ttl * 1e9) if ttl is not None else self._ttl_ns
+        self._values.update(items)
+        self._expiry.update(dict.fromkeys(items, time.monotonic_ns() + ttl_ns))
 
     def get_many(self, keys: list) -> Dict[str, T]:
         """Get multiple values, returns dict of found keys."""
         result = {}
-        now = time.time()
+        now = time.monotonic_ns()
+        expiry = self._expiry
+        values = self._values
         for key in keys:
-            item = self._data.get(key)
-            if item:
-                value, expires_at = item
-                if expires_at >= now:
-                    result[key] = value
-                    self._hits += 1
-                else:
-                    del self._data[key]
-                    self._misses += 1
+            expires_at = expiry.get(key)
+            if expires_at is None:
+                self._misses += 1
+            elif expires_at >= now:
+                result[key] = values[key]
+                self._hits += 1
             else:
+                del expiry[key]
+                del values[key]
                 self._misses += 1
         return result
 
     def _evict_expired(self):
         """Remove expired entries."""
-        now = time.time()
-        to_delete = [k for k, (_, exp) in self._data.items() if exp < now]
+        now = time.monotonic_ns()
+        expiry = self._expiry
+        to_delete = [k for k, exp in expiry.items() if exp < now]
         for k in to_delete:
-            del self._data[k]
+            del expiry[k]
+            del self._values[k]
 
-        # If still too big, evict oldest
-        if len(self._data) >= self.max_size:
-            sorted_keys = sorted(self._data.keys(), key=lambda k: self._data[k][1])
-            for k in sorted_keys[:len(self._data) // 4]:
-                del self._data[k]
+        # Unless the sweep freed a quarter of the space, evict the entries
+        # expiring soonest down to that level (partial selection, no full sort)
+        excess = len(expiry) - (self.max_size - self.max_size // 4)
+        if excess > 0:
+            for k in heapq.nsmallest(excess, expiry, key=expiry.__getitem__):
+                del expiry[k]
+                del self._values[k]
 
     def clear(self):
         """Clear all entries."""
-        self._data.clear()
+        self._values.clear()
+        self._expiry.clear()
 
     def stats(self) -> dict:
         """Get cache statistics."""
         hit_rate = self._hits / (self._hits + self._misses) if (self._hits + self._misses) > 0 else 0
         return {
-            "size": len(self._data),
+            "size": len(self._expiry),
             "hits": self._hits,
             "misses": self._misses,
             "hit_rate": hit_rate,
@@ -116,8 +155,9 @@ class HotTokenCache:
 
     def __init__(self, ttl: float = 5.0):
         self.ttl = ttl
+        self._ttl_ns = int(ttl * 1e9)
         self._tokens: set = set()
-        self._last_refresh: float = 0
+        self._refresh_due: int = 0  # monotonic ns; 0 forces the first refresh
         self._pending_refresh: bool = False
 
     def is_hot(self, mint: str) -> Optional[bool]:
@@ -127,14 +167,14 @@ class HotTokenCache:
         Returns:
             True/False if cache is fresh, None if needs refresh.
         """
-        if time.time() - self._last_refresh > self.ttl:
+        if time.monotonic_ns() > self._refresh_due:
             return None  # Cache stale, need refresh
         return mint in self._tokens
 
     def update(self, hot_tokens: set):
         """Update the hot token set."""
         self._tokens = hot_tokens
-        self._last_refresh = time.time()
+        self._refresh_due = time.monotonic_ns() + self._ttl_ns
 
     def add(self, mint: str):
         """Add a token to the HOT set (local only)."""
@@ -142,8 +182,17 @@ class HotTokenCache:
 
     def needs_refresh(self) -> bool:
         """Check if cache needs refresh."""
-        return time.time() - self._last_refresh > self.ttl
+        return time.monotonic_ns() > self._refresh_due
 
     def get_all(self) -> set:
         """Get all cached HOT tokens."""
         return self._tokens.copy()
+
+    def shared(self) -> set:
+        """
+        Get the live HOT token set without copying.
+
+        update() swaps in a new set rather than mutating this one, so holders
+        keep a consistent snapshot; add() still writes through to it.
+        """
+        return self._tokens
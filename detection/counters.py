@@ -3,6 +3,8 @@
 import asyncio
 import logging
 import time
+from array import array
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Set, Tuple
 
@@ -10,8 +12,28 @@ from storage.redis_client import RedisClient
 
 logger = logging.getLogger(__name__)
 
+# Mints whose concentration/new-wallet figures are fetched at once
+STATS_BUILD_CONCURRENCY = 32
 
-@dataclass
+# Top buyers checked for first-seen age; the top 3 of the same read give
+# the concentration figure
+NEW_WALLET_SAMPLE = 100
+
+# Trigger field name (without window suffix) -> TokenStats attribute
+STAT_FIELDS: Dict[str, str] = {
+    "buy_count": "buy_count",
+    "sell_count": "sell_count",
+    "unique_buyers": "unique_buyers",
+    "unique_sellers": "unique_sellers",
+    "buy_volume_sol": "volume_sol",
+    "avg_buy_size": "avg_buy_size",
+    "buy_sell_ratio": "buy_sell_ratio",
+    "top_3_buyers_volume_share": "top_3_volume_share",
+    "new_wallet_pct": "new_wallet_pct",
+}
+
+
+@dataclass(slots=True)
 class TokenStats:
     """Token activity statistics for a time window."""
     mint: str
@@ -52,36 +74,44 @@ class CounterManager:
     - Unique buyers/sellers (HyperLogLog)
     - Volume per time window
     - Per-wallet volumes for concentration analysis
+    - Active mints (sorted set of last swap time, shared across workers)
     """
 
-    def __init__(self, redis_client: RedisClient):
+    def __init__(self, redis_client: RedisClient, cache_size: int = 10000):
         self.redis = redis_client
-        self._active_mints: Set[str] = set()
-        self._stats_cache: Dict[str, TokenStats] = {}
+        self._active_count = 0  # Size of the active set when last read
         self._cache_ttl = 1.0  # Cache stats for 1 second
-        self._last_cache_time: Dict[str, float] = {}
+        self._cache_ttl_ns = int(self._cache_ttl * 1e9)
+        self._cache_size = cache_size
+        # (mint, window) -> (expires_at monotonic ns, stats), in LRU order
+        self._stats_cache: "OrderedDict[Tuple[str, int], Tuple[int, TokenStats]]" = OrderedDict()
+        # Concurrent misses for the same (mint, window) share one fetch
+        self._inflight: Dict[Tuple[str, int], asyncio.Future] = {}
 
     async def record_swap(
         self,
         mint: str,
         user_wallet: str,
         quote_amount_sol: float,
-        side: str = "buy"
+        side: str = "buy",
+        pipe=None,
     ):
-        """Record a swap event in the rolling counters."""
-        self._active_mints.add(mint)
+        """
+        Record a swap event in the rolling counters.
 
+        With a pipe the counter writes are only queued; execute the pipe
+        before reading stats. Cached stats are not invalidated, so reads
+        may trail the counters by up to the cache TTL.
+        """
+        # Also marks the mint active
         await self.redis.increment_counters(
             mint=mint,
             user_wallet=user_wallet,
             quote_amount_sol=quote_amount_sol,
             side=side,
+            pipe=pipe,
         )
 
-        # Invalidate cache for this mint
-        if mint in self._last_cache_time:
-            del self._last_cache_time[mint]
-
     async def get_stats(
         self,
         mint: str,
@@ -92,20 +122,160 @@ class CounterManager:
 
         Uses caching to reduce Redis queries.
         """
-        cache_key = f"{mint}:{window_seconds}"
-        now = time.time()
+        cached = self._cache_get(mint, window_seconds, time.monotonic_ns())
+        if cached is not None:
+            return cached
+
+        # Join a fetch already in flight for this mint and window
+        key = (mint, window_seconds)
+        future = self._inflight.get(key)
+        if future is not None:
+            return await asyncio.shield(future)
+
+        future = self._start_fetch(key)
+        try:
+            raw_stats = await self.redis.get_rolling_stats(mint, window_seconds)
+            stats = await self._build_stats(mint, window_seconds, raw_stats)
+        except BaseException as e:
+            self._finish_fetch(key, error=e)
+            raise
+        self._finish_fetch(key, stats)
+        return stats
+
+    async def get_stats_many(
+        self,
+        mints: List[str],
+        window_seconds: int = 300
+    ) -> Dict[str, TokenStats]:
+        """
+        Get statistics for many mints, fetching all uncached rolling
+        counters in one pipelined round-trip.
+
+        Mints already being fetched elsewhere are awaited rather than
+        refetched. Mints whose stats fail to build are logged and omitted.
+        """
+        now = time.monotonic_ns()
+        results: Dict[str, TokenStats] = {}
+        missing = []
+        joined = []
+
+        for mint in mints:
+            cached = self._cache_get(mint, window_seconds, now)
+            if cached is not None:
+                results[mint] = cached
+            elif (mint, window_seconds) in self._inflight:
+                joined.append(mint)
+            else:
+                missing.append(mint)
+
+        if missing:
+            keys = [(mint, window_seconds) for mint in missing]
+            for key in keys:
+                self._start_fetch(key)
+            try:
+                raw_by_mint = await self.redis.pipeline_get_stats(missing, window_seconds)
+            except BaseException as e:
+                for key in keys:
+                    self._finish_fetch(key, error=e)
+                raise
 
-        # Check cache
-        if cache_key in self._stats_cache:
-            if now - self._last_cache_time.get(cache_key, 0) < self._cache_ttl:
-                return self._stats_cache[cache_key]
+            semaphore = asyncio.Semaphore(STATS_BUILD_CONCURRENCY)
 
-        # Fetch from Redis
-        raw_stats = await self.redis.get_rolling_stats(mint, window_seconds)
+            async def build(mint: str) -> TokenStats:
+                async with semaphore:
+                    return await self._build_stats(
+                        mint, window_seconds, raw_by_mint[mint]
+                    )
 
-        # Get top buyers for concentration
+            try:
+                outcomes = await asyncio.gather(
+                    *(build(mint) for mint in missing), return_exceptions=True
+                )
+            except BaseException as e:
+                for key in keys:
+                    self._finish_fetch(key, error=e)
+                raise
+
+            for key, outcome in zip(keys, outcomes):
+                if isinstance(outcome, BaseException):
+                    self._finish_fetch(key, error=outcome)
+                    logger.error(f"Failed to get stats for {key[0]}: {outcome}")
+                    continue
+                self._finish_fetch(key, outcome)
+                results[key[0]] = outcome
+
+        for mint in joined:
+            future = self._inflight.get((mint, window_seconds))
+            if future is None:
+                # Finished while we were fetching the rest
+                cached = self._cache_get(mint, window_seconds, time.monotonic_ns())
+                if cached is not None:
+                    results[mint] = cached
+                continue
+            try:
+                results[mint] = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to get stats for {mint}: {e}")
+
+        return results
+
+    def _start_fetch(self, key: Tuple[str, int]) -> asyncio.Future:
+        """Register an in-flight stats fetch that concurrent readers can await."""
+        future = asyncio.get_running_loop().create_future()
+        # Mark any error retrieved so an unawaited failure isn't reported
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+        return future
+
+    def _finish_fetch(
+        self,
+        key: Tuple[str, int],
+        stats: Optional[TokenStats] = None,
+        error: Optional[BaseException] = None,
+    ):
+        """Resolve and deregister an in-flight fetch (no-op if already done)."""
+        future = self._inflight.pop(key, None)
+        if future is None or future.done():
+            return
+        if isinstance(error, asyncio.CancelledError):
+            future.cancel()
+        elif error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(stats)
+
+    async def get_stats_matrix(
+        self,
+        mints: List[str],
+        window_seconds: int = 300
+    ) -> Tuple[List[str], Dict[str, array]]:
+        """
+        Get statistics for many mints as columns.
+
+        Returns the mints that have stats, in input order, and one float
+        column per STAT_FIELDS name with a row per returned mint.
+        """
+        by_mint = await self.get_stats_many(mints, window_seconds)
+        rows = [mint for mint in mints if mint in by_mint]
+        stats = [by_mint[mint] for mint in rows]
+        columns = {
+            name: array("d", [getattr(s, attr) for s in stats])
+            for name, attr in STAT_FIELDS.items()
+        }
+        return rows, columns
+
+    async def _build_stats(
+        self,
+        mint: str,
+        window_seconds: int,
+        raw_stats: Dict[str, Any],
+    ) -> TokenStats:
+        """Add concentration and new-wallet figures to raw counters and cache the result."""
+        # One read of the top buyers serves concentration and new wallets
         top_buyers = await self.redis.get_top_buyers_volume(
-            mint, window_seconds, top_n=3
+            mint, window_seconds, top_n=NEW_WALLET_SAMPLE
         )
 
         # Calculate top 3 volume share
@@ -114,7 +284,7 @@ class CounterManager:
         top_3_share = top_3_volume / total_volume if total_volume > 0 else 0
 
         # Calculate new wallet percentage
-        new_wallet_count = await self._count_new_wallets(mint, window_seconds)
+        new_wallet_count = await self._count_new_wallets(top_buyers, window_seconds)
         unique_buyers = raw_stats.get("unique_buyers", 0)
         new_wallet_pct = new_wallet_count / unique_buyers if unique_buyers > 0 else 0
 
@@ -128,81 +298,71 @@ class CounterManager:
             volume_sol=raw_stats.get("volume_sol", 0),
             avg_buy_size=raw_stats.get("avg_buy_size", 0),
             buy_sell_ratio=raw_stats.get("buy_sell_ratio", 0),
-            top_buyers_volume=top_buyers,
+            top_buyers_volume=top_buyers[:3],
             top_3_volume_share=top_3_share,
             new_wallet_count=new_wallet_count,
             new_wallet_pct=new_wallet_pct,
         )
 
-        # Update cache
-        self._stats_cache[cache_key] = stats
-        self._last_cache_time[cache_key] = now
-
+        self._cache_put(mint, window_seconds, stats)
         return stats
 
+    def _cache_get(self, mint: str, window_seconds: int, now: int) -> Optional[TokenStats]:
+        """Return cached stats if still fresh at now (monotonic ns)."""
+        key = (mint, window_seconds)
+        entry = self._stats_cache.get(key)
+        if entry is None or entry[0] <= now:
+            return None
+        self._stats_cache.move_to_end(key)
+        return entry[1]
+
+    def _cache_put(self, mint: str, window_seconds: int, stats: TokenStats):
+        """Cache stats, evicting the least recently used entries past cache_size."""
+        key = (mint, window_seconds)
+        cache = self._stats_cache
+        cache[key] = (time.monotonic_ns() + self._cache_ttl_ns, stats)
+        cache.move_to_end(key)
+        while len(cache) > self._cache_size:
+            cache.popitem(last=False)
+
     async def _count_new_wallets(
         self,
-        mint: str,
+        top_buyers: List[Tuple[str, float]],
         window_seconds: int
     ) -> int:
-        """Count wallets first seen within the window."""
-        # This is expensive - simplified implementation
+        """Count top buyers first seen within the window."""
+        # Simplified: only the top buyers are checked
         # In production, track new wallets per bucket
-
-        top_buyers = await self.redis.get_top_buyers_volume(
-            mint, window_seconds, top_n=100
-        )
+        if not top_buyers:
+            return 0
 
         now = int(time.time())
-        new_count = 0
-
-        for wallet, _ in top_buyers:
-            first_seen = await self.redis.get_wallet_first_seen(wallet)
-            if first_seen and (now - first_seen) <= window_seconds:
-                new_count += 1
+        first_seen = await self.redis.mget_wallet_first_seen(
+            [wallet for wallet, _ in top_buyers]
+        )
 
-        return new_count
+        return sum(1 for ts in first_seen if ts and (now - ts) <= window_seconds)
 
-    async def get_active_mints(self) -> Set[str]:
-        """Get mints with recent activity."""
-        return self._active_mints.copy()
+    async def get_active_mints(self, window_seconds: int = 3600) -> Set[str]:
+        """Get mints with swap activity within the window (shared via Redis)."""
+        active = await self.redis.get_active_mints(window_seconds)
+        self._active_count = len(active)
+        return active
 
     async def get_all_stats_5m(self) -> Dict[str, TokenStats]:
         """Get 5-minute stats for all active mints."""
-        results = {}
-
-        for mint in list(self._active_mints):
-            try:
-                stats = await self.get_stats(mint, 300)
-                results[mint] = stats
-            except Exception as e:
-                logger.error(f"Failed to get stats for {mint}: {e}")
-
-        return results
+        return await self.get_stats_many(list(await self.get_active_mints()), 300)
 
     async def cleanup_inactive(self, max_age_seconds: int = 3600):
         """Remove mints without recent activity from tracking."""
-        # Get mints with zero recent activity
-        inactive = []
-
-        for mint in list(self._active_mints):
-            stats = await self.get_stats(mint, max_age_seconds)
-            if stats.buy_count == 0 and stats.sell_count == 0:
-                inactive.append(mint)
-
-        for mint in inactive:
-            self._active_mints.discard(mint)
-            # Clear cache
-            for key in list(self._stats_cache.keys()):
-                if key.startswith(mint):
-                    del self._stats_cache[key]
-
-        if inactive:
-            logger.info(f"Cleaned up {len(inactive)} inactive mints")
+        removed = await self.redis.remove_inactive_mints(max_age_seconds)
+        if removed:
+            logger.info(f"Cleaned up {removed} inactive mints")
 
     def get_manager_stats(self) -> dict:
         """Get counter manager statistics."""
         return {
-            "active_mints": len(self._active_mints),
+            "active_mints": self._active_count,
             "cache_size": len(self._stats_cache),
+            "stats_inflight": len(self._inflight),
         }
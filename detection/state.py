@@ -2,16 +2,23 @@
 
 import asyncio
 import logging
-from datetime import datetime
-from typing import Callable, Dict, List, Optional, Set
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
-from models.profiles import TokenProfile, TokenState
+from models.profiles import TokenState
 from storage.redis_client import RedisClient
 from storage.postgres_client import PostgresClient
 from storage.delta_log import DeltaLog
 
 logger = logging.getLogger(__name__)
 
+# Tokens backfilled from the delta log at once
+BACKFILL_CONCURRENCY = 4
+
+# Most new-WARM tokens written to Postgres per flush
+WARM_FLUSH_BATCH = 1000
+
 
 class StateManager:
     """
@@ -35,6 +42,7 @@ class StateManager:
         delta_log: DeltaLog,
         hot_ttl_seconds: int = 3600,
         warm_ttl_seconds: int = 1800,
+        state_cache_size: int = 50000,
     ):
         self.redis = redis_client
         self.postgres = postgres_client
@@ -42,47 +50,104 @@ class StateManager:
         self.hot_ttl = hot_ttl_seconds
         self.warm_ttl = warm_ttl_seconds
 
-        self._state_cache: Dict[str, TokenState] = {}
+        # mint -> state in LRU order, capped at state_cache_size; evicted
+        # mints fall back to Redis/Postgres in get_state
+        self._state_cache: "OrderedDict[str, TokenState]" = OrderedDict()
+        self._state_cache_size = state_cache_size
+        # Cached mints per state, kept in step with _state_cache
+        self._state_counts: Dict[TokenState, int] = dict.fromkeys(TokenState, 0)
         self._hot_callbacks: List[Callable] = []
         self._backfill_queue: asyncio.Queue = asyncio.Queue()
+        # (mint, unix seconds) for new WARM tokens awaiting the Postgres write
+        self._warm_queue: asyncio.Queue = asyncio.Queue()
 
     async def get_state(self, mint: str) -> TokenState:
         """Get current token state."""
-        # Check cache first
-        if mint in self._state_cache:
-            return self._state_cache[mint]
+        # Check cache first (single lookup; str hashes are cached on the mint)
+        state = self._state_cache.get(mint)
+        if state is not None:
+            self._state_cache.move_to_end(mint)
+            return state
 
         # Check Redis for HOT
         if await self.redis.is_token_hot(mint):
-            self._state_cache[mint] = TokenState.HOT
+            self._cache_state(mint, TokenState.HOT)
             return TokenState.HOT
 
         # Check Postgres
         profile = await self.postgres.get_token_profile(mint)
         if profile:
-            self._state_cache[mint] = profile.state
+            self._cache_state(mint, profile.state)
             return profile.state
 
         # Default to COLD
         return TokenState.COLD
 
+    def _cache_state(self, mint: str, state: TokenState):
+        """Cache a mint's state, evicting the least recently used past the cap."""
+        cache = self._state_cache
+        counts = self._state_counts
+        previous = cache.get(mint)
+        if previous is not None:
+            counts[previous] -= 1
+        cache[mint] = state
+        cache.move_to_end(mint)
+        counts[state] += 1
+        while len(cache) > self._state_cache_size:
+            _, evicted = cache.popitem(last=False)
+            counts[evicted] -= 1
+
+    def _uncache_state(self, mint: str):
+        """Drop a mint's cached state."""
+        state = self._state_cache.pop(mint, None)
+        if state is not None:
+            self._state_counts[state] -= 1
+
     async def transition_to_warm(self, mint: str):
-        """Transition token to WARM state (first activity)."""
+        """
+        Transition token to WARM state (first activity).
+
+        The Postgres profile write is queued for run_warm_flusher rather
+        than awaited here.
+        """
         current = await self.get_state(mint)
 
         if current == TokenState.COLD:
-            self._state_cache[mint] = TokenState.WARM
+            self._cache_state(mint, TokenState.WARM)
+            self._warm_queue.put_nowait((mint, int(time.time())))
 
-            # Create or update profile in Postgres
-            profile = TokenProfile(
-                mint=mint,
-                state=TokenState.WARM,
-                first_seen=datetime.utcnow(),
-                last_seen=datetime.utcnow(),
-            )
-            await self.postgres.upsert_token_profile(profile)
+            logger.debug("Token %s... transitioned to WARM", mint[:8])
 
-            logger.debug(f"Token {mint[:8]}... transitioned to WARM")
+    async def run_warm_flusher(self, interval_seconds: float = 1.0):
+        """Periodically write queued WARM transitions to Postgres in batches."""
+        while True:
+            try:
+                await asyncio.sleep(interval_seconds)
+                await self._flush_warm()
+            except asyncio.CancelledError:
+                # Don't lose queued transitions on shutdown
+                try:
+                    await self._flush_warm()
+                except Exception as e:
+                    logger.error(f"Failed to flush WARM tokens on shutdown: {e}")
+                break
+            except Exception as e:
+                logger.error(f"WARM flush error: {e}")
+
+    async def _flush_warm(self):
+        """Write all queued WARM transitions, WARM_FLUSH_BATCH rows per call."""
+        queue = self._warm_queue
+        while not queue.empty():
+            batch: List[Tuple[str, int]] = []
+            while len(batch) < WARM_FLUSH_BATCH and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                await self.postgres.upsert_warm_tokens(batch)
+            except Exception:
+                # Requeue so the next flush retries them
+                for row in batch:
+                    queue.put_nowait(row)
+                raise
 
     async def transition_to_hot(
         self,
@@ -106,7 +171,7 @@ class StateManager:
             return
 
         # Update state
-        self._state_cache[mint] = TokenState.HOT
+        self._cache_state(mint, TokenState.HOT)
 
         # Mark HOT in Redis (with expiry)
         await self.redis.mark_token_hot(mint, self.hot_ttl)
@@ -129,7 +194,7 @@ class StateManager:
 
     async def transition_to_cold(self, mint: str):
         """Transition token back to COLD (HOT expired)."""
-        self._state_cache[mint] = TokenState.COLD
+        self._cache_state(mint, TokenState.COLD)
         await self.postgres.update_token_state(mint, TokenState.COLD)
         logger.debug(f"Token {mint[:8]}... transitioned to COLD")
 
@@ -151,16 +216,36 @@ class StateManager:
         self._hot_callbacks.append(callback)
 
     async def process_backfill_queue(self, processor: Callable):
-        """Process backfill queue for newly HOT tokens."""
-        while True:
+        """
+        Process backfill queue for newly HOT tokens.
+
+        processor is awaited with each token's list of TxDeltaRecords and
+        returns the number of swaps it produced. Up to BACKFILL_CONCURRENCY
+        tokens are backfilled at once, so a burst of HOT transitions doesn't
+        wait on each token's backfill in turn.
+        """
+        semaphore = asyncio.Semaphore(BACKFILL_CONCURRENCY)
+        running: Set[asyncio.Task] = set()
+
+        async def backfill(mint: str):
             try:
-                mint = await self._backfill_queue.get()
                 await self._backfill_token(mint, processor)
-                self._backfill_queue.task_done()
-            except asyncio.CancelledError:
-                break
             except Exception as e:
-                logger.error(f"Backfill error: {e}")
+                logger.error(f"Backfill error for {mint[:8]}: {e}")
+            finally:
+                semaphore.release()
+                self._backfill_queue.task_done()
+
+        try:
+            while True:
+                await semaphore.acquire()
+                mint = await self._backfill_queue.get()
+                task = asyncio.create_task(backfill(mint))
+                running.add(task)
+                task.add_done_callback(running.discard)
+        except asyncio.CancelledError:
+            for task in list(running):
+                task.cancel()
 
     async def _backfill_token(self, mint: str, processor: Callable):
         """Backfill swap events from delta log for a token."""
@@ -169,15 +254,10 @@ class StateManager:
         # Read recent delta records for this mint
         records = await self.delta_log.read_for_mint(mint)
 
-        processed = 0
-        for record in records:
-            try:
-                await processor(record)
-                processed += 1
-            except Exception as e:
-                logger.error(f"Backfill record error: {e}")
+        # processor takes the whole batch (e.g. reprocess_delta_records)
+        swaps = await processor(records)
 
-        logger.info(f"Backfill complete for {mint[:8]}: {processed} records")
+        logger.info(f"Backfill complete for {mint[:8]}: {len(records)} records, {swaps} swaps")
 
     async def refresh_hot_tokens(self):
         """Refresh HOT token TTLs and cleanup expired."""
@@ -187,7 +267,7 @@ class StateManager:
             if not await self.redis.is_token_hot(mint):
                 # Token expired
                 await self.transition_to_cold(mint)
-                self._state_cache.pop(mint, None)
+                self._uncache_state(mint)
 
     async def start_maintenance_loop(self, interval_seconds: int = 60):
         """Start periodic maintenance loop."""
@@ -202,12 +282,13 @@ class StateManager:
 
     def get_stats(self) -> dict:
         """Get state manager statistics."""
-        state_counts = {}
-        for state in list(self._state_cache.values()):
-            state_counts[state.value] = state_counts.get(state.value, 0) + 1
+        state_counts = {
+            state.value: count for state, count in self._state_counts.items() if count
+        }
 
         return {
             "cached_tokens": len(self._state_cache),
             "state_counts": state_counts,
             "backfill_queue_size": self._backfill_queue.qsize(),
+            "warm_queue_size": self._warm_queue.qsize(),
         }
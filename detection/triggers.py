@@ -2,17 +2,18 @@
 
 import asyncio
 import logging
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 import yaml
 
-from .counters import CounterManager, TokenStats
+from .counters import STAT_FIELDS, CounterManager, TokenStats
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TriggerResult:
     """Result of trigger evaluation."""
     triggered: bool
@@ -21,19 +22,128 @@ class TriggerResult:
     stats: TokenStats
 
 
-@dataclass
+# Flat layout of the stats seen by trigger conditions: every STAT_FIELDS
+# name with a _5m and a _1h suffix, plus one trailing slot that is always
+# 0.0 and stands in for any field that isn't tracked.
+FIELD_NAMES = tuple(
+    f"{name}_{suffix}" for suffix in ("5m", "1h") for name in STAT_FIELDS
+)
+FIELD_INDEX: Dict[str, int] = {name: i for i, name in enumerate(FIELD_NAMES)}
+MISSING_FIELD_INDEX = len(FIELD_NAMES)
+
+
+def stats_vector(values: Dict[str, float]) -> array:
+    """Lay out named stats as a vector indexed by FIELD_INDEX."""
+    vector = array("d", bytes(8 * (MISSING_FIELD_INDEX + 1)))
+    for name, value in values.items():
+        idx = FIELD_INDEX.get(name)
+        if idx is not None:
+            vector[idx] = value
+    return vector
+
+
+@dataclass(slots=True)
 class TriggerCondition:
     """A single trigger condition."""
     field: str
     operator: str  # >=, >, <=, <, ==
     value: float
+    idx: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.idx = FIELD_INDEX.get(self.field, MISSING_FIELD_INDEX)
+
+
+CONDITION_OPERATORS = (">=", "<=", "==", ">", "<")
+
+
+def _condition_terms(
+    conditions: List[TriggerCondition], namespace: Dict[str, Any], operand: str
+) -> str:
+    """Bind thresholds into namespace and return the AND-ed comparison source."""
+    terms = []
+    for i, cond in enumerate(conditions):
+        if cond.operator not in CONDITION_OPERATORS:
+            raise ValueError(f"Unsupported operator: {cond.operator!r}")
+        namespace[f"v{i}"] = cond.value
+        terms.append(f"{operand.format(idx=cond.idx)} {cond.operator} v{i}")
+    return " and ".join(terms) or "True"
+
+
+def compile_conditions(
+    conditions: List[TriggerCondition],
+) -> Callable[[Sequence[float]], bool]:
+    """
+    Compile AND-ed conditions into one predicate over a stats vector.
+
+    Generates straight-line code such as
+    ``stats[0] >= v0 and stats[4] > v1`` so each evaluation is a single
+    function call rather than a loop with an operator ladder. Only field
+    indices and operators from a fixed set are emitted; thresholds are
+    bound by name, so config text is never executed.
+    """
+    namespace: Dict[str, Any] = {}
+    expr = _condition_terms(conditions, namespace, "stats[{idx}]")
+    source = f"def predicate(stats):\n    return {expr}\n"
+    exec(compile(source, "<trigger>", "exec"), namespace)
+    return namespace["predicate"]
+
 
+def compile_selector(
+    conditions: List[TriggerCondition],
+) -> Callable[[Sequence[Sequence[float]], Iterable[int]], List[int]]:
+    """
+    Compile AND-ed conditions into a row filter over stat columns.
 
-@dataclass
+    The selector takes one column per FIELD_INDEX slot and the candidate
+    row indices, and returns the indices whose rows satisfy every
+    condition. Same code generation rules as compile_conditions.
+    """
+    namespace: Dict[str, Any] = {}
+    expr = _condition_terms(conditions, namespace, "cols[{idx}][i]")
+    source = f"def select(cols, rows):\n    return [i for i in rows if {expr}]\n"
+    exec(compile(source, "<trigger>", "exec"), namespace)
+    return namespace["select"]
+
+
+def primary_gate(conditions: List[TriggerCondition]) -> Optional[TriggerCondition]:
+    """
+    Pick the condition used to rule a trigger out cheaply.
+
+    Prefers the first lower bound (>=, >) on a count field, since quiet
+    mints fail those immediately, then the first lower bound of any kind.
+    Returns None if the trigger has no lower bound.
+    """
+    lower_bounds = [c for c in conditions if c.operator in (">=", ">")]
+    for cond in lower_bounds:
+        if "count" in cond.field or cond.field.startswith("unique_"):
+            return cond
+    return lower_bounds[0] if lower_bounds else None
+
+
+@dataclass(slots=True)
 class Trigger:
     """A trigger definition with multiple conditions."""
     name: str
     conditions: List[TriggerCondition]
+    matches: Callable[[Sequence[float]], bool] = field(
+        init=False, repr=False, compare=False
+    )
+    select: Callable[..., List[int]] = field(
+        init=False, repr=False, compare=False
+    )
+    gate: Optional[TriggerCondition] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        # Check the gate first so the compiled code short-circuits on it
+        self.gate = primary_gate(self.conditions)
+        ordered = self.conditions
+        if self.gate is not None:
+            ordered = [self.gate] + [c for c in self.conditions if c is not self.gate]
+        self.matches = compile_conditions(ordered)
+        self.select = compile_selector(ordered)
 
 
 class TriggerEvaluator:
@@ -57,9 +167,16 @@ class TriggerEvaluator:
         self.redis = redis_client
         self._triggers_5m: List[Trigger] = []
         self._triggers_1h: List[Trigger] = []
+        # All triggers in evaluation order as (window, trigger), with their
+        # gates indexed by field: idx -> [(threshold, strict, order)] ascending
+        self._ordered: List[Tuple[int, Trigger]] = []
+        self._gates: Dict[int, List[Tuple[float, bool, int]]] = {}
+        self._ungated: List[int] = []
         self._evaluations = 0
         self._triggers_fired = 0
         self._reload_lock = asyncio.Lock()
+        # Raw text the installed triggers were parsed from (skips no-op reloads)
+        self._config_raw: Optional[Union[str, bytes]] = None
         self._config_listener_task: Optional[asyncio.Task] = None
 
     async def start_config_listener(self):
@@ -93,17 +210,26 @@ class TriggerEvaluator:
         async with self._reload_lock:
             try:
                 config = None
+                raw = None
 
                 # Try Redis first
                 if self.redis:
                     raw = await self.redis.get_config("thresholds")
                     if raw:
+                        if raw == self._config_raw:
+                            logger.debug("Config in Redis unchanged, keeping triggers")
+                            return
                         config = yaml.safe_load(raw)
                         logger.debug("Loaded config from Redis")
 
                 # Fall back to file
                 if not config:
-                    config = self._load_yaml_file()
+                    raw = self._read_config_file()
+                    if raw is not None and raw == self._config_raw:
+                        logger.debug("Config file unchanged, keeping triggers")
+                        return
+                    config = yaml.safe_load(raw) if raw else None
+                    config = config or {"triggers": []}
                     logger.debug("Loaded config from file")
 
                 # Parse into new lists
@@ -124,8 +250,8 @@ class TriggerEvaluator:
                             new_5m.append(trigger)
 
                 # Atomic swap
-                self._triggers_5m = new_5m
-                self._triggers_1h = new_1h
+                self._set_triggers(new_5m, new_1h)
+                self._config_raw = raw
 
                 logger.info(
                     f"Reloaded {len(new_5m)} 5m and {len(new_1h)} 1h triggers"
@@ -134,23 +260,24 @@ class TriggerEvaluator:
             except Exception as e:
                 logger.error(f"Failed to reload config: {e}")
 
-    def _load_yaml_file(self) -> dict:
-        """Load config from YAML file."""
+    def _read_config_file(self) -> Optional[str]:
+        """Read the raw YAML config file, or None if it can't be read."""
         try:
             with open(self.config_file, "r") as f:
-                return yaml.safe_load(f)
+                return f.read()
         except Exception as e:
             logger.error(f"Failed to load config file: {e}")
-            return {"triggers": []}
+            return None
 
     async def load_config(self):
         """Load trigger configuration from file."""
         try:
             with open(self.config_file, "r") as f:
-                config = yaml.safe_load(f)
+                raw = f.read()
+            config = yaml.safe_load(raw)
 
-            self._triggers_5m = []
-            self._triggers_1h = []
+            triggers_5m = []
+            triggers_1h = []
 
             for trigger_def in config.get("triggers", []):
                 trigger = self._parse_trigger(trigger_def)
@@ -158,9 +285,12 @@ class TriggerEvaluator:
                     # Categorize by window
                     has_1h = any("_1h" in c.field for c in trigger.conditions)
                     if has_1h:
-                        self._triggers_1h.append(trigger)
+                        triggers_1h.append(trigger)
                     else:
-                        self._triggers_5m.append(trigger)
+                        triggers_5m.append(trigger)
+
+            self._set_triggers(triggers_5m, triggers_1h)
+            self._config_raw = raw
 
             logger.info(
                 f"Loaded {len(self._triggers_5m)} 5m triggers and "
@@ -171,6 +301,52 @@ class TriggerEvaluator:
             logger.error(f"Failed to load trigger config: {e}")
             raise
 
+    def _set_triggers(self, triggers_5m: List[Trigger], triggers_1h: List[Trigger]):
+        """Install trigger lists and rebuild the gate index over them."""
+        ordered = [(300, t) for t in triggers_5m] + [(3600, t) for t in triggers_1h]
+        gates: Dict[int, List[Tuple[float, bool, int]]] = {}
+        ungated = []
+        for order, (_, trigger) in enumerate(ordered):
+            gate = trigger.gate
+            if gate is None:
+                ungated.append(order)
+            else:
+                gates.setdefault(gate.idx, []).append((gate.value, gate.operator == ">", order))
+        for entries in gates.values():
+            entries.sort()
+
+        self._triggers_5m = triggers_5m
+        self._triggers_1h = triggers_1h
+        self._ordered = ordered
+        self._gates = gates
+        self._ungated = ungated
+
+    def _candidate_triggers(self, stats: Sequence[float]) -> List[int]:
+        """Evaluation-order positions of the triggers whose gate stats pass."""
+        candidates = list(self._ungated)
+        for idx, entries in self._gates.items():
+            value = stats[idx]
+            for threshold, strict, order in entries:
+                if value < threshold or (strict and value == threshold):
+                    break  # Thresholds ascend, so the rest fail too
+                candidates.append(order)
+        candidates.sort()
+        return candidates
+
+    def _candidate_rows(self, columns: Sequence[Sequence[float]], n: int) -> Sequence[int]:
+        """Rows that pass at least one trigger's gate (all rows if any trigger is ungated)."""
+        if self._ungated:
+            return range(n)
+        passing = set()
+        for idx, entries in self._gates.items():
+            threshold, strict, _ = entries[0]
+            col = columns[idx]
+            if strict:
+                passing.update([i for i in range(n) if col[i] > threshold])
+            else:
+                passing.update([i for i in range(n) if col[i] >= threshold])
+        return sorted(passing)
+
     def _parse_trigger(self, trigger_def: dict) -> Optional[Trigger]:
         """Parse a trigger definition from config."""
         name = trigger_def.get("name", "unknown")
@@ -189,14 +365,16 @@ class TriggerEvaluator:
 
     def _parse_condition(self, cond_str: str) -> Optional[TriggerCondition]:
         """Parse a condition string like 'buy_count_5m >= 20'."""
-        # Support operators: >=, >, <=, <, ==
-        for op in [">=", "<=", "==", ">", "<"]:
+        # Two-character operators first so ">=" isn't read as ">"
+        for op in CONDITION_OPERATORS:
             if op in cond_str:
                 parts = cond_str.split(op)
                 if len(parts) == 2:
                     field = parts[0].strip()
                     try:
                         value = float(parts[1].strip())
+                        if field not in FIELD_INDEX:
+                            logger.warning(f"Unknown condition field (reads as 0): {cond_str}")
                         return TriggerCondition(field=field, operator=op, value=value)
                     except ValueError:
                         logger.warning(f"Invalid condition value: {cond_str}")
@@ -214,117 +392,133 @@ class TriggerEvaluator:
         """
         self._evaluations += 1
 
-        # Get stats for both windows
-        stats_5m = await self.counters.get_stats(mint, 300)
-        stats_1h = await self.counters.get_stats(mint, 3600)
+        # Get stats for both windows concurrently
+        stats_5m, stats_1h = await asyncio.gather(
+            self.counters.get_stats(mint, 300),
+            self.counters.get_stats(mint, 3600),
+        )
 
-        # Build combined stats dict for evaluation
-        stats_dict = self._stats_to_dict(stats_5m, stats_1h)
+        # Build combined stats vector for evaluation
+        stats_vec = self._stats_vector(stats_5m, stats_1h)
 
-        # Evaluate 5-minute triggers first (faster detection)
-        for trigger in self._triggers_5m:
-            if self._evaluate_trigger(trigger, stats_dict):
+        # 5-minute triggers come first (faster detection), then 1-hour
+        # (slower stealth detection); only triggers whose gate passes run
+        for order in self._candidate_triggers(stats_vec):
+            window, trigger = self._ordered[order]
+            if self._evaluate_trigger(trigger, stats_vec):
                 self._triggers_fired += 1
-                reason = self._format_reason(trigger, stats_dict)
+                reason = self._format_reason(trigger, stats_vec)
                 return TriggerResult(
                     triggered=True,
                     trigger_name=trigger.name,
                     reason=reason,
-                    stats=stats_5m,
-                )
-
-        # Evaluate 1-hour triggers (slower stealth detection)
-        for trigger in self._triggers_1h:
-            if self._evaluate_trigger(trigger, stats_dict):
-                self._triggers_fired += 1
-                reason = self._format_reason(trigger, stats_dict)
-                return TriggerResult(
-                    triggered=True,
-                    trigger_name=trigger.name,
-                    reason=reason,
-                    stats=stats_1h,
+                    stats=stats_5m if window == 300 else stats_1h,
                 )
 
         return None
 
-    def _stats_to_dict(
+    def _stats_vector(
         self,
         stats_5m: TokenStats,
         stats_1h: TokenStats
-    ) -> Dict[str, float]:
-        """Convert stats to a flat dict for condition evaluation."""
-        return {
-            # 5-minute stats
-            "buy_count_5m": stats_5m.buy_count,
-            "sell_count_5m": stats_5m.sell_count,
-            "unique_buyers_5m": stats_5m.unique_buyers,
-            "unique_sellers_5m": stats_5m.unique_sellers,
-            "buy_volume_sol_5m": stats_5m.volume_sol,
-            "avg_buy_size_5m": stats_5m.avg_buy_size,
-            "buy_sell_ratio_5m": stats_5m.buy_sell_ratio,
-            "top_3_buyers_volume_share_5m": stats_5m.top_3_volume_share,
-            "new_wallet_pct_5m": stats_5m.new_wallet_pct,
-
-            # 1-hour stats
-            "buy_count_1h": stats_1h.buy_count,
-            "sell_count_1h": stats_1h.sell_count,
-            "unique_buyers_1h": stats_1h.unique_buyers,
-            "unique_sellers_1h": stats_1h.unique_sellers,
-            "buy_volume_sol_1h": stats_1h.volume_sol,
-            "avg_buy_size_1h": stats_1h.avg_buy_size,
-            "buy_sell_ratio_1h": stats_1h.buy_sell_ratio,
-            "top_3_buyers_volume_share_1h": stats_1h.top_3_volume_share,
-            "new_wallet_pct_1h": stats_1h.new_wallet_pct,
-        }
+    ) -> array:
+        """Lay out both windows' stats as a vector indexed by FIELD_INDEX."""
+        values = [getattr(stats_5m, attr) for attr in STAT_FIELDS.values()]
+        values += [getattr(stats_1h, attr) for attr in STAT_FIELDS.values()]
+        values.append(0.0)
+        return array("d", values)
 
     def _evaluate_trigger(
         self,
         trigger: Trigger,
-        stats: Dict[str, float]
+        stats: Sequence[float]
     ) -> bool:
         """Evaluate a single trigger (all conditions must match)."""
-        for cond in trigger.conditions:
-            value = stats.get(cond.field, 0)
-
-            if cond.operator == ">=" and not (value >= cond.value):
-                return False
-            elif cond.operator == ">" and not (value > cond.value):
-                return False
-            elif cond.operator == "<=" and not (value <= cond.value):
-                return False
-            elif cond.operator == "<" and not (value < cond.value):
-                return False
-            elif cond.operator == "==" and not (value == cond.value):
-                return False
-
-        return True
+        return trigger.matches(stats)
 
     def _format_reason(
         self,
         trigger: Trigger,
-        stats: Dict[str, float]
+        stats: Sequence[float]
     ) -> str:
         """Format human-readable trigger reason."""
         parts = [f"Trigger: {trigger.name}"]
 
         for cond in trigger.conditions:
-            actual = stats.get(cond.field, 0)
+            actual = stats[cond.idx]
             parts.append(f"{cond.field}={actual:.2f} ({cond.operator} {cond.value})")
 
         return " | ".join(parts)
 
-    async def evaluate_all_active(self) -> List[TriggerResult]:
-        """Evaluate all active mints and return triggered results."""
-        results = []
-        active_mints = await self.counters.get_active_mints()
+    async def evaluate_many(self, mints: List[str]) -> List[TriggerResult]:
+        """
+        Evaluate triggers for many mints at once.
 
-        for mint in active_mints:
-            result = await self.evaluate(mint)
-            if result:
-                results.append(result)
+        Stats for both windows are laid out as columns and each trigger
+        filters the rows still unclaimed, in the same priority order as
+        evaluate(), so a mint fires at most its first matching trigger.
+        Mints whose stats can't be fetched are skipped.
+        """
+        (rows_5m, cols_5m), (rows_1h, cols_1h) = await asyncio.gather(
+            self.counters.get_stats_matrix(mints, 300),
+            self.counters.get_stats_matrix(mints, 3600),
+        )
+        rows = rows_5m
+        if rows_5m != rows_1h:
+            # Keep only mints with both windows, with columns aligned
+            have_1h = set(rows_1h)
+            rows = [mint for mint in rows_5m if mint in have_1h]
+            cols_5m = self._select_rows(cols_5m, rows_5m, rows)
+            cols_1h = self._select_rows(cols_1h, rows_1h, rows)
+
+        n = len(rows)
+        self._evaluations += n
+        if not n:
+            return []
+
+        # One column per FIELD_INDEX slot, in the same order
+        columns = [cols_5m[name] for name in STAT_FIELDS]
+        columns += [cols_1h[name] for name in STAT_FIELDS]
+        columns.append([0.0] * n)
+
+        remaining = self._candidate_rows(columns, n)
+        results = []
+        for window, trigger in self._ordered:
+            if not remaining:
+                break
+            hits = trigger.select(columns, remaining)
+            if not hits:
+                continue
+            for i in hits:
+                row = array("d", [col[i] for col in columns])
+                results.append(TriggerResult(
+                    triggered=True,
+                    trigger_name=trigger.name,
+                    reason=self._format_reason(trigger, row),
+                    stats=await self.counters.get_stats(rows[i], window),
+                ))
+            claimed = set(hits)
+            remaining = [i for i in remaining if i not in claimed]
 
+        self._triggers_fired += len(results)
         return results
 
+    @staticmethod
+    def _select_rows(
+        columns: Dict[str, Sequence[float]],
+        rows: List[str],
+        keep: List[str],
+    ) -> Dict[str, List[float]]:
+        """Subset stat columns (one row per mint in rows) to the mints in keep."""
+        pos = {mint: i for i, mint in enumerate(rows)}
+        idx = [pos[mint] for mint in keep]
+        return {name: [col[i] for i in idx] for name, col in columns.items()}
+
+    async def evaluate_all_active(self) -> List[TriggerResult]:
+        """Evaluate all active mints and return triggered results."""
+        active_mints = list(await self.counters.get_active_mints())
+        return await self.evaluate_many(active_mints)
+
     def get_stats(self) -> dict:
         """Get evaluator statistics."""
         return {
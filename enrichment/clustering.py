@@ -2,7 +2,7 @@
 
 import logging
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from storage.postgres_client import PostgresClient
 from models.profiles import WalletProfile
@@ -113,6 +113,16 @@ class WalletClusterer:
         self._wallet_volumes[address] = self._wallet_volumes.get(address, 0) + volume_sol
         self._wallet_buys[address] = self._wallet_buys.get(address, 0) + buy_count
 
+    def add_wallets_bulk(self, entries: Iterable[Tuple[str, float, int]]):
+        """Add many (address, volume_sol, buy_count) entries at once."""
+        find = self._union_find.find
+        volumes = self._wallet_volumes
+        buys = self._wallet_buys
+        for address, volume_sol, buy_count in entries:
+            find(address)  # Ensure in union-find
+            volumes[address] = volumes.get(address, 0) + volume_sol
+            buys[address] = buys.get(address, 0) + buy_count
+
     def link_wallets(self, wallet1: str, wallet2: str):
         """
         Link two wallets as related (same cluster).
@@ -120,7 +130,7 @@ class WalletClusterer:
         Called when funding relationship is discovered.
         """
         self._union_find.union(wallet1, wallet2)
-        logger.debug(f"Linked wallets {wallet1[:8]} <-> {wallet2[:8]}")
+        logger.debug("Linked wallets %s <-> %s", wallet1[:8], wallet2[:8])
 
     def link_funding(self, wallet: str, funder: str):
         """Link wallet to its funder."""
@@ -15,6 +15,7 @@ logger = logging.getLogger(__name__)
 # Helius credit costs
 CREDIT_COSTS = {
     "getAccountInfo": 1,
+    "getMultipleAccounts": 1,
     "getSignaturesForAddress": 10,
     "getTransaction": 10,
     "getTransactionsForAddress": 100,
@@ -32,6 +33,25 @@ class TransactionInfo:
     fee: int
 
 
+def _parse_token_supply(account: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Extract supply and decimals from a jsonParsed mint account."""
+    if not account:
+        return None
+
+    data = account.get("data", {})
+    if isinstance(data, dict) and "parsed" in data:
+        info = data["parsed"].get("info", {})
+        supply_str = info.get("supply")
+        decimals = info.get("decimals", 9)
+        if supply_str is not None:
+            return {
+                "supply": int(supply_str),
+                "decimals": decimals,
+            }
+
+    return None
+
+
 class CreditBucket:
     """
     Daily credit budget management.
@@ -124,7 +144,11 @@ class HeliusClient:
 
     async def start(self):
         """Start the Helius client."""
-        self._http_client = httpx.AsyncClient(timeout=30.0)
+        # One pooled keep-alive client shared by RPC, DAS and DexScreener calls
+        self._http_client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
         logger.info("Helius client started")
 
     async def stop(self):
@@ -364,20 +388,37 @@ class HeliusClient:
             credits=CREDIT_COSTS["getAccountInfo"]
         )
 
-        if result and result.get("value"):
-            data = result["value"].get("data", {})
-            if isinstance(data, dict) and "parsed" in data:
-                info = data["parsed"].get("info", {})
-                supply_str = info.get("supply")
-                decimals = info.get("decimals", 9)
-                if supply_str is not None:
-                    return {
-                        "supply": int(supply_str),
-                        "decimals": decimals,
-                    }
-
+        if result:
+            return _parse_token_supply(result.get("value"))
         return None
 
+    async def get_multiple_token_supplies(
+        self,
+        mints: List[str],
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Get supply and decimals for up to 100 mints in one call.
+
+        Cost: 1 credit per call.
+
+        Returns {mint: supply dict or None}, or an empty dict if the call failed.
+        """
+        if not mints:
+            return {}
+
+        result = await self._rpc_call(
+            "getMultipleAccounts",
+            [mints, {"encoding": "jsonParsed"}],
+            credits=CREDIT_COSTS["getMultipleAccounts"]
+        )
+
+        if not result:
+            return {}
+        return {
+            mint: _parse_token_supply(account)
+            for mint, account in zip(mints, result.get("value") or [])
+        }
+
     async def get_token_metadata_dexscreener(self, mint: str) -> Optional[Dict[str, Any]]:
         """
         Get token metadata from DexScreener (free, no credits).
@@ -415,9 +456,6 @@ class HeliusClient:
         Returns dict with name, symbol, image.
         """
         try:
-            # DAS API endpoint
-            url = f"https://mainnet.helius-rpc.com/?api-key={settings.helius_api_key}"
-
             payload = {
                 "jsonrpc": "2.0",
                 "id": "das-getasset",
@@ -434,7 +472,7 @@ class HeliusClient:
             if not self.credit_bucket.can_spend(1):
                 return None
 
-            response = await self._http_client.post(url, json=payload, timeout=5.0)
+            response = await self._http_client.post(self.base_url, json=payload, timeout=5.0)
             response.raise_for_status()
             data = response.json()
 
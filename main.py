@@ -12,7 +12,7 @@ import sys
 import time
 from typing import Optional, Union
 
-from config.settings import settings
+from config.settings import settings, DEFAULT_SNAPSHOT_PATH, SETTINGS_SNAPSHOT_ENV
 from storage.redis_client import RedisClient
 from storage.postgres_client import PostgresClient
 from storage.delta_log import DeltaLog
@@ -270,6 +270,12 @@ class Application:
         if self.batch_consumer:
             await self.batch_consumer.stop()
 
+        if self.batch_processor:
+            self.batch_processor.close()
+
+        if self.processor:
+            await self.processor.close()
+
         if self.delta_log:
             await self.delta_log.stop()
 
@@ -328,6 +334,12 @@ class Application:
             if self.swap_flusher:
                 self._tasks.append(asyncio.create_task(self.swap_flusher.run()))
 
+            # WARM transitions are written to Postgres in batches
+            if self.processor:
+                self._tasks.append(
+                    asyncio.create_task(self.processor.state_manager.run_warm_flusher())
+                )
+
             # Maintenance loop (needed for consume)
             self._tasks.append(asyncio.create_task(self._run_maintenance_loop()))
 
@@ -554,15 +566,17 @@ class Application:
                     # Limit evaluations under heavy load
                     active_mints = list(active_mints)[:max_mints]
 
-                for mint in active_mints:
-                    # Skip if already HOT
-                    if await self.processor.state_manager.is_hot(mint):
-                        continue
+                # Skip mints that are already HOT
+                candidates = [
+                    mint for mint in active_mints
+                    if not await self.processor.state_manager.is_hot(mint)
+                ]
 
-                    result = await self.processor.trigger_evaluator.evaluate(mint)
-                    if result and result.triggered:
-                        logger.info(f"Trigger fired: {result.trigger_name} for {mint[:8]}")
-                        await self.processor._handle_trigger_result(mint, result)
+                results = await self.processor.trigger_evaluator.evaluate_many(candidates)
+                for result in results:
+                    mint = result.stats.mint
+                    logger.info(f"Trigger fired: {result.trigger_name} for {mint[:8]}")
+                    await self.processor._handle_trigger_result(mint, result)
 
             except asyncio.CancelledError:
                 break
@@ -745,8 +759,25 @@ if __name__ == "__main__":
         help="Consumer name for XREADGROUP (default: auto-generated from hostname-pid)"
     )
 
+    parser.add_argument(
+        "--write-settings-snapshot",
+        metavar="PATH",
+        nargs="?",
+        const=str(DEFAULT_SNAPSHOT_PATH),
+        default=None,
+        help=(
+            "Write validated settings to PATH and exit; start workers with "
+            f"{SETTINGS_SNAPSHOT_ENV}=PATH to skip .env parsing"
+        ),
+    )
+
     args = parser.parse_args()
 
+    if args.write_settings_snapshot:
+        path = settings.write_snapshot(args.write_settings_snapshot)
+        print(f"Settings snapshot written to {path}")
+        sys.exit(0)
+
     if args.debug:
         logging.getLogger().setLevel(logging.DEBUG)
 
@@ -13,7 +13,7 @@ class SwapSide(str, Enum):
     SELL = "sell"
 
 
-@dataclass
+@dataclass(slots=True)
 class MintTouchedEvent:
     """
     Emitted for ALL ingested transactions - never miss a token.
@@ -30,9 +30,10 @@ class MintTouchedEvent:
     programs_invoked: Set[str]
     compute_units: Optional[int] = None
 
-    def to_msgpack(self) -> bytes:
-        """Serialize to msgpack for storage."""
-        return msgpack.packb({
+    def to_msgpack(self, packer: Optional[msgpack.Packer] = None) -> bytes:
+        """Serialize to msgpack for storage (reuses packer when batching)."""
+        pack = packer.pack if packer is not None else msgpack.packb
+        return pack({
             "sig": self.signature,
             "slot": self.slot,
             "bt": self.block_time,
@@ -57,7 +58,7 @@ class MintTouchedEvent:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TxDeltaRecord:
     """
     Rich delta record stored for ALL transactions (60 min retention).
@@ -84,9 +85,10 @@ class TxDeltaRecord:
     tx_fee: int = 0
     accounts_created: int = 0
 
-    def to_msgpack(self) -> bytes:
-        """Serialize to msgpack for storage."""
-        return msgpack.packb({
+    def to_msgpack(self, packer: Optional[msgpack.Packer] = None) -> bytes:
+        """Serialize to msgpack for storage (reuses packer when batching)."""
+        pack = packer.pack if packer is not None else msgpack.packb
+        return pack({
             "sig": self.signature,
             "slot": self.slot,
             "bt": self.block_time,
@@ -117,7 +119,7 @@ class TxDeltaRecord:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SwapEventFull:
     """
     Full swap event stored only for HOT/WARM tokens.
@@ -180,9 +182,10 @@ class SwapEventFull:
             mcap_at_swap=d.get("mcap_at_swap"),
         )
 
-    def to_msgpack(self) -> bytes:
-        """Serialize to msgpack."""
-        return msgpack.packb(self.to_dict())
+    def to_msgpack(self, packer: Optional[msgpack.Packer] = None) -> bytes:
+        """Serialize to msgpack (reuses packer when batching)."""
+        pack = packer.pack if packer is not None else msgpack.packb
+        return pack(self.to_dict())
 
     @classmethod
     def from_msgpack(cls, data: bytes) -> "SwapEventFull":
@@ -190,7 +193,7 @@ class SwapEventFull:
         return cls.from_dict(msgpack.unpackb(data))
 
 
-@dataclass
+@dataclass(slots=True)
 class SwapCandidate:
     """Intermediate swap candidate before full event creation."""
     user_wallet: str
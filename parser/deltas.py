@@ -1,13 +1,15 @@
 """Balance delta extraction from transactions."""
 
 import logging
+import sys
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
 # Constants
-WSOL_MINT = "So11111111111111111111111111111111111111112"
+# Interned, as are parsed mints, so == against it hits the identity fast path
+WSOL_MINT = sys.intern("So11111111111111111111111111111111111111112")
 ATA_RENT_LAMPORTS = 2039280  # ~0.00203 SOL for ATA creation
 ACCOUNT_RENT_LAMPORTS = 890880  # ~0.00089 SOL for basic account
 
@@ -18,6 +20,12 @@ QUOTE_MINTS = {
     "Es9vMFrzaCERmJfrF4H2FYD4KCoNkY11McCe8BenwNYB",  # USDT
 }
 
+# Raw quote amount -> SOL multiplier per quote mint. Quotes without an entry
+# (USDC/USDT until a price feed is wired in) count as 0 SOL.
+QUOTE_SOL_SCALE = {
+    WSOL_MINT: 1e-9,
+}
+
 
 @dataclass
 class TokenBalance:
@@ -78,13 +86,7 @@ class DeltaBuilder:
             )
 
             # Build delta map
-            all_keys = set(pre_balances.keys()) | set(post_balances.keys())
-            for key in all_keys:
-                pre_amt = pre_balances.get(key, 0)
-                post_amt = post_balances.get(key, 0)
-                delta = post_amt - pre_amt
-                if delta != 0:
-                    token_deltas[key] = delta
+            token_deltas = self._diff_balances(pre_balances, post_balances)
 
             # --- SOL deltas (lamports) with fee/rent correction ---
             pre_sol = tx_data.get("pre_balances", {})
@@ -126,6 +128,23 @@ class DeltaBuilder:
 
         return token_deltas, sol_deltas
 
+    @staticmethod
+    def _diff_balances(
+        pre: Dict[Tuple[str, str], int],
+        post: Dict[Tuple[str, str], int],
+    ) -> Dict[Tuple[str, str], int]:
+        """
+        Net post - pre per key, dropping zero deltas.
+
+        Walks each map once instead of building a key-union set and doing
+        two lookups per key.
+        """
+        net = dict(post)
+        get = net.get
+        for key, pre_amt in pre.items():
+            net[key] = get(key, 0) - pre_amt
+        return {key: delta for key, delta in net.items() if delta}
+
     def _parse_token_balances(
         self,
         balances: List[Any]
@@ -155,7 +174,7 @@ class DeltaBuilder:
                 continue
 
             if owner and mint:
-                result[(owner, mint)] = amount
+                result[(owner, sys.intern(mint))] = amount
 
         return result
 
@@ -191,16 +210,48 @@ class DeltaBuilder:
 
         return candidates
 
+    def get_candidate_users_from_triples(
+        self,
+        token_deltas: Iterable[Tuple[str, str, int]],
+        fee_payer: str
+    ) -> Set[str]:
+        """Get candidate user wallets from stored (owner, mint, delta) triples."""
+        candidates = {fee_payer}
+        candidates.update(owner for owner, _, amount in token_deltas if amount)
+        return candidates
+
     def extract_mints_touched(
         self,
         token_deltas: Dict[Tuple[str, str], int]
     ) -> Set[str]:
         """Extract all non-WSOL mints touched in the transaction."""
-        mints = set()
-        for (owner, mint) in token_deltas.keys():
+        return {mint for (_, mint) in token_deltas if mint != WSOL_MINT}
+
+    def extract_all(
+        self,
+        token_deltas: Dict[Tuple[str, str], int],
+        fee_payer: str
+    ) -> Tuple[List[Tuple[str, str, int]], Set[str], Set[str]]:
+        """
+        Single pass over token_deltas for the batch path.
+
+        Returns:
+            Tuple of (delta_triples, mints_touched, candidates), equivalent to
+            the record comprehension, extract_mints_touched and
+            get_candidate_users.
+        """
+        triples: List[Tuple[str, str, int]] = []
+        mints: Set[str] = set()
+        candidates = {fee_payer}
+
+        for (owner, mint), amount in token_deltas.items():
+            triples.append((owner, mint, amount))
             if mint != WSOL_MINT:
                 mints.add(mint)
-        return mints
+            if amount:
+                candidates.add(owner)
+
+        return triples, mints, candidates
 
     def extract_program_ids(self, tx_data: Dict[str, Any]) -> Set[str]:
         """Extract all program IDs invoked in the transaction."""
@@ -224,6 +275,11 @@ class DeltaBuilder:
 
         return programs
 
+    def merge_stats(self, other: "DeltaBuilder"):
+        """Add another builder's counts to this one's."""
+        self._processed += other._processed
+        self._errors += other._errors
+
     def get_stats(self) -> dict:
         """Get builder statistics."""
         return {
@@ -1,7 +1,7 @@
 """Swap inference from balance deltas."""
 
 import logging
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from models.events import SwapCandidate, SwapSide
 from .deltas import (
@@ -25,6 +25,9 @@ VENUE_PROGRAMS = {
     "whirLbMiicVdio4qvUfM5KAg6Ct8VwpYzGff3uctyCc": "orca",
     "LBUZKhRxPF3XUpBCjp4YzTKgLccjZhTSDM9YuVaPwxo": "meteora",
 }
+VENUE_PROGRAM_IDS = frozenset(VENUE_PROGRAMS)
+# Tie-break when a tx touches several venues (e.g. a Jupiter route through Raydium)
+_VENUE_RANK = {prog_id: rank for rank, prog_id in enumerate(VENUE_PROGRAMS)}
 
 
 class SwapInference:
@@ -79,6 +82,44 @@ class SwapInference:
                 owner_token_deltas[owner] = owner_map
             owner_map[(owner, mint)] = amt
 
+        return self._infer_grouped(owner_token_deltas, merged_sol, sol_deltas, candidates)
+
+    def infer_swap_from_triples(
+        self,
+        token_deltas: Iterable[Tuple[str, str, int]],
+        sol_deltas: Dict[str, int],
+        candidates: Set[str]
+    ) -> Optional[SwapCandidate]:
+        """
+        Infer swap from stored (owner, mint, delta) triples.
+
+        Equivalent to infer_swap on the dict the triples came from, without
+        rebuilding it; WSOL merge and owner grouping share one pass.
+        """
+        self._processed += 1
+
+        merged_sol = sol_deltas.copy()
+        owner_token_deltas: Dict[str, Dict[Tuple[str, str], int]] = {}
+        for owner, mint, amt in token_deltas:
+            if mint == WSOL_MINT:
+                merged_sol[owner] = merged_sol.get(owner, 0) + amt
+                continue
+            owner_map = owner_token_deltas.get(owner)
+            if owner_map is None:
+                owner_map = {}
+                owner_token_deltas[owner] = owner_map
+            owner_map[(owner, mint)] = amt
+
+        return self._infer_grouped(owner_token_deltas, merged_sol, sol_deltas, candidates)
+
+    def _infer_grouped(
+        self,
+        owner_token_deltas: Dict[str, Dict[Tuple[str, str], int]],
+        merged_sol: Dict[str, int],
+        sol_deltas: Dict[str, int],
+        candidates: Set[str]
+    ) -> Optional[SwapCandidate]:
+        """Pick the best buy/sell across candidates from grouped deltas."""
         best_swap: Optional[SwapCandidate] = None
         best_confidence = 0.0
 
@@ -241,15 +282,24 @@ class SwapInference:
 
     def identify_venue(self, programs_invoked: Set[str]) -> str:
         """Identify trading venue from invoked programs."""
-        for prog_id in programs_invoked:
-            if prog_id in VENUE_PROGRAMS:
-                return VENUE_PROGRAMS[prog_id]
-        return "unknown"
+        # C-level intersection against the small venue set instead of a
+        # Python loop over every invoked program
+        hits = VENUE_PROGRAM_IDS.intersection(programs_invoked)
+        if not hits:
+            return "unknown"
+        if len(hits) == 1:
+            return VENUE_PROGRAMS[next(iter(hits))]
+        return VENUE_PROGRAMS[min(hits, key=_VENUE_RANK.__getitem__)]
 
     def estimate_route_depth(self, programs_invoked: Set[str]) -> int:
         """Estimate routing depth from program count."""
-        venue_count = sum(1 for p in programs_invoked if p in VENUE_PROGRAMS)
-        return max(1, venue_count)
+        return max(1, len(VENUE_PROGRAM_IDS.intersection(programs_invoked)))
+
+    def merge_stats(self, other: "SwapInference"):
+        """Add another inference's counts to this one's."""
+        self._processed += other._processed
+        self._swaps_found += other._swaps_found
+        self._confidence_sum += other._confidence_sum
 
     def get_stats(self) -> dict:
         """Get inference statistics."""
@@ -292,11 +342,11 @@ def process_transaction(
         account_keys = tx_data.get("account_keys", [])
         fee_payer = account_keys[0] if account_keys else ""
 
-    mints_touched = delta_builder.extract_mints_touched(token_deltas)
+    # Mints and candidates in one pass over token_deltas
+    _, mints_touched, candidates = delta_builder.extract_all(token_deltas, fee_payer)
     programs_invoked = delta_builder.extract_program_ids(tx_data)
 
     # Infer swap
-    candidates = delta_builder.get_candidate_users(token_deltas, fee_payer)
     swap = inference.infer_swap(token_deltas, sol_deltas, candidates)
 
     # Identify venue
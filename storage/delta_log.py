@@ -103,16 +103,17 @@ class DeltaLog:
         if not records:
             return
 
+        # Encode the whole batch with one packer into one buffer
+        packer = msgpack.Packer()
+        buf = bytearray()
+        for record in records:
+            compressed = zlib.compress(record.to_msgpack(packer), level=1)
+            buf += len(compressed).to_bytes(4, "big")
+            buf += compressed
+
         async with self._write_lock:
             file = await self._get_file()
-
-            for record in records:
-                data = record.to_msgpack()
-                compressed = zlib.compress(data, level=1)
-                length = len(compressed)
-                await file.write(length.to_bytes(4, "big"))
-                await file.write(compressed)
-
+            await file.write(bytes(buf))
             await file.flush()
 
     async def read_recent(
@@ -106,9 +106,10 @@ class EventLog:
 
         records = []
         total_size = 0
+        packer = msgpack.Packer()
 
         for event in events:
-            data = event.to_msgpack()
+            data = event.to_msgpack(packer)
             compressed = zlib.compress(data, level=1)
             record = len(compressed).to_bytes(4, "big") + compressed
             records.append(record)
@@ -132,7 +133,7 @@ class EventLog:
             await file.write(record)
         await file.flush()
 
-        logger.debug(f"Flushed {len(self._buffer)} events ({self._buffer_size} bytes)")
+        logger.debug("Flushed %d events (%d bytes)", len(self._buffer), self._buffer_size)
         self._buffer = []
         self._buffer_size = 0
 
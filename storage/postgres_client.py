@@ -1,8 +1,8 @@
 """PostgreSQL client for persistent storage."""
 
 import logging
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
 
 import asyncpg
 from asyncpg import Pool
@@ -14,6 +14,50 @@ from models.profiles import Alert, TokenProfile, TokenState, WalletProfile
 logger = logging.getLogger(__name__)
 
 
+_UPSERT_WALLET_PROFILE_SQL = """
+    INSERT INTO wallet_profiles (
+        address, first_seen, last_seen, total_buys, total_sells,
+        total_volume_sol, tokens_traded, cluster_id, cluster_size,
+        funded_by, funding_amount_sol, funding_hop, is_new_wallet,
+        cto_score, updated_at
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, NOW())
+    ON CONFLICT (address) DO UPDATE SET
+        last_seen = EXCLUDED.last_seen,
+        total_buys = EXCLUDED.total_buys,
+        total_sells = EXCLUDED.total_sells,
+        total_volume_sol = EXCLUDED.total_volume_sol,
+        tokens_traded = EXCLUDED.tokens_traded,
+        cluster_id = COALESCE(EXCLUDED.cluster_id, wallet_profiles.cluster_id),
+        cluster_size = EXCLUDED.cluster_size,
+        funded_by = COALESCE(EXCLUDED.funded_by, wallet_profiles.funded_by),
+        funding_amount_sol = COALESCE(EXCLUDED.funding_amount_sol, wallet_profiles.funding_amount_sol),
+        funding_hop = EXCLUDED.funding_hop,
+        is_new_wallet = EXCLUDED.is_new_wallet,
+        cto_score = EXCLUDED.cto_score,
+        updated_at = NOW()
+"""
+
+
+def _wallet_profile_args(profile: WalletProfile) -> tuple:
+    """Positional args for _UPSERT_WALLET_PROFILE_SQL."""
+    return (
+        profile.address,
+        profile.first_seen,
+        profile.last_seen,
+        profile.total_buys,
+        profile.total_sells,
+        profile.total_volume_sol,
+        list(profile.tokens_traded),
+        profile.cluster_id,
+        profile.cluster_size,
+        profile.funded_by,
+        profile.funding_amount_sol,
+        profile.funding_hop,
+        profile.is_new_wallet,
+        profile.cto_score,
+    )
+
+
 class PostgresClient:
     """PostgreSQL client for Pocketwatcher persistent storage."""
 
@@ -200,6 +244,34 @@ class PostgresClient:
 
     # ============== Token Profile Operations ==============
 
+    async def upsert_warm_tokens(self, rows: List[Tuple[str, int]]) -> int:
+        """
+        Mark tokens WARM in one executemany.
+
+        rows are (mint, seen_at unix seconds); seen_at becomes first_seen
+        for new tokens and last_seen for all. Rows may land after the token
+        went HOT, so a HOT state is never downgraded. Returns number of rows
+        written.
+        """
+        if not rows:
+            return 0
+
+        async with self.pool.acquire() as conn:
+            await conn.executemany("""
+                INSERT INTO token_profiles (mint, state, first_seen, last_seen, updated_at)
+                VALUES ($1, $2, $3, $3, NOW())
+                ON CONFLICT (mint) DO UPDATE SET
+                    state = CASE WHEN token_profiles.state = 'hot'
+                        THEN token_profiles.state ELSE EXCLUDED.state END,
+                    first_seen = LEAST(token_profiles.first_seen, EXCLUDED.first_seen),
+                    last_seen = GREATEST(token_profiles.last_seen, EXCLUDED.last_seen),
+                    updated_at = NOW()
+            """, [
+                (mint, TokenState.WARM.value, datetime.fromtimestamp(seen_at, timezone.utc))
+                for mint, seen_at in rows
+            ])
+        return len(rows)
+
     async def get_token_profile(self, mint: str) -> Optional[TokenProfile]:
         """Get token profile by mint address."""
         async with self.pool.acquire() as conn:
@@ -268,13 +340,24 @@ class PostgresClient:
             )
 
     async def update_token_state(self, mint: str, state: TokenState, reason: Optional[str] = None):
-        """Update token state."""
+        """
+        Update token state.
+
+        HOT is an upsert: the token's queued WARM row may not be written
+        yet, and became_hot_at/trigger_reason must not be lost.
+        """
         async with self.pool.acquire() as conn:
             if state == TokenState.HOT:
                 await conn.execute("""
-                    UPDATE token_profiles
-                    SET state = $2, became_hot_at = NOW(), trigger_reason = $3, updated_at = NOW()
-                    WHERE mint = $1
+                    INSERT INTO token_profiles (
+                        mint, state, first_seen, last_seen, became_hot_at,
+                        trigger_reason, updated_at
+                    ) VALUES ($1, $2, NOW(), NOW(), NOW(), $3, NOW())
+                    ON CONFLICT (mint) DO UPDATE SET
+                        state = EXCLUDED.state,
+                        became_hot_at = EXCLUDED.became_hot_at,
+                        trigger_reason = EXCLUDED.trigger_reason,
+                        updated_at = NOW()
                 """, mint, state.value, reason)
             else:
                 await conn.execute("""
@@ -488,43 +571,23 @@ class PostgresClient:
     async def upsert_wallet_profile(self, profile: WalletProfile):
         """Insert or update wallet profile."""
         async with self.pool.acquire() as conn:
-            await conn.execute("""
-                INSERT INTO wallet_profiles (
-                    address, first_seen, last_seen, total_buys, total_sells,
-                    total_volume_sol, tokens_traded, cluster_id, cluster_size,
-                    funded_by, funding_amount_sol, funding_hop, is_new_wallet,
-                    cto_score, updated_at
-                ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, NOW())
-                ON CONFLICT (address) DO UPDATE SET
-                    last_seen = EXCLUDED.last_seen,
-                    total_buys = EXCLUDED.total_buys,
-                    total_sells = EXCLUDED.total_sells,
-                    total_volume_sol = EXCLUDED.total_volume_sol,
-                    tokens_traded = EXCLUDED.tokens_traded,
-                    cluster_id = COALESCE(EXCLUDED.cluster_id, wallet_profiles.cluster_id),
-                    cluster_size = EXCLUDED.cluster_size,
-                    funded_by = COALESCE(EXCLUDED.funded_by, wallet_profiles.funded_by),
-                    funding_amount_sol = COALESCE(EXCLUDED.funding_amount_sol, wallet_profiles.funding_amount_sol),
-                    funding_hop = EXCLUDED.funding_hop,
-                    is_new_wallet = EXCLUDED.is_new_wallet,
-                    cto_score = EXCLUDED.cto_score,
-                    updated_at = NOW()
-            """,
-                profile.address,
-                profile.first_seen,
-                profile.last_seen,
-                profile.total_buys,
-                profile.total_sells,
-                profile.total_volume_sol,
-                list(profile.tokens_traded),
-                profile.cluster_id,
-                profile.cluster_size,
-                profile.funded_by,
-                profile.funding_amount_sol,
-                profile.funding_hop,
-                profile.is_new_wallet,
-                profile.cto_score,
+            await conn.execute(_UPSERT_WALLET_PROFILE_SQL, *_wallet_profile_args(profile))
+
+    async def upsert_wallet_profiles_many(self, profiles: List[WalletProfile]) -> int:
+        """
+        Insert or update multiple wallet profiles in one executemany.
+
+        Returns number of profiles written.
+        """
+        if not profiles:
+            return 0
+
+        async with self.pool.acquire() as conn:
+            await conn.executemany(
+                _UPSERT_WALLET_PROFILE_SQL,
+                [_wallet_profile_args(profile) for profile in profiles],
             )
+        return len(profiles)
 
     async def update_wallet_cluster(self, address: str, cluster_id: str, cluster_size: int):
         """Update wallet cluster information."""
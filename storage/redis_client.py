@@ -3,8 +3,9 @@
 import asyncio
 import logging
 import time
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
+import msgpack
 import redis.asyncio as redis
 from redis.asyncio import Redis
 
@@ -16,6 +17,79 @@ logger = logging.getLogger(__name__)
 TX_STREAM = "stream:tx"
 CONSUMER_GROUP = "parsers"
 
+# Sorted set of mint -> last swap time (unix seconds)
+ACTIVE_MINTS_KEY = "active_mints"
+
+# Cumulative (prefix-sum) counters per mint, hash "cum:{mint}":
+#   buys / sells / volume  running totals since the key was created
+#   at:{bucket}            "buys:sells:volume" totals before the bucket's first swap
+# Any window's counts are then totals minus the earliest snapshot in it.
+CUM_BUCKET_SECONDS = 300
+CUM_KEEP_BUCKETS = 13  # One hour of buckets plus the one in progress
+CUM_TTL_SECONDS = 7200
+
+# Unique buyer/seller HLLs per 5m bucket; writers pass this as the EXPIRE
+# and _queue_rolling_stats treats older buckets as expired
+HLL_5M_TTL_SECONDS = 900
+HLL_1H_TTL_SECONDS = 7200
+# Per-wallet volume zsets per 5m bucket, and wallet first-seen timestamps
+WALLET_VOL_TTL_SECONDS = 900
+WALLET_FIRST_SEEN_TTL_SECONDS = 604800
+# A bucket counts as closed (its HLL final) this long after it ends,
+# allowing for clock skew between writers
+HLL_CLOSE_GRACE_SECONDS = 5
+
+# Lua: apply a buy/sell/volume delta to a cum:{mint} hash and snapshot the
+# totals on the bucket's first swap, pruning snapshots older than keep
+CUM_RECORD_FUNCTION = """
+local function record_cum(key, bucket, buys, sells, volume, keep, ttl)
+    bucket = tonumber(bucket)
+    local total_buys = redis.call('HINCRBY', key, 'buys', buys)
+    local total_sells = redis.call('HINCRBY', key, 'sells', sells)
+    local total_volume = tonumber(redis.call('HINCRBYFLOAT', key, 'volume', volume))
+    local field = 'at:' .. bucket
+    if redis.call('HEXISTS', key, field) == 0 then
+        redis.call('HSET', key, field,
+            (total_buys - buys) .. ':' .. (total_sells - sells) .. ':' .. (total_volume - volume))
+        -- First swap of a new bucket: drop snapshots that left every window
+        local oldest = bucket - tonumber(keep)
+        for _, f in ipairs(redis.call('HKEYS', key)) do
+            if string.sub(f, 1, 3) == 'at:' and tonumber(string.sub(f, 4)) <= oldest then
+                redis.call('HDEL', key, f)
+            end
+        end
+    end
+    redis.call('EXPIRE', key, ttl)
+end
+"""
+
+# KEYS[1] = cum:{mint}
+# ARGV = bucket, buys, sells, volume, keep_buckets, ttl_seconds
+CUM_RECORD_SCRIPT = CUM_RECORD_FUNCTION + """
+record_cum(KEYS[1], ARGV[1], ARGV[2], ARGV[3], ARGV[4], ARGV[5], ARGV[6])
+return 1
+"""
+
+# Every per-swap counter write in one atomic call.
+# KEYS = cum:{mint}, 5m HLL, 1h HLL, wallet first-seen, 5m wallet volume zset,
+#        active mints
+# ARGV = bucket, buys, sells, volume, keep_buckets, cum_ttl, wallet, mint, now,
+#        5m HLL ttl, 1h HLL ttl, first-seen ttl, wallet volume ttl
+RECORD_SWAP_SCRIPT = CUM_RECORD_FUNCTION + """
+record_cum(KEYS[1], ARGV[1], ARGV[2], ARGV[3], ARGV[4], ARGV[5], ARGV[6])
+local wallet = ARGV[7]
+redis.call('PFADD', KEYS[2], wallet)
+redis.call('EXPIRE', KEYS[2], ARGV[10])
+redis.call('PFADD', KEYS[3], wallet)
+redis.call('EXPIRE', KEYS[3], ARGV[11])
+redis.call('SET', KEYS[4], ARGV[9], 'NX')
+redis.call('EXPIRE', KEYS[4], ARGV[12])
+redis.call('ZINCRBY', KEYS[5], ARGV[4], wallet)
+redis.call('EXPIRE', KEYS[5], ARGV[13])
+redis.call('ZADD', KEYS[6], ARGV[9], ARGV[8])
+return 1
+"""
+
 
 class RedisClient:
     """Redis client wrapper for Pocketwatcher operations."""
@@ -24,6 +98,11 @@ class RedisClient:
         self.url = url or settings.redis_url
         self._redis: Optional[Redis] = None
         self._pubsub = None
+        self._cum_record = None
+        self._record_swap = None
+        # Final PFCOUNTs of closed 5m HLL buckets: key -> (bucket, count)
+        self._hll_counts: Dict[str, Tuple[int, int]] = {}
+        self._hll_counts_bucket = 0
 
     async def connect(self) -> Redis:
         """Connect to Redis."""
@@ -33,6 +112,8 @@ class RedisClient:
                 encoding="utf-8",
                 decode_responses=False,  # We handle binary data
             )
+            self._cum_record = self._redis.register_script(CUM_RECORD_SCRIPT)
+            self._record_swap = self._redis.register_script(RECORD_SWAP_SCRIPT)
             # Ensure consumer group exists
             try:
                 await self._redis.xgroup_create(
@@ -61,6 +142,15 @@ class RedisClient:
             raise RuntimeError("Not connected to Redis")
         return self._redis
 
+    def pipeline(self):
+        """
+        Non-transactional pipeline for batching commands into one round-trip.
+
+        Helpers that take a ``pipe`` argument queue onto it instead of
+        executing; the caller runs ``await pipe.execute()``.
+        """
+        return self.redis.pipeline(transaction=False)
+
     # ============== Stream Operations ==============
 
     async def push_to_stream(self, raw_tx: bytes) -> str:
@@ -143,123 +233,153 @@ class RedisClient:
         mint: str,
         user_wallet: str,
         quote_amount_sol: float,
-        side: str = "buy"
+        side: str = "buy",
+        pipe=None,
     ):
-        """Increment rolling counters for a swap."""
-        pipe = self.redis.pipeline()
+        """
+        Increment rolling counters for a swap (queued only if pipe is given).
 
+        Counts, volume, unique-wallet HLLs, wallet first-seen, per-wallet
+        volume and the active-mints entry are written by one script call.
+        """
+        now = int(time.time())
         is_buy = side == "buy"
-        metric_prefix = "buys" if is_buy else "sells"
         buyer_prefix = "buyers" if is_buy else "sellers"
 
-        # --- 5-minute windows (for fast stealth detection) ---
-        bucket_5m = self._get_bucket_key(mint, metric_prefix, 300)
-        pipe.incr(bucket_5m)
-        pipe.expire(bucket_5m, 900)  # Keep 3 buckets (15 min)
-
-        hll_5m = self._get_bucket_key(mint, buyer_prefix, 300)
-        pipe.pfadd(hll_5m, user_wallet)
-        pipe.expire(hll_5m, 900)
-
-        vol_5m = self._get_bucket_key(mint, "volume", 300)
-        pipe.incrbyfloat(vol_5m, quote_amount_sol)
-        pipe.expire(vol_5m, 900)
-
-        # Track individual buy sizes for avg calculation
-        if is_buy:
-            sizes_5m = self._get_bucket_key(mint, "buy_sizes", 300)
-            pipe.rpush(sizes_5m, str(quote_amount_sol))
-            pipe.expire(sizes_5m, 900)
-
-        # --- 1-hour windows (for slow stealth detection) ---
-        bucket_1h = self._get_bucket_key(mint, metric_prefix, 3600)
-        pipe.incr(bucket_1h)
-        pipe.expire(bucket_1h, 7200)  # Keep 2 buckets (2 hours)
-
-        hll_1h = self._get_bucket_key(mint, buyer_prefix, 3600)
-        pipe.pfadd(hll_1h, user_wallet)
-        pipe.expire(hll_1h, 7200)
-
-        vol_1h = self._get_bucket_key(mint, "volume", 3600)
-        pipe.incrbyfloat(vol_1h, quote_amount_sol)
-        pipe.expire(vol_1h, 7200)
-
-        if is_buy:
-            sizes_1h = self._get_bucket_key(mint, "buy_sizes", 3600)
-            pipe.rpush(sizes_1h, str(quote_amount_sol))
-            pipe.expire(sizes_1h, 7200)
-
-        # Track wallet first-seen (for "new wallet" detection)
-        wallet_key = f"wallet:first_seen:{user_wallet}"
-        pipe.setnx(wallet_key, int(time.time()))
-        pipe.expire(wallet_key, 86400 * 7)  # Keep 7 days
-
-        # Track per-wallet volume for concentration analysis
-        wallet_vol_5m = self._get_bucket_key(f"{mint}:{user_wallet}", "wallet_vol", 300)
-        pipe.incrbyfloat(wallet_vol_5m, quote_amount_sol)
-        pipe.expire(wallet_vol_5m, 900)
-
-        await pipe.execute()
+        await self._record_swap(
+            keys=[
+                f"cum:{mint}",
+                f"{buyer_prefix}:300s:{now // 300}:{mint}",
+                f"{buyer_prefix}:3600s:{now // 3600}:{mint}",
+                f"wallet:first_seen:{user_wallet}",
+                f"wallet_vol:300s:{now // 300}:{mint}",
+                ACTIVE_MINTS_KEY,
+            ],
+            args=[
+                now // CUM_BUCKET_SECONDS,
+                1 if is_buy else 0,
+                0 if is_buy else 1,
+                quote_amount_sol,
+                CUM_KEEP_BUCKETS,
+                CUM_TTL_SECONDS,
+                user_wallet,
+                mint,
+                now,
+                HLL_5M_TTL_SECONDS,
+                HLL_1H_TTL_SECONDS,
+                WALLET_FIRST_SEEN_TTL_SECONDS,
+                WALLET_VOL_TTL_SECONDS,
+            ],
+            client=pipe,
+        )
 
-    async def get_rolling_stats(
+    async def queue_cumulative_counters(
         self,
+        pipe,
         mint: str,
-        window_seconds: int = 300
-    ) -> Dict[str, Any]:
-        """Get rolling stats for a mint across recent buckets."""
-        bucket_size = 60 if window_seconds <= 120 else 300
-        num_buckets = max(1, window_seconds // bucket_size)
-        current_bucket = int(time.time()) // bucket_size
-
-        pipe = self.redis.pipeline()
-
-        # Collect keys for all buckets
-        buy_keys = []
-        sell_keys = []
-        vol_keys = []
-        buyer_keys = []
-        seller_keys = []
-        sizes_keys = []
-
-        for i in range(num_buckets):
-            bucket = current_bucket - i
-            buy_keys.append(f"buys:{bucket_size}s:{bucket}:{mint}")
-            sell_keys.append(f"sells:{bucket_size}s:{bucket}:{mint}")
-            vol_keys.append(f"volume:{bucket_size}s:{bucket}:{mint}")
-            buyer_keys.append(f"buyers:{bucket_size}s:{bucket}:{mint}")
-            seller_keys.append(f"sellers:{bucket_size}s:{bucket}:{mint}")
-            sizes_keys.append(f"buy_sizes:{bucket_size}s:{bucket}:{mint}")
-
-        # Queue up all gets
-        for key in buy_keys:
-            pipe.get(key)
-        for key in sell_keys:
-            pipe.get(key)
-        for key in vol_keys:
-            pipe.get(key)
-
-        results = await pipe.execute()
+        buys: int,
+        sells: int,
+        volume: float,
+    ):
+        """Queue a prefix-sum update of a mint's buy/sell counts and volume onto pipe."""
+        await self._cum_record(
+            keys=[f"cum:{mint}"],
+            args=[
+                int(time.time()) // CUM_BUCKET_SECONDS,
+                buys,
+                sells,
+                volume,
+                CUM_KEEP_BUCKETS,
+                CUM_TTL_SECONDS,
+            ],
+            client=pipe,
+        )
 
-        # Parse results
-        n = len(buy_keys)
-        buy_counts = [int(r or 0) for r in results[:n]]
-        sell_counts = [int(r or 0) for r in results[n:2*n]]
-        volumes = [float(r or 0) for r in results[2*n:3*n]]
+    def _queue_rolling_stats(self, pipe, mint: str, window_seconds: int) -> List[list]:
+        """
+        Queue the reads for one mint's rolling stats onto pipe.
 
-        total_buys = sum(buy_counts)
-        total_sells = sum(sell_counts)
-        total_volume = sum(volumes)
+        Queues one HMGET of the cumulative totals and the window's bucket
+        snapshots, then a PFCOUNT for each buyer/seller HLL bucket whose
+        count isn't already known. Returns the plan for
+        _collect_rolling_stats: per HLL kind, a list holding either a known
+        count or (key, bucket, cacheable) for a queued PFCOUNT.
+        """
+        now = int(time.time())
+        num_buckets = max(1, window_seconds // CUM_BUCKET_SECONDS)
+        current_bucket = now // CUM_BUCKET_SECONDS
+        buckets = range(current_bucket - num_buckets + 1, current_bucket + 1)
+
+        pipe.hmget(
+            f"cum:{mint}",
+            ["buys", "sells", "volume", *(f"at:{b}" for b in buckets)],
+        )
 
-        # Get HyperLogLog counts for unique buyers/sellers
-        pipe2 = self.redis.pipeline()
-        for key in buyer_keys:
-            pipe2.pfcount(key)
-        for key in seller_keys:
-            pipe2.pfcount(key)
-        hll_results = await pipe2.execute()
+        if current_bucket != self._hll_counts_bucket:
+            self._prune_hll_counts(current_bucket)
+
+        plan = []
+        for prefix in ("buyers", "sellers"):
+            entries = []
+            for b in buckets:
+                bucket_end = (b + 1) * CUM_BUCKET_SECONDS
+                if bucket_end + HLL_5M_TTL_SECONDS <= now:
+                    # Key has expired: PFCOUNT would return 0
+                    entries.append(0)
+                    continue
+                key = f"{prefix}:{CUM_BUCKET_SECONDS}s:{b}:{mint}"
+                cached = self._hll_counts.get(key)
+                if cached is not None:
+                    entries.append(cached[1])
+                    continue
+                pipe.pfcount(key)
+                entries.append((key, b, bucket_end + HLL_CLOSE_GRACE_SECONDS <= now))
+            plan.append(entries)
+        return plan
+
+    def _collect_rolling_stats(self, replies: Iterator[Any], plan: List[list]) -> Dict[str, Any]:
+        """Consume one mint's replies (in queue order) and build its rolling stats."""
+        cum = next(replies)
+        uniques = []
+        for entries in plan:
+            counts = []
+            for entry in entries:
+                if isinstance(entry, tuple):
+                    key, bucket, cacheable = entry
+                    count = next(replies)
+                    if cacheable:
+                        # Closed buckets get no more adds, so the count is final
+                        self._hll_counts[key] = (bucket, count)
+                    entry = count
+                counts.append(entry)
+            uniques.append(max(counts, default=0))
+        return self._parse_rolling_stats(cum, *uniques)
+
+    def _prune_hll_counts(self, current_bucket: int):
+        """Drop cached HLL counts for buckets whose keys have expired."""
+        oldest = current_bucket - HLL_5M_TTL_SECONDS // CUM_BUCKET_SECONDS - 1
+        self._hll_counts = {
+            key: entry for key, entry in self._hll_counts.items() if entry[0] >= oldest
+        }
+        self._hll_counts_bucket = current_bucket
 
-        unique_buyers = max(hll_results[:n]) if hll_results[:n] else 0
-        unique_sellers = max(hll_results[n:]) if hll_results[n:] else 0
+    @staticmethod
+    def _parse_rolling_stats(
+        cum: List[Any],
+        unique_buyers: int,
+        unique_sellers: int,
+    ) -> Dict[str, Any]:
+        """Build a rolling stats dict from the cumulative HMGET reply and HLL counts."""
+        # Window totals = running totals minus the oldest snapshot in the
+        # window; no snapshot means no swaps in the window
+        total_buys = total_sells = 0
+        total_volume = 0.0
+        snapshot = next((s for s in cum[3:] if s), None)
+        if snapshot is not None:
+            base_buys, base_sells, base_volume = snapshot.split(b":")
+            total_buys = int(cum[0] or 0) - int(base_buys)
+            total_sells = int(cum[1] or 0) - int(base_sells)
+            total_volume = max(0.0, float(cum[2] or 0) - float(base_volume))
 
         # Calculate buy/sell ratio
         buy_sell_ratio = total_buys / total_sells if total_sells > 0 else float('inf')
@@ -277,11 +397,44 @@ class RedisClient:
             "avg_buy_size": avg_buy_size,
         }
 
+    async def get_rolling_stats(
+        self,
+        mint: str,
+        window_seconds: int = 300
+    ) -> Dict[str, Any]:
+        """Get rolling stats for a mint across recent buckets."""
+        pipe = self.pipeline()
+        plan = self._queue_rolling_stats(pipe, mint, window_seconds)
+        return self._collect_rolling_stats(iter(await pipe.execute()), plan)
+
+    async def pipeline_get_stats(
+        self,
+        mints: List[str],
+        window_seconds: int = 300
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get rolling stats for many mints in a single pipelined round-trip."""
+        if not mints:
+            return {}
+        pipe = self.pipeline()
+        plans = [self._queue_rolling_stats(pipe, mint, window_seconds) for mint in mints]
+        replies = iter(await pipe.execute())
+        return {
+            mint: self._collect_rolling_stats(replies, plan)
+            for mint, plan in zip(mints, plans)
+        }
+
     async def get_wallet_first_seen(self, wallet: str) -> Optional[int]:
         """Get wallet first seen timestamp."""
         result = await self.redis.get(f"wallet:first_seen:{wallet}")
         return int(result) if result else None
 
+    async def mget_wallet_first_seen(self, wallets: List[str]) -> List[Optional[int]]:
+        """Get first seen timestamps for many wallets with one MGET, in input order."""
+        if not wallets:
+            return []
+        results = await self.redis.mget([f"wallet:first_seen:{w}" for w in wallets])
+        return [int(r) if r else None for r in results]
+
     async def get_top_buyers_volume(
         self,
         mint: str,
@@ -292,20 +445,32 @@ class RedisClient:
         bucket_size = 300
         current_bucket = int(time.time()) // bucket_size
 
-        # Scan for wallet volumes (this is expensive, consider alternatives)
-        pattern = f"wallet_vol:{bucket_size}s:{current_bucket}:{mint}:*"
-        wallet_volumes = []
+        # Per-wallet volume is a sorted set per mint and bucket
+        results = await self.redis.zrevrange(
+            f"wallet_vol:{bucket_size}s:{current_bucket}:{mint}",
+            0,
+            top_n - 1,
+            withscores=True,
+        )
+        return [
+            (wallet.decode() if isinstance(wallet, bytes) else wallet, float(vol))
+            for wallet, vol in results
+        ]
 
-        async for key in self.redis.scan_iter(match=pattern):
-            key_str = key.decode() if isinstance(key, bytes) else key
-            wallet = key_str.split(":")[-1]
-            vol = await self.redis.get(key)
-            if vol:
-                wallet_volumes.append((wallet, float(vol)))
+    # ============== Active Mint Tracking ==============
 
-        # Sort by volume descending
-        wallet_volumes.sort(key=lambda x: x[1], reverse=True)
-        return wallet_volumes[:top_n]
+    async def get_active_mints(self, window_seconds: int = 3600) -> Set[str]:
+        """Get mints with swap activity within the window."""
+        members = await self.redis.zrangebyscore(
+            ACTIVE_MINTS_KEY, time.time() - window_seconds, "+inf"
+        )
+        return {m.decode() if isinstance(m, bytes) else m for m in members}
+
+    async def remove_inactive_mints(self, max_age_seconds: int = 3600) -> int:
+        """Drop mints with no activity for max_age_seconds; returns how many."""
+        return await self.redis.zremrangebyscore(
+            ACTIVE_MINTS_KEY, "-inf", f"({time.time() - max_age_seconds}"
+        )
 
     # ============== Hot Token Management ==============
 
@@ -333,12 +498,22 @@ class RedisClient:
 
     # ============== Token Market Cap Tracking ==============
 
-    async def set_token_mcap(self, mint: str, mcap_sol: float, price_sol: float, ttl_seconds: int = 3600):
-        """Store latest market cap and price for a token."""
-        pipe = self.redis.pipeline()
+    async def set_token_mcap(
+        self,
+        mint: str,
+        mcap_sol: float,
+        price_sol: float,
+        ttl_seconds: int = 3600,
+        pipe=None,
+    ):
+        """Store latest market cap and price for a token (queued only if pipe is given)."""
+        own_pipe = pipe is None
+        if own_pipe:
+            pipe = self.redis.pipeline()
         pipe.set(f"mcap:{mint}", str(mcap_sol), ex=ttl_seconds)
         pipe.set(f"price:{mint}", str(price_sol), ex=ttl_seconds)
-        await pipe.execute()
+        if own_pipe:
+            await pipe.execute()
 
     async def get_token_mcap(self, mint: str) -> Optional[Dict[str, float]]:
         """Get latest market cap and price for a token."""
@@ -357,6 +532,32 @@ class RedisClient:
             }
         return None
 
+    # ============== Token Supply Cache ==============
+
+    async def get_token_supplies(self, mints: List[str]) -> Dict[str, Dict[str, int]]:
+        """Get shared cached supply info; mints not cached are omitted."""
+        if not mints:
+            return {}
+        values = await self.redis.mget([f"supply:{mint}" for mint in mints])
+        return {
+            mint: msgpack.unpackb(value)
+            for mint, value in zip(mints, values)
+            if value is not None
+        }
+
+    async def set_token_supplies(
+        self,
+        supplies: Dict[str, Dict[str, int]],
+        ttl_seconds: int = 86400,
+    ):
+        """Store supply info in the shared cache (supply rarely changes)."""
+        if not supplies:
+            return
+        pipe = self.pipeline()
+        for mint, supply_info in supplies.items():
+            pipe.set(f"supply:{mint}", msgpack.packb(supply_info), ex=ttl_seconds)
+        await pipe.execute()
+
     # ============== Config Hot Reload ==============
 
     async def get_config(self, key: str) -> Optional[bytes]:
@@ -382,26 +583,44 @@ class RedisClient:
 
     # ============== Unknown Program Discovery ==============
 
-    async def track_program(self, program_id: str, slot: int, cooccurs_with: Set[str]):
-        """Track unknown program occurrence."""
+    async def track_program(self, program_id: str, slot: int, cooccurs_with: Set[str]) -> int:
+        """Track unknown program occurrence. Returns the shared occurrence count."""
+        return (await self.track_programs([program_id], slot, cooccurs_with))[0]
+
+    async def track_programs(
+        self,
+        program_ids: List[str],
+        slot: int,
+        cooccurs_with: Set[str],
+    ) -> List[int]:
+        """
+        Track several unknown programs from one transaction in one round-trip.
+
+        Returns the shared occurrence count for each program, in order.
+        """
         pipe = self.redis.pipeline()
 
-        # Increment count
-        pipe.incr(f"prog:count:{program_id}")
+        for program_id in program_ids:
+            # Increment count
+            pipe.incr(f"prog:count:{program_id}")
 
-        # Set first seen if not exists
-        pipe.setnx(f"prog:first:{program_id}", slot)
+            # Set first seen if not exists
+            pipe.setnx(f"prog:first:{program_id}", slot)
 
-        # Track co-occurrences
-        for known_prog in cooccurs_with:
-            pipe.sadd(f"prog:cooccurs:{program_id}", known_prog)
+            # Track co-occurrences
+            if cooccurs_with:
+                pipe.sadd(f"prog:cooccurs:{program_id}", *cooccurs_with)
 
-        # Set expiry on all keys (7 days)
-        pipe.expire(f"prog:count:{program_id}", 604800)
-        pipe.expire(f"prog:first:{program_id}", 604800)
-        pipe.expire(f"prog:cooccurs:{program_id}", 604800)
+            # Set expiry on all keys (7 days)
+            pipe.expire(f"prog:count:{program_id}", 604800)
+            pipe.expire(f"prog:first:{program_id}", 604800)
+            pipe.expire(f"prog:cooccurs:{program_id}", 604800)
 
-        await pipe.execute()
+        results = await pipe.execute()
+
+        # Each program contributes 5 or 6 commands; INCR is the first of them
+        stride = 6 if cooccurs_with else 5
+        return [int(count) for count in results[::stride]]
 
     async def get_program_stats(self, program_id: str) -> Dict[str, Any]:
         """Get program occurrence stats."""
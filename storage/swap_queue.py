@@ -35,6 +35,30 @@ class SwapEventQueue:
                 logger.warning(f"Swap queue full, dropped {self._dropped} events total")
             return False
 
+    async def put_many(self, swap_events: List["SwapEvent"], drop_overflow: bool = True) -> int:
+        """
+        Non-blocking put of a whole batch. Returns the number accepted;
+        events that don't fit are dropped and counted, unless drop_overflow
+        is False, in which case the caller is responsible for the rest.
+        """
+        accepted = 0
+        put_nowait = self._queue.put_nowait
+        for swap_event in swap_events:
+            try:
+                put_nowait(swap_event)
+            except asyncio.QueueFull:
+                break
+            accepted += 1
+
+        dropped = len(swap_events) - accepted
+        if dropped and drop_overflow:
+            before = self._dropped
+            self._dropped += dropped
+            # Log once per 100 drops crossed
+            if before // 100 != self._dropped // 100 or before == 0:
+                logger.warning(f"Swap queue full, dropped {self._dropped} events total")
+        return accepted
+
     async def drain(self, max_items: int = 500) -> List["SwapEvent"]:
         """Drain up to max_items from queue."""
         items = []
@@ -15,7 +15,10 @@ import msgpack
 
 from config.settings import settings
 from core.ttl_cache import TTLCache, HotTokenCache
-from storage.redis_client import RedisClient, CONSUMER_GROUP, TX_STREAM
+from storage.redis_client import (
+    RedisClient, ACTIVE_MINTS_KEY, CONSUMER_GROUP, HLL_5M_TTL_SECONDS, TX_STREAM,
+    WALLET_FIRST_SEEN_TTL_SECONDS, WALLET_VOL_TTL_SECONDS,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -253,7 +256,7 @@ class BatchConsumer:
         ctx = BatchContext(
             batch_consumer=self,
             stream_length=self._backpressure_cache["stream_length"],
-            hot_tokens=self._hot_token_cache.get_all(),
+            hot_tokens=self._hot_token_cache.shared(),
         )
 
         try:
@@ -382,7 +385,7 @@ class BatchConsumer:
             ctx = BatchContext(
                 batch_consumer=self,
                 stream_length=stream_length,
-                hot_tokens=self._hot_token_cache.get_all(),
+                hot_tokens=self._hot_token_cache.shared(),
             )
 
             try:
@@ -456,6 +459,7 @@ class BatchContext:
     def mark_hot(self, mint: str):
         """Mark token as HOT locally."""
         self.hot_tokens.add(mint)
+        # No-op unless the cache was refreshed since this batch started
         self._consumer._hot_token_cache.add(mint)
 
     def queue_counter_update(
@@ -518,34 +522,47 @@ class BatchContext:
 
         # Add counter updates
         wallets_seen: Set[str] = set()  # Track wallets to avoid duplicate first_seen writes
+        mint_totals: Dict[str, List[float]] = {}  # mint -> [buys, sells, volume]
+        bucket_5m = now // 300
         for update in self._counter_updates.values():
             mint = update["mint"]
             wallet = update["user_wallet"]
-            side = update["side"]
-            volume = update["volume"]
-            count = update["count"]
+            is_buy = update["side"] == "buy"
 
-            is_buy = side == "buy"
-            metric_prefix = "buys" if is_buy else "sells"
-            buyer_prefix = "buyers" if is_buy else "sellers"
+            totals = mint_totals.get(mint)
+            if totals is None:
+                totals = mint_totals[mint] = [0, 0, 0.0]
+            totals[0 if is_buy else 1] += update["count"]
+            totals[2] += update["volume"]
 
-            # 5-minute buckets
-            bucket_5m = now // 300
-            count_key = f"{metric_prefix}:300s:{bucket_5m}:{mint}"
+            # 5-minute unique buyer/seller buckets
+            buyer_prefix = "buyers" if is_buy else "sellers"
             buyers_key = f"{buyer_prefix}:300s:{bucket_5m}:{mint}"
-            volume_key = f"volume:300s:{bucket_5m}:{mint}"
-            pipe.incrby(count_key, count)
-            expire_once(count_key, 900)
             pipe.pfadd(buyers_key, wallet)
-            expire_once(buyers_key, 900)
-            pipe.incrbyfloat(volume_key, volume)
-            expire_once(volume_key, 900)
+            expire_once(buyers_key, HLL_5M_TTL_SECONDS)
+
+            # Per-wallet volume for concentration analysis
+            wallet_vol_key = f"wallet_vol:300s:{bucket_5m}:{mint}"
+            pipe.zincrby(wallet_vol_key, update["volume"], wallet)
+            expire_once(wallet_vol_key, WALLET_VOL_TTL_SECONDS)
 
             # Track wallet first-seen (inside loop, deduplicated per batch)
             if wallet and wallet not in wallets_seen:
-                pipe.set(f"wallet:first_seen:{wallet}", now, nx=True, ex=86400 * 7)
+                pipe.set(
+                    f"wallet:first_seen:{wallet}", now, nx=True, ex=WALLET_FIRST_SEEN_TTL_SECONDS
+                )
                 wallets_seen.add(wallet)
 
+        # One cumulative count/volume update per mint
+        for mint, (buys, sells, volume) in mint_totals.items():
+            await self._consumer.redis.queue_cumulative_counters(
+                pipe, mint, buys=buys, sells=sells, volume=volume
+            )
+
+        # Mark swapped mints active (one ZADD for the batch)
+        if mint_totals:
+            pipe.zadd(ACTIVE_MINTS_KEY, dict.fromkeys(mint_totals, now))
+
         # ACK must always execute - never let counter write failures block it
         ack_commands = 0
         if ack_message_ids:
@@ -555,8 +572,11 @@ class BatchContext:
         self._consumer._pipeline_calls += 1
         self._consumer._pipeline_commands += (
             len(self._write_pipeline_commands)
-            + len(self._counter_updates) * 8
+            + len(self._counter_updates) * 2  # HLL adds, wallet volumes
+            + len(expire_keys)
             + len(wallets_seen)  # first_seen writes
+            + len(mint_totals)  # cumulative counter scripts
+            + (1 if mint_totals else 0)  # active mints
             + ack_commands
         )
 
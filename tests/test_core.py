@@ -0,0 +1,149 @@
+"""Tests for core module."""
+
+import pytest
+from unittest.mock import MagicMock
+from core.backpressure import BackpressureManager, LoadLevel
+from core.monitoring import Histogram, MetricsCollector
+from core.processor import _mcap_kernel, _price_kernel, _validated_supply
+from core.ttl_cache import TTLCache
+
+
+class TestHistogram:
+    """Tests for Histogram."""
+
+    def test_observe_bucket_boundaries(self):
+        """Test values land in the first bucket whose bound is >= value."""
+        h = Histogram(name="test", buckets=[0.1, 1.0, 10.0])
+        h.observe(0.05)
+        h.observe(0.1)
+        h.observe(0.5)
+        h.observe(10.0)
+        assert h.counts.tolist() == [2, 1, 1, 0]
+
+    def test_observe_inf_bucket(self):
+        """Test values above the largest bound go to +Inf."""
+        h = Histogram(name="test", buckets=[0.1, 1.0])
+        h.observe(5.0)
+        assert h.counts.tolist() == [0, 0, 1]
+        assert h.count == 1
+        assert h.sum == 5.0
+
+    def test_observe_many_matches_observe(self):
+        """Test batched observations match one-at-a-time observations."""
+        values = [0.05, 0.1, 0.5, 10.0, 50.0]
+        single = Histogram(name="single", buckets=[0.1, 1.0, 10.0])
+        batched = Histogram(name="batched", buckets=[0.1, 1.0, 10.0])
+        for v in values:
+            single.observe(v)
+        batched.observe_many(values)
+        assert batched.counts.tolist() == single.counts.tolist()
+        assert batched.count == single.count
+        assert batched.sum == pytest.approx(single.sum)
+
+
+class TestMetricsCollector:
+    """Tests for MetricsCollector."""
+
+    def setup_method(self):
+        self.metrics = MetricsCollector()
+
+    def test_bind_counter_shares_registry(self):
+        """Test a bound counter is the same object inc() updates."""
+        counter = self.metrics.bind_counter("tx_processed_total")
+        counter.value += 2
+        self.metrics.inc("tx_processed_total")
+        assert counter.value == 3
+
+    def test_labels_order_independent(self):
+        """Test label dicts with the same items resolve to one counter."""
+        a = self.metrics.counter("swaps", {"side": "buy", "venue": "pump"})
+        b = self.metrics.counter("swaps", {"venue": "pump", "side": "buy"})
+        assert a is b
+
+    def test_summary_reads_gauges(self):
+        """Test summary picks up unlabeled gauges."""
+        self.metrics.set_stream_length(42)
+        assert self.metrics.get_summary()["stream_length"] == 42
+
+    def test_summary_sums_across_labels(self):
+        """Test summary totals counters over all label sets."""
+        self.metrics.record_swap_detected("buy", "pump")
+        self.metrics.record_swap_detected("sell", "raydium", 2)
+        assert self.metrics.get_summary()["swaps_detected"] == 3
+
+
+class TestMcapKernel:
+    """Tests for the simplified market cap arithmetic."""
+
+    def test_matches_price_times_supply(self):
+        """Test the cancelled form equals price_sol * whole-token supply."""
+        quote_amount, base_amount = 2_500_000_000, 1_000_000_000  # 2.5 SOL for 1000 tokens
+        raw_supply, decimals = 1_000_000_000_000_000, 6
+        price_sol = (quote_amount / 1e9) / base_amount * (10 ** decimals)
+        expected = price_sol * (raw_supply / (10 ** decimals))
+        assert _mcap_kernel(quote_amount, base_amount, raw_supply) == pytest.approx(expected)
+
+    def test_price_uses_decimals_table(self):
+        """Test price per whole token matches the pow-based formula."""
+        quote_amount, base_amount, decimals = 2_500_000_000, 1_000_000_000, 6
+        expected = (quote_amount / 1e9) / base_amount * (10 ** decimals)
+        assert _price_kernel(quote_amount, base_amount, decimals) == pytest.approx(expected)
+
+    def test_validated_supply_rejects_malformed(self):
+        """Test supply entries are coerced and malformed ones rejected."""
+        assert _validated_supply({"supply": "1000", "decimals": "6"}) == {"supply": 1000, "decimals": 6}
+        assert _validated_supply(None) is None
+        assert _validated_supply({"supply": 1000}) is None
+        assert _validated_supply({"supply": "abc", "decimals": 6}) is None
+        assert _validated_supply({"supply": 1000, "decimals": 300}) is None
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_expired_entries_are_misses(self):
+        """Test expired keys are dropped on read."""
+        cache = TTLCache(ttl=60)
+        cache.set("fresh", 1)
+        cache.set("stale", 2, ttl=-1)
+        assert cache.get_many(["fresh", "stale", "missing"]) == {"fresh": 1}
+        assert cache.get("stale") is None
+        assert cache.stats()["size"] == 1
+
+    def test_evicts_when_full(self):
+        """Test set evicts entries once max_size is reached."""
+        cache = TTLCache(ttl=60, max_size=4)
+        for i in range(6):
+            cache.set(str(i), i)
+        assert cache.stats()["size"] <= 4
+        assert cache.get("5") == 5
+
+
+class TestBackpressureLevel:
+    """Tests for graded backpressure levels."""
+
+    def setup_method(self):
+        self.bp = BackpressureManager(
+            MagicMock(),
+            soft_lag_seconds=2,
+            degraded_lag_seconds=5,
+            critical_lag_seconds=30,
+            degraded_stream_len=50000,
+            critical_stream_len=80000,
+        )
+
+    def test_soft_level_below_degraded(self):
+        """Test lag between soft and degraded thresholds reports SOFT."""
+        self.bp._processing_lag = 1.0
+        assert self.bp.level() == LoadLevel.OK
+        assert not self.bp.should_shed_optional()
+
+        self.bp._processing_lag = 3.0
+        assert self.bp.level() == LoadLevel.SOFT
+
+    def test_degraded_mode_always_sheds(self):
+        """Test DEGRADED/CRITICAL modes map to HARD/SHED and always shed."""
+        self.bp._processing_lag = 10.0
+        self.bp._current_mode = self.bp._calculate_mode()
+        assert self.bp.level() == LoadLevel.HARD
+        assert self.bp.should_shed_optional()
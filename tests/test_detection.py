@@ -1,9 +1,16 @@
 """Tests for detection module."""
 
+import asyncio
+import time
+from array import array
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock
-from detection.counters import CounterManager, TokenStats
-from detection.triggers import TriggerEvaluator, Trigger, TriggerCondition
+from unittest.mock import AsyncMock, MagicMock, patch
+from detection.counters import STAT_FIELDS, CounterManager, TokenStats
+from detection.triggers import (
+    MISSING_FIELD_INDEX, Trigger, TriggerCondition, TriggerEvaluator, stats_vector,
+)
+from storage.redis_client import RedisClient
 
 
 class TestTriggerEvaluator:
@@ -42,11 +49,11 @@ class TestTriggerEvaluator:
         trigger = Trigger(
             name="test_trigger",
             conditions=[
-                TriggerCondition(field="buy_count", operator=">=", value=10),
-                TriggerCondition(field="volume", operator=">", value=5),
+                TriggerCondition(field="buy_count_5m", operator=">=", value=10),
+                TriggerCondition(field="buy_volume_sol_5m", operator=">", value=5),
             ]
         )
-        stats = {"buy_count": 15, "volume": 10}
+        stats = stats_vector({"buy_count_5m": 15, "buy_volume_sol_5m": 10})
 
         result = self.evaluator._evaluate_trigger(trigger, stats)
         assert result is True
@@ -56,15 +63,109 @@ class TestTriggerEvaluator:
         trigger = Trigger(
             name="test_trigger",
             conditions=[
-                TriggerCondition(field="buy_count", operator=">=", value=10),
-                TriggerCondition(field="volume", operator=">", value=5),
+                TriggerCondition(field="buy_count_5m", operator=">=", value=10),
+                TriggerCondition(field="buy_volume_sol_5m", operator=">", value=5),
             ]
         )
-        stats = {"buy_count": 15, "volume": 3}  # volume fails
+        stats = stats_vector({"buy_count_5m": 15, "buy_volume_sol_5m": 3})  # volume fails
 
         result = self.evaluator._evaluate_trigger(trigger, stats)
         assert result is False
 
+    def test_unknown_field_reads_as_zero(self):
+        """Fields outside FIELD_INDEX compare against 0, as a missing key did."""
+        trigger = Trigger(
+            name="odd_field",
+            conditions=[
+                TriggerCondition(field="not_a_stat", operator="<", value=1),
+            ]
+        )
+        assert trigger.conditions[0].idx == MISSING_FIELD_INDEX
+        assert trigger.matches(stats_vector({"not_a_stat": 5})) is True
+
+    def test_compiled_trigger_rejects_unknown_operator(self):
+        """Unknown operators fail at construction, not evaluation."""
+        with pytest.raises(ValueError):
+            Trigger(
+                name="bad",
+                conditions=[TriggerCondition(field="a", operator="!=", value=1)],
+            )
+
+    @pytest.mark.asyncio
+    async def test_evaluate_many_uses_first_matching_trigger(self):
+        """Batched evaluation keeps 5m-before-1h priority per mint."""
+        rows = ["hot", "slow", "quiet"]
+
+        async def get_stats_matrix(mints, window):
+            buys = [25, 5, 1] if window == 300 else [300, 60, 2]
+            cols = {name: array("d", [0] * 3) for name in STAT_FIELDS}
+            cols["buy_count"] = array("d", buys)
+            return rows, cols
+
+        async def get_stats(mint, window):
+            return TokenStats(mint=mint, window_seconds=window)
+
+        self.mock_counter_manager.get_stats_matrix = get_stats_matrix
+        self.mock_counter_manager.get_stats = get_stats
+        self.evaluator._set_triggers(
+            [Trigger(
+                name="fast",
+                conditions=[TriggerCondition(field="buy_count_5m", operator=">=", value=20)],
+            )],
+            [Trigger(
+                name="stealth",
+                conditions=[TriggerCondition(field="buy_count_1h", operator=">=", value=50)],
+            )],
+        )
+
+        results = await self.evaluator.evaluate_many(rows)
+
+        fired = {r.stats.mint: (r.trigger_name, r.stats.window_seconds) for r in results}
+        assert fired == {"hot": ("fast", 300), "slow": ("stealth", 3600)}
+
+    def test_gate_skips_triggers_quiet_mints_cannot_fire(self):
+        """Only triggers whose count gate passes are candidates."""
+        busy = Trigger(
+            name="busy",
+            conditions=[
+                TriggerCondition(field="avg_buy_size_5m", operator="<=", value=1),
+                TriggerCondition(field="buy_count_5m", operator=">=", value=20),
+            ]
+        )
+        anything = Trigger(
+            name="anything",
+            conditions=[TriggerCondition(field="avg_buy_size_5m", operator="<=", value=1)],
+        )
+        assert busy.gate.field == "buy_count_5m"
+        assert anything.gate is None
+
+        self.evaluator._set_triggers([busy], [])
+        assert self.evaluator._candidate_triggers(stats_vector({"buy_count_5m": 3})) == []
+        assert self.evaluator._candidate_triggers(stats_vector({"buy_count_5m": 20})) == [0]
+
+        self.evaluator._set_triggers([busy, anything], [])
+        assert self.evaluator._candidate_triggers(stats_vector({})) == [1]
+
+    @pytest.mark.asyncio
+    async def test_reload_skips_unchanged_config(self):
+        """Reloading identical config text keeps the installed triggers."""
+        raw = b"triggers:\n  - name: fast\n    conditions:\n      - buy_count_5m >= 20\n"
+        redis = MagicMock()
+        redis.get_config = AsyncMock(return_value=raw)
+        evaluator = TriggerEvaluator(self.mock_counter_manager, redis_client=redis)
+
+        await evaluator.reload_config()
+        installed = evaluator._triggers_5m
+        assert [t.name for t in installed] == ["fast"]
+
+        await evaluator.reload_config()
+        assert evaluator._triggers_5m is installed
+
+        redis.get_config.return_value = raw.replace(b"20", b"25")
+        await evaluator.reload_config()
+        assert evaluator._triggers_5m is not installed
+        assert evaluator._triggers_5m[0].conditions[0].value == 25
+
     def test_format_reason(self):
         """Test reason formatting."""
         trigger = Trigger(
@@ -73,7 +174,7 @@ class TestTriggerEvaluator:
                 TriggerCondition(field="buy_count_5m", operator=">=", value=20),
             ]
         )
-        stats = {"buy_count_5m": 25}
+        stats = stats_vector({"buy_count_5m": 25})
 
         reason = self.evaluator._format_reason(trigger, stats)
 
@@ -113,3 +214,149 @@ class TestTokenStats:
         assert stats.buy_count == 50
         assert stats.buy_sell_ratio == 5.0
         assert stats.top_3_volume_share == 0.65
+
+
+class TestRollingStatsParsing:
+    """Tests for parsing pipelined rolling-stats replies."""
+
+    def test_parse_rolling_stats(self):
+        """Window totals are running totals minus the oldest snapshot in the window."""
+        # 2 buckets: first had no swaps, second's snapshot is 1 buy / 1 sell / 0.5
+        cum = [b"4", b"2", b"3.5", None, b"1:1:0.5"]
+        stats = RedisClient._parse_rolling_stats(cum, 4, 1)
+
+        assert stats["buy_count"] == 3
+        assert stats["sell_count"] == 1
+        assert stats["volume_sol"] == 3.0
+        assert stats["unique_buyers"] == 4
+        assert stats["unique_sellers"] == 1
+        assert stats["buy_sell_ratio"] == 3.0
+
+    def test_parse_rolling_stats_empty_window(self):
+        """No snapshot in the window means no swaps, whatever the totals."""
+        stats = RedisClient._parse_rolling_stats([b"4", b"2", b"3.5", None], 0, 0)
+
+        assert stats["buy_count"] == 0
+        assert stats["volume_sol"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_closed_hll_buckets_counted_once(self):
+        """Closed buckets' PFCOUNTs are cached; only the open bucket is re-read."""
+        class Pipe:
+            def __init__(self):
+                self.pfcounts = 0
+
+            def hmget(self, key, fields):
+                self.fields = len(fields)
+
+            def pfcount(self, key):
+                self.pfcounts += 1
+
+            async def execute(self):
+                return [[None] * self.fields] + [3] * self.pfcounts
+
+        client = RedisClient("redis://unused")
+        pipes = []
+        client.pipeline = lambda: pipes.append(Pipe()) or pipes[-1]
+
+        # Mid-bucket, so the previous buckets are past the close grace period
+        with patch("storage.redis_client.time.time", return_value=300 * 5_000_000 + 150):
+            first = await client.get_rolling_stats("mint", 3600)
+            second = await client.get_rolling_stats("mint", 3600)
+
+        assert first["unique_buyers"] == second["unique_buyers"] == 3
+        assert pipes[0].pfcounts > 2
+        assert pipes[1].pfcounts == 2  # current bucket, buyers and sellers
+
+    @pytest.mark.asyncio
+    async def test_many_mints_read_in_one_round_trip(self):
+        """Each mint's counters are one HMGET, all in a single pipeline."""
+        class Pipe:
+            def __init__(self):
+                self.replies = []
+                self.executed = 0
+
+            def hmget(self, key, fields):
+                buys = key.split(":")[1].encode()
+                self.replies.append([buys, b"0", b"0"] + [b"0:0:0"] * (len(fields) - 3))
+
+            def pfcount(self, key):
+                self.replies.append(1)
+
+            async def execute(self):
+                self.executed += 1
+                return self.replies
+
+        client = RedisClient("redis://unused")
+        pipes = []
+        client.pipeline = lambda: pipes.append(Pipe()) or pipes[-1]
+
+        stats = await client.pipeline_get_stats(["3", "5", "8"], 300)
+
+        assert len(pipes) == 1 and pipes[0].executed == 1
+        assert {mint: s["buy_count"] for mint, s in stats.items()} == {"3": 3, "5": 5, "8": 8}
+
+
+class TestCounterStatsCache:
+    """Tests for CounterManager's bounded stats cache."""
+
+    def setup_method(self):
+        self.counters = CounterManager(MagicMock(), cache_size=2)
+
+    def _put(self, mint, window=300):
+        self.counters._cache_put(mint, window, TokenStats(mint=mint, window_seconds=window))
+
+    def test_evicts_least_recently_used(self):
+        """The oldest untouched entry goes first once cache_size is exceeded."""
+        self._put("a")
+        self._put("b")
+        now = time.monotonic_ns()
+        assert self.counters._cache_get("a", 300, now) is not None  # touch a
+        self._put("c")
+
+        assert self.counters._cache_get("b", 300, now) is None
+        assert self.counters._cache_get("a", 300, now) is not None
+        assert self.counters.get_manager_stats()["cache_size"] == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_fetch(self):
+        """Concurrent get_stats calls for one (mint, window) fetch once."""
+        fetches = []
+
+        async def get_rolling_stats(mint, window):
+            fetches.append((mint, window))
+            await asyncio.sleep(0)
+            return {"buy_count": 4}
+
+        redis = self.counters.redis
+        redis.get_rolling_stats = get_rolling_stats
+        redis.get_top_buyers_volume = AsyncMock(return_value=[])
+        redis.mget_wallet_first_seen = AsyncMock(return_value=[])
+
+        first, second = await asyncio.gather(
+            self.counters.get_stats("a"), self.counters.get_stats("a")
+        )
+
+        assert fetches == [("a", 300)]
+        assert first is second
+        assert self.counters.get_manager_stats()["stats_inflight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_top_buyers_read_once_per_build(self):
+        """Concentration and new-wallet figures share one top-buyers read."""
+        now = int(time.time())
+        redis = self.counters.redis
+        redis.get_top_buyers_volume = AsyncMock(
+            return_value=[("w1", 4.0), ("w2", 3.0), ("w3", 2.0), ("w4", 1.0)]
+        )
+        redis.mget_wallet_first_seen = AsyncMock(return_value=[now, None, now - 10_000, now])
+
+        stats = await self.counters._build_stats(
+            "a", 300, {"volume_sol": 10.0, "unique_buyers": 4}
+        )
+
+        redis.get_top_buyers_volume.assert_awaited_once()
+        assert stats.top_buyers_volume == [("w1", 4.0), ("w2", 3.0), ("w3", 2.0)]
+        assert stats.top_3_volume_share == 0.9
+        assert stats.new_wallet_count == 2
+        assert stats.new_wallet_pct == 0.5
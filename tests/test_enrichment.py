@@ -3,6 +3,7 @@
 import pytest
 from enrichment.clustering import UnionFind, WalletClusterer, Cluster
 from enrichment.scoring import CTOScorer, CTOScore
+from enrichment.helius import _parse_token_supply
 from detection.counters import TokenStats
 from unittest.mock import MagicMock
 
@@ -73,6 +74,19 @@ class TestWalletClusterer:
         assert cluster.total_volume_sol == 5.0
         assert cluster.total_buys == 3
 
+    def test_add_wallets_bulk_accumulates(self):
+        """Test bulk add matches repeated add_wallet calls."""
+        self.clusterer.add_wallets_bulk([
+            ("wallet_a", 5.0, 1),
+            ("wallet_a", 2.0, 0),
+            ("wallet_b", 1.0, 1),
+        ])
+
+        cluster = self.clusterer.get_cluster("wallet_a")
+        assert cluster.total_volume_sol == 7.0
+        assert cluster.total_buys == 1
+        assert "wallet_b" in self.clusterer.get_cluster("wallet_b").members
+
     def test_link_wallets(self):
         """Test linking wallets."""
         self.clusterer.add_wallet("wallet_a", volume_sol=5.0)
@@ -175,3 +189,17 @@ class TestCTOScorer:
         assert self.scorer.get_risk_level(medium_score) == "MEDIUM"
         assert self.scorer.get_risk_level(low_score) == "LOW"
         assert self.scorer.get_risk_level(minimal_score) == "MINIMAL"
+
+
+class TestTokenSupplyParsing:
+    """Tests for parsing mint accounts from getAccountInfo/getMultipleAccounts."""
+
+    def test_parses_jsonparsed_mint(self):
+        """Test supply and decimals are read from a parsed mint account."""
+        account = {"data": {"parsed": {"info": {"supply": "1000000", "decimals": 6}}}}
+        assert _parse_token_supply(account) == {"supply": 1000000, "decimals": 6}
+
+    def test_missing_account_returns_none(self):
+        """Test missing or unparsed accounts yield None."""
+        assert _parse_token_supply(None) is None
+        assert _parse_token_supply({"data": ["base64data", "base64"]}) is None
@@ -82,6 +82,20 @@ class TestDeltaBuilder:
         assert "token_a" in mints
         assert "token_b" in mints
 
+    def test_extract_all_matches_separate_passes(self):
+        """Test fused extraction agrees with the individual helpers."""
+        token_deltas = {
+            ("user", WSOL_MINT): -100,
+            ("user", "token_a"): 100,
+            ("pool", "token_a"): -100,
+        }
+
+        triples, mints, candidates = self.builder.extract_all(token_deltas, "payer")
+
+        assert triples == [(o, m, a) for (o, m), a in token_deltas.items()]
+        assert mints == self.builder.extract_mints_touched(token_deltas)
+        assert candidates == self.builder.get_candidate_users(token_deltas, "payer")
+
 
 class TestSwapInference:
     """Tests for SwapInference."""
@@ -141,6 +155,27 @@ class TestSwapInference:
 
         assert swap is None
 
+    def test_infer_from_triples_matches_dict(self):
+        """Test triple-based inference (backfill path) matches infer_swap."""
+        token_deltas = {
+            ("user", "meme_token"): 1000000,
+            ("user", WSOL_MINT): -200000000,  # WSOL spent, merged into SOL
+            ("pool", "meme_token"): -1000000,
+        }
+        sol_deltas = {"user": -300000000}
+        triples = [(o, m, amt) for (o, m), amt in token_deltas.items()]
+
+        builder = self.inference.delta_builder
+        candidates = builder.get_candidate_users_from_triples(triples, "user")
+        assert candidates == builder.get_candidate_users(token_deltas, "user")
+
+        expected = self.inference.infer_swap(token_deltas, sol_deltas, candidates)
+        swap = self.inference.infer_swap_from_triples(triples, sol_deltas, candidates)
+
+        assert swap is not None
+        assert swap == expected
+        assert swap.quote_amount == 500000000
+
     def test_confidence_reduction_multi_token(self):
         """Test confidence is reduced for multi-token swaps."""
         token_deltas = {
@@ -168,3 +203,13 @@ class TestSwapInference:
         assert self.inference.identify_venue(raydium_programs) == "raydium"
         assert self.inference.identify_venue(pump_programs) == "pump"
         assert self.inference.identify_venue(set()) == "unknown"
+
+    def test_venue_identification_multi_venue(self):
+        """Test a route touching several venues resolves deterministically."""
+        programs = {
+            "675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8",  # raydium
+            "JUP6LkbZbjS1jKKwapdHNy74zcZ3tLUZoi5QNyVTaV4",  # jupiter
+            "ComputeBudget111111111111111111111111111111",
+        }
+        assert self.inference.identify_venue(programs) == "jupiter"
+        assert self.inference.estimate_route_depth(programs) == 2